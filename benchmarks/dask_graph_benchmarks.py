@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark computing composites sharing work under different dask keys."""
+
+import numpy as np
+
+
+def _create_composites(num_composites):
+    """Create composites each computing the same normalization of shared bands under its own keys."""
+    import dask.array as da
+
+    bands = [da.random.default_rng(band_index).random((2000, 2000), chunks=500) for band_index in range(3)]
+    composites = []
+    for comp_index in range(num_composites):
+        normalized = [da.map_blocks(np.clip, band, 0.05, 0.95, name=f"clip-{comp_index}-{band_index}",
+                                    meta=np.array((), dtype=np.float64))
+                      for band_index, band in enumerate(bands)]
+        composites.append(da.stack(normalized) * (comp_index + 1))
+    return composites
+
+
+class MergeDuplicateTasks:
+    """Benchmark computing composites with and without merging duplicate tasks."""
+
+    params = [[2, 6], [False, True]]
+    param_names = ["num_composites", "merge"]
+
+    def setup(self, num_composites, merge):
+        """Create the composites."""
+        self.composites = _create_composites(num_composites)
+
+    def time_compute(self, num_composites, merge):
+        """Time computing all composites together."""
+        import dask
+
+        from satpy._dask_graph import merge_duplicate_tasks
+        composites = merge_duplicate_tasks(self.composites) if merge else self.composites
+        dask.compute(*composites)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark DataID lookups in dictionaries like the ones used by readers and Scenes."""
+
+from satpy.dataset import DataQuery, DatasetDict, get_key
+from satpy.dataset.data_dict import DataIDDict
+from satpy.dataset.dataid import DataID, default_id_keys_config
+
+
+def _create_dataids(num_channels):
+    """Create DataIDs for channels with several resolutions and calibrations each."""
+    dataids = []
+    for channel in range(num_channels):
+        central = 0.4 + channel * 0.1
+        for resolution in (500, 1000, 2000):
+            for calibration in ("reflectance", "brightness_temperature", "radiance", "counts"):
+                dataids.append(DataID(default_id_keys_config, name=f"C{channel:03d}",
+                                      wavelength=(central - 0.04, central, central + 0.04),
+                                      resolution=resolution, calibration=calibration))
+    return dataids
+
+
+class DataIDLookups:
+    """Benchmark getting the best DataID for queries by name, wavelength and resolution."""
+
+    params = [100, 1000]
+    param_names = ["num_channels"]
+
+    def setup(self, num_channels):
+        """Create the dictionaries and queries."""
+        dataids = _create_dataids(num_channels)
+        self.plain_dict = dict.fromkeys(dataids)
+        self.dataid_dict = DataIDDict.fromkeys(dataids)
+        self.dataset_dict = DatasetDict.fromkeys(dataids)
+        self.names = [f"C{channel:03d}" for channel in range(0, num_channels, max(1, num_channels // 20))]
+        self.wavelengths = [0.4 + channel * 0.1 for channel in range(0, num_channels, max(1, num_channels // 20))]
+        self.query = DataQuery(resolution=1000, calibration="radiance")
+        # build the indexes outside of the timed functions
+        get_key(self.names[0], self.dataid_dict)
+        get_key(self.names[0], self.dataset_dict)
+
+    def time_get_key_by_name_unindexed(self, num_channels):
+        """Time the lookups by name in a plain dictionary."""
+        for name in self.names:
+            get_key(name, self.plain_dict.keys(), query=self.query)
+
+    def time_get_key_by_name(self, num_channels):
+        """Time the lookups by name in an indexed dictionary."""
+        for name in self.names:
+            get_key(name, self.dataid_dict, query=self.query)
+
+    def time_get_key_by_wavelength_unindexed(self, num_channels):
+        """Time the lookups by wavelength in a plain dictionary."""
+        for wavelength in self.wavelengths:
+            get_key(wavelength, self.plain_dict.keys(), query=self.query)
+
+    def time_get_key_by_wavelength(self, num_channels):
+        """Time the lookups by wavelength in an indexed dictionary."""
+        for wavelength in self.wavelengths:
+            get_key(wavelength, self.dataid_dict, query=self.query)
+
+    def time_dataset_dict_getitem(self, num_channels):
+        """Time the item access by name in a DatasetDict."""
+        for name in self.names:
+            self.dataset_dict[name]
+
+    def time_build_index(self, num_channels):
+        """Time building the indexes from scratch."""
+        DataIDDict(self.plain_dict).filter_keys(self.query)
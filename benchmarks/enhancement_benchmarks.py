@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark colorizing and palettizing full disk categorical products."""
+
+import numpy as np
+
+
+class ColormapCategorical:
+    """Benchmark applying colormaps to full disk 8 bit categorical data with and without lookup tables."""
+
+    params = [["colorize", "palettize"], [False, True]]
+    param_names = ["method", "lut"]
+
+    def setup(self, method, lut):
+        """Create the data and colormap of a full disk cloud type like product."""
+        import dask.array as da
+        from trollimage.colormap import Colormap
+
+        self.data = da.random.default_rng(0).integers(0, 21, (1, 3712, 3712), chunks=(1, 1024, 1024))
+        self.data = self.data.astype(np.uint8).persist()
+        self.cmap = Colormap(values=np.arange(21), colors=np.random.default_rng(0).random((21, 3)))
+
+    def time_compute(self, method, lut):
+        """Time applying the colormap and computing the result."""
+        import xarray as xr
+        from trollimage.xrimage import XRImage
+
+        from satpy import enhancements
+
+        img = XRImage(xr.DataArray(self.data, dims=("bands", "y", "x"), coords={"bands": ["L"]},
+                                   attrs={"_FillValue": 255}))
+        if lut:
+            getattr(enhancements, method)(img, palettes=self.cmap)
+        else:
+            getattr(img, method)(self.cmap)
+        img.data.data.compute()
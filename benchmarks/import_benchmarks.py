@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the import time of satpy.
+
+The ``timeraw_`` benchmarks are run by asv in a new Python process so that
+the import is not cached. The ``track_`` benchmarks count the heavy
+dependencies imported, which should stay at zero for the lightweight entry
+points.
+"""
+
+import subprocess  # nosec B404
+import sys
+
+HEAVY_MODULES = ("dask.array", "xarray", "pyresample", "pyproj", "trollimage")
+
+
+def _count_heavy_imports(code):
+    check = (f"{code}\n"
+             "import sys\n"
+             f"print(sum(mod in sys.modules for mod in {HEAVY_MODULES!r}))")
+    output = subprocess.check_output([sys.executable, "-c", check])  # nosec B603
+    return int(output.decode().split()[-1])
+
+
+class ImportSatpy:
+    """Benchmark importing satpy and its lightweight entry points."""
+
+    timeout = 120
+
+    def timeraw_import_satpy(self):
+        """Time importing the top level package."""
+        return "import satpy"
+
+    def timeraw_import_readers(self):
+        """Time importing the reader discovery functions."""
+        return "from satpy.readers import find_files_and_readers"
+
+    def timeraw_import_writers(self):
+        """Time importing the writer discovery functions."""
+        return "from satpy.writers import available_writers"
+
+    def timeraw_import_scene(self):
+        """Time importing the Scene, which needs all heavy dependencies."""
+        return "from satpy import Scene"
+
+    def track_heavy_imports_satpy(self):
+        """Count the heavy dependencies imported by ``import satpy``."""
+        return _count_heavy_imports("import satpy")
+
+    def track_heavy_imports_readers(self):
+        """Count the heavy dependencies imported with the reader discovery functions."""
+        return _count_heavy_imports("from satpy.readers import find_files_and_readers")
+
+    def track_heavy_imports_writers(self):
+        """Count the heavy dependencies imported with the writer discovery functions."""
+        return _count_heavy_imports("from satpy.writers import available_writers")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark combining the metadata of many datasets, as done when creating composites."""
+
+import datetime as dt
+
+import numpy as np
+
+
+def _create_band_attrs(band_index, area, shared_arrays):
+    """Create attributes like the ones of a band read by a geostationary reader."""
+    from satpy.tests.utils import make_dataid
+    return {
+        "_satpy_id": make_dataid(name=f"B{band_index:02d}", resolution=2000, calibration="radiance"),
+        "name": f"B{band_index:02d}",
+        "area": area,
+        "start_time": dt.datetime(2024, 1, 1, 12, 0) + dt.timedelta(seconds=band_index),
+        "end_time": dt.datetime(2024, 1, 1, 12, 10) + dt.timedelta(seconds=band_index),
+        "platform_name": "Himawari-9",
+        "sensor": "ahi",
+        "units": "K",
+        "orbital_parameters": {
+            "projection_longitude": 140.7,
+            "projection_latitude": 0.0,
+            "projection_altitude": 35785863.0,
+            "satellite_nominal_longitude": 140.7,
+        },
+        "raw_metadata": {
+            "calibration_coefficients": shared_arrays["coefs"] if shared_arrays else np.linspace(0, 1, 1000),
+            "line_times": shared_arrays["lines"] if shared_arrays else np.arange(5500, dtype=np.float64),
+        },
+    }
+
+
+class CombineMetadata:
+    """Benchmark combine_metadata for composites made of many bands."""
+
+    params = [[3, 16], ["identical", "equal"]]
+    param_names = ["num_bands", "inputs"]
+
+    def setup(self, num_bands, inputs):
+        """Create the attributes of the bands.
+
+        With ``identical`` inputs, all bands share the same area and array
+        objects. With ``equal`` inputs, all of them are distinct but equal.
+        """
+        from pyresample.geometry import AreaDefinition
+
+        def _create_area():
+            return AreaDefinition("fd", "Full disk", "geos", "+proj=geos +lon_0=140.7 +h=35785863 +units=m",
+                                  5500, 5500, (-5500000, -5500000, 5500000, 5500000))
+
+        area = _create_area()
+        shared_arrays = {"coefs": np.linspace(0, 1, 1000), "lines": np.arange(5500, dtype=np.float64)}
+        self.attrs = []
+        for band_index in range(num_bands):
+            if inputs == "identical":
+                self.attrs.append(_create_band_attrs(band_index, area, shared_arrays))
+            else:
+                self.attrs.append(_create_band_attrs(band_index, _create_area(), None))
+
+    def time_combine_metadata(self, num_bands, inputs):
+        """Time combining the metadata of all bands."""
+        from satpy.dataset.metadata import combine_metadata
+        combine_metadata(*self.attrs)
+
+    def time_combine_metadata_restricted_arrays(self, num_bands, inputs):
+        """Time combining the metadata when only arrays of some keys are compared by content."""
+        import satpy
+        from satpy.dataset.metadata import combine_metadata
+        with satpy.config.set(metadata_compare_array_keys=["orbital_parameters"]):
+            combine_metadata(*self.attrs)
+
+    def time_combine_metadata_uncached(self, num_bands, inputs):
+        """Time combining the metadata without the cached comparison results of earlier runs."""
+        from satpy.dataset.metadata import _COMPARISON_CACHE, combine_metadata
+        _COMPARISON_CACHE.clear()
+        combine_metadata(*self.attrs)
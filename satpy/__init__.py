@@ -25,14 +25,38 @@ except ModuleNotFoundError:
         "you didn't install 'satpy' properly. Try reinstalling ('pip "
         "install').")
 
+from importlib import import_module
+
 from satpy._config import config  # noqa
-from satpy.dataset import DataID, DataQuery  # noqa
-from satpy.dataset.data_dict import DatasetDict  # noqa
-from satpy.multiscene import MultiScene  # noqa
-from satpy.readers import available_readers  # noqa
-from satpy.readers import find_files_and_readers  # noqa
-from satpy.scene import Scene  # noqa
 from satpy.utils import get_logger  # noqa
-from satpy.writers import available_writers  # noqa
+
+# Public objects are imported from their modules on first access (PEP 562)
+# so that ``import satpy`` does not import dask, xarray or pyresample
+_LAZY_ATTRIBUTES = {
+    "DataID": "satpy.dataset",
+    "DataQuery": "satpy.dataset",
+    "DatasetDict": "satpy.dataset.data_dict",
+    "MultiScene": "satpy.multiscene",
+    "available_readers": "satpy.readers",
+    "find_files_and_readers": "satpy.readers",
+    "Scene": "satpy.scene",
+    "available_writers": "satpy.writers",
+}
+
+__all__ = ["config", "get_logger", *_LAZY_ATTRIBUTES]
 
 log = get_logger("satpy")
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -44,16 +44,23 @@ _satpy_dirs = AppDirs(appname="satpy", appauthor="pytroll")
 _CONFIG_DEFAULTS = {
     "tmp_dir": tempfile.gettempdir(),
     "cache_dir": _satpy_dirs.user_cache_dir,
+    "cache_configs": False,
     "cache_lonlats": False,
     "cache_sensor_angles": False,
     "config_path": [],
     "data_dir": _satpy_dirs.user_data_dir,
     "demo_data_dir": ".",
     "download_aux": True,
+    "fuse_enhancements": False,
+    "merge_duplicate_tasks": False,
+    "metadata_compare_array_keys": None,
     "sensor_angles_position_preference": "actual",
     "readers": {
         "clip_negative_radiances": False,
     },
+    "writers": {
+        "io_concurrency": None,
+    },
 }
 
 # Satpy main configuration object
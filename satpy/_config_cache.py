@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Persistent cache of parsed YAML configuration files.
+
+Parsing the YAML configuration files of all readers or of large composite
+files like ``visir.yaml`` takes a significant part of the start up time of
+short-lived processes. When the ``cache_configs`` option of the Satpy
+configuration is ``True``, the parsed content of these files is stored as
+pickles in an index under ``cache_dir``. An entry is reused only if the Satpy
+version and the modification time and size of every YAML file it was created
+from are unchanged, so edits to builtin, plugin (entry point) or
+``config_path`` configuration files are picked up automatically.
+
+"""
+from __future__ import annotations
+
+import logging
+import os
+import pickle  # nosec B403
+import tempfile
+from contextlib import contextmanager
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+_INDEX_FORMAT = 1
+
+
+class CompiledConfigCache:
+    """Index of parsed configurations stored in a single pickle file.
+
+    Entries are keyed by the tuple of YAML files they were created from and
+    an additional ``kind`` string describing how they were parsed (for
+    example the YAML loader used). Values are stored pickled so that every
+    call to :meth:`get` returns a new object that can be modified freely.
+
+    """
+
+    def __init__(self, name):
+        """Initialize the cache to be stored in ``<cache_dir>/config_index/<name>.pkl``."""
+        self.name = name
+        self._entries = None
+        self._index_path = None
+        self._dirty = False
+        self._defer_writes = 0
+
+    @property
+    def enabled(self):
+        """Check if the cache is enabled in the Satpy configuration."""
+        return bool(satpy.config.get("cache_configs", False))
+
+    def get(self, config_files, kind, compile_func):
+        """Get the compiled configuration for ``config_files``.
+
+        Args:
+            config_files: Sequence of YAML paths the configuration is made of.
+            kind: String identifying the way the files are compiled.
+            compile_func: Function without arguments returning the compiled
+                configuration, called if no valid entry is cached.
+
+        """
+        if not self.enabled:
+            return compile_func()
+        key = (kind, tuple(os.path.abspath(config_file) for config_file in config_files))
+        stamps = _get_file_stamps(key[1])
+        entries = self._get_entries()
+        cached = entries.get(key)
+        if cached is not None and cached[0] == stamps:
+            return pickle.loads(cached[1])  # nosec B301
+        result = compile_func()
+        try:
+            entries[key] = (stamps, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            LOG.debug("Could not cache configuration from %s", config_files, exc_info=True)
+            return result
+        self._dirty = True
+        if not self._defer_writes:
+            self.flush()
+        return result
+
+    @contextmanager
+    def deferred_writes(self):
+        """Write the index to disk once when leaving the context instead of after every new entry."""
+        self._defer_writes += 1
+        try:
+            yield self
+        finally:
+            self._defer_writes -= 1
+            if not self._defer_writes:
+                self.flush()
+
+    def flush(self):
+        """Write the index to disk if it has new entries."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        index_path = self._get_index_path()
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(index_path), delete=False) as tmp_file:
+                pickle.dump(self._index_header() + (self._entries,), tmp_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file.name, index_path)
+        except OSError:
+            LOG.debug("Could not write configuration index to %s", index_path, exc_info=True)
+
+    def clear(self):
+        """Remove all entries from memory and from disk."""
+        self._entries = {}
+        self._dirty = False
+        try:
+            os.remove(self._get_index_path())
+        except OSError:
+            pass
+
+    def _get_index_path(self):
+        return os.path.join(satpy.config.get("cache_dir"), "config_index", self.name + ".pkl")
+
+    def _get_entries(self):
+        index_path = self._get_index_path()
+        if self._entries is None or index_path != self._index_path:
+            self._index_path = index_path
+            self._entries = self._read_index(index_path)
+            self._dirty = False
+        return self._entries
+
+    def _read_index(self, index_path):
+        try:
+            with open(index_path, "rb") as index_file:
+                content = pickle.load(index_file)  # nosec B301
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return {}
+        if not isinstance(content, tuple) or content[:-1] != self._index_header():
+            LOG.debug("Ignoring outdated configuration index %s", index_path)
+            return {}
+        return content[-1]
+
+    @staticmethod
+    def _index_header():
+        return (_INDEX_FORMAT, getattr(satpy, "__version__", None))
+
+
+def _get_file_stamps(paths):
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
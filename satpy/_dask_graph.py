@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Helpers to reduce duplicated work in the dask graphs of a Scene.
+
+Two mechanisms are provided:
+
+* :func:`name_by_content` gives the output of a compositor or modifier a
+  dask name derived from the compositor, its configuration, the names and
+  attributes of its inputs and the Satpy configuration. Generating the same
+  composite twice, for example for two DataIDs differing only in a query
+  parameter, then results in the same dask keys and the work is only done
+  once when the arrays are computed together.
+* :func:`merge_duplicate_tasks` is a graph optimization pass merging tasks
+  that compute the same function on the same inputs under different keys,
+  like angles or masks computed separately by several compositors. It is
+  run by :meth:`Scene.compute <satpy.scene.Scene.compute>` and when saving
+  datasets.
+
+Both are only used by the Scene if the ``merge_duplicate_tasks`` option of
+the Satpy configuration is ``True``.
+
+"""
+from __future__ import annotations
+
+import logging
+
+import dask.array as da
+import xarray as xr
+from dask.base import tokenize
+from dask.core import flatten
+from dask.highlevelgraph import HighLevelGraph
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+# attributes of the compositors that don't affect the result
+_VOLATILE_COMPOSITOR_ATTRS = ("_satpy_id",)
+
+
+def name_by_content(data_arr, compositor, prereq_datasets, optional_datasets, **kwargs):
+    """Rename the dask array of a compositor's output after the work it describes.
+
+    The new name is a token of the type and attributes of ``compositor``, the
+    dask names (or content) and the attributes of the inputs, the keyword
+    arguments the compositor was called with and the Satpy configuration.
+    Inputs with attributes that can't be tokenized deterministically give a
+    random name, so such outputs are never merged. The renamed array only
+    adds aliases to the keys of the original array to the graph.
+
+    Args:
+        data_arr (xarray.DataArray): Output of the compositor.
+        compositor: Compositor or modifier instance that produced ``data_arr``.
+        prereq_datasets: Required inputs of the compositor.
+        optional_datasets: Optional inputs of the compositor.
+        kwargs: Keyword arguments passed to the compositor.
+
+    Returns:
+        The DataArray with a content-based name for its dask array, or
+        ``data_arr`` unchanged if it doesn't hold a dask array.
+
+    """
+    data = getattr(data_arr, "data", None)
+    if not isinstance(data, da.Array):
+        return data_arr
+    comp_attrs = {key: val for key, val in getattr(compositor, "attrs", {}).items()
+                  if key not in _VOLATILE_COMPOSITOR_ATTRS}
+    token = tokenize(
+        type(compositor).__module__,
+        type(compositor).__qualname__,
+        comp_attrs,
+        [_describe_input(ds) for ds in prereq_datasets or []],
+        [_describe_input(ds) for ds in optional_datasets or []],
+        kwargs,
+        satpy.config.config,
+    )
+    name = f"{_get_compositor_name(compositor, data_arr)}-{token}"
+    return data_arr.copy(data=_rename_dask_array(data, name))
+
+
+def _describe_input(data_arr):
+    data = getattr(data_arr, "data", data_arr)
+    data_name = data.name if isinstance(data, da.Array) else tokenize(data)
+    return data_name, tokenize(getattr(data_arr, "attrs", {}))
+
+
+def _get_compositor_name(compositor, data_arr):
+    name = getattr(compositor, "attrs", {}).get("name") or data_arr.attrs.get("name") or "composite"
+    # keep dask key names readable in the dashboard
+    return str(name).replace("-", "_")
+
+
+def _rename_dask_array(arr, name):
+    if arr.name == name:
+        return arr
+    layer = {(name,) + key[1:]: key for key in flatten(arr.__dask_keys__())}
+    graph = HighLevelGraph.from_collections(name, layer, dependencies=[arr])
+    return da.Array(graph, name, arr.chunks, meta=arr._meta)
+
+
+def merge_duplicate_tasks_enabled():
+    """Check if the ``merge_duplicate_tasks`` option of the Satpy configuration is enabled."""
+    return bool(satpy.config.get("merge_duplicate_tasks", False))
+
+
+def merge_duplicate_tasks(data_arrays):
+    """Merge the tasks computing the same thing in the graphs of ``data_arrays``.
+
+    The graphs of all the dask arrays are merged and traversed from their
+    roots. A task whose function and arguments (with its dependencies
+    replaced by their already merged equivalents) tokenize to the same value
+    as a previous task is dropped and its dependents use the previous task
+    instead. Tasks whose arguments can't be tokenized deterministically get
+    a random token and are never merged.
+
+    Args:
+        data_arrays: Sequence of DataArrays or dask arrays.
+
+    Returns:
+        List of the same objects as ``data_arrays``, with the dask arrays
+        rebuilt on the deduplicated graph. Inputs without dask arrays are
+        returned unchanged.
+
+    """
+    data_arrays = list(data_arrays)
+    dask_arrays = {idx: _get_dask_array(data_arr) for idx, data_arr in enumerate(data_arrays)}
+    dask_arrays = {idx: arr for idx, arr in dask_arrays.items() if arr is not None}
+    if not dask_arrays:
+        return data_arrays
+    try:
+        from dask import _task_spec
+    except ImportError:
+        LOG.debug("Merging duplicate tasks needs a more recent version of dask.")
+        return data_arrays
+
+    graph = {}
+    for arr in dask_arrays.values():
+        graph.update(arr.__dask_graph__())
+    graph = _task_spec.convert_legacy_graph(graph)
+    output_keys = set()
+    for arr in dask_arrays.values():
+        output_keys.update(flatten(arr.__dask_keys__()))
+
+    new_graph, merged = _merge_graph_duplicates(graph, output_keys, _task_spec)
+    LOG.debug("Merged %d duplicate tasks out of %d", merged, len(graph))
+    if not merged:
+        return data_arrays
+    for idx, arr in dask_arrays.items():
+        new_arr = _rebuild_dask_array(arr, new_graph, _task_spec)
+        data_arr = data_arrays[idx]
+        data_arrays[idx] = data_arr.copy(data=new_arr) if isinstance(data_arr, xr.DataArray) else new_arr
+    return data_arrays
+
+
+def _get_dask_array(data_arr):
+    data = getattr(data_arr, "data", data_arr)
+    if isinstance(data, da.Array):
+        return data
+    return None
+
+
+def _merge_graph_duplicates(graph, output_keys, task_spec):
+    canonical_keys = {}
+    keys_by_token = {}
+    new_graph = {}
+    merged = 0
+    for key in _toposort(graph):
+        node = graph[key]
+        subs = {dep: canonical_keys[dep] for dep in node.dependencies
+                if canonical_keys.get(dep, dep) != dep}
+        if subs:
+            node = node.substitute(subs)
+        token = tokenize(node)
+        existing_key = keys_by_token.setdefault(token, key)
+        if existing_key == key:
+            new_graph[key] = node
+            continue
+        canonical_keys[key] = existing_key
+        merged += 1
+        if key in output_keys:
+            new_graph[key] = task_spec.Alias(key, existing_key)
+    return new_graph, merged
+
+
+def _toposort(graph):
+    """Order the keys of ``graph`` so that dependencies come first."""
+    order = []
+    done = set()
+    for root in graph:
+        if root in done:
+            continue
+        stack = [(root, False)]
+        while stack:
+            key, deps_done = stack.pop()
+            if key in done:
+                continue
+            if deps_done:
+                done.add(key)
+                order.append(key)
+                continue
+            stack.append((key, True))
+            stack.extend((dep, False) for dep in graph[key].dependencies
+                         if dep not in done and dep in graph)
+    return order
+
+
+def _rebuild_dask_array(arr, graph, task_spec):
+    keys = list(flatten(arr.__dask_keys__()))
+    culled = task_spec.cull(graph, keys)
+    return da.Array(culled, arr.name, arr.chunks, meta=arr._meta)
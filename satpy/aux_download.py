@@ -197,10 +197,16 @@ def _find_registerable_files_compositors(sensors=None):
     if sensors is None:
         sensors = all_composite_sensors()
     if sensors:
-        mods = load_compositor_configs_for_sensors(sensors)[1]
+        comps, mods = load_compositor_configs_for_sensors(sensors)
+        _register_compositor_files(comps)
         _register_modifier_files(mods)
 
 
+def _register_compositor_files(compositors):
+    for comp_sensor_dict in compositors.values():
+        comp_sensor_dict.load_all()
+
+
 def _register_modifier_files(modifiers):
     for mod_sensor_dict in modifiers.values():
         for mod_name, (mod_cls, mod_props) in mod_sensor_dict.items():
@@ -1343,21 +1343,37 @@ class RatioSharpenedRGB(GenericCompositor):
         return bands["red"], bands["green"], bands["blue"], new_attrs
 
     def _sharpen_bands_with_high_res(self, bands, high_res):
-        ratio = da.map_blocks(
-            _get_sharpening_ratio,
+        """Sharpen the bands in one blockwise operation.
+
+        The ratio and the sharpened bands are computed chunk by chunk in a
+        single task, so no full resolution intermediate arrays are kept.
+        """
+        colors = list(bands.keys())
+        high_index = colors.index(self.high_resolution_color)
+        sharpen = tuple(color not in (self.neutral_resolution_color, self.high_resolution_color)
+                        for color in colors)
+        band_data = [bands[color].data.rechunk(high_res.chunks) for color in colors]
+        dtype = np.result_type(high_res.dtype, *(band.dtype for band in band_data))
+        sharpened = da.map_blocks(
+            _ratio_sharpen_block,
             high_res.data,
-            bands[self.high_resolution_color].data,
-            meta=np.array((), dtype=high_res.dtype),
-            dtype=high_res.dtype,
-            chunks=high_res.chunks,
+            *band_data,
+            new_axis=0,
+            chunks=((3,),) + high_res.chunks,
+            meta=np.array((), dtype=dtype),
+            dtype=dtype,
+            high_index=high_index,
+            sharpen=sharpen,
+            mean4_offset=self._get_mean4_offset(high_res),
         )
+        for idx, color in enumerate(colors):
+            source = high_res if idx == high_index else bands[color]
+            bands[color] = source.copy(data=sharpened[idx])
 
-        bands[self.high_resolution_color] = high_res
-
-        with xr.set_options(keep_attrs=True):
-            for color in bands.keys():
-                if color != self.neutral_resolution_color and color != self.high_resolution_color:
-                    bands[color] = bands[color] * ratio
+    @staticmethod
+    def _get_mean4_offset(high_res):
+        """Get the offset for averaging the high resolution band, None to use the low resolution band."""
+        return None
 
     def _combined_sharpened_info(self, info, new_attrs):
         combined_info = {}
@@ -1381,6 +1397,25 @@ def _get_sharpening_ratio(high_res, low_res):
     return ratio
 
 
+def _ratio_sharpen_block(high_res, red, green, blue, high_index=0, sharpen=(False, True, True),
+                         mean4_offset=None, block_id=None):
+    bands = (red, green, blue)
+    if mean4_offset is None:
+        low_res = bands[high_index]
+    else:
+        low_res = _mean4(high_res, offset=mean4_offset, block_id=block_id[1:])
+    ratio = _get_sharpening_ratio(high_res, low_res)
+    res = np.empty((3,) + high_res.shape, dtype=np.result_type(high_res, *bands))
+    for idx, band in enumerate(bands):
+        if idx == high_index:
+            res[idx] = high_res
+        elif sharpen[idx]:
+            res[idx] = band * ratio
+        else:
+            res[idx] = band
+    return res
+
+
 def _mean4(data, offset=(0, 0), block_id=None):
     rows, cols = data.shape
     # we assume that the chunks except the first ones are aligned
@@ -1435,19 +1470,26 @@ class SelfSharpenedRGB(RatioSharpenedRGB):
         res = d.data.map_blocks(_mean4, offset=offset, dtype=d.dtype)
         return xr.DataArray(res, attrs=d.attrs, dims=d.dims, coords=d.coords)
 
+    @staticmethod
+    def _get_mean4_offset(high_res):
+        try:
+            return high_res.attrs["area"].crop_offset
+        except (KeyError, AttributeError):
+            return (0, 0)
+
     def __call__(self, datasets, optional_datasets=None, **attrs):
-        """Generate the composite."""
+        """Generate the composite.
+
+        The four element average of the high resolution band is computed
+        together with the sharpening, chunk by chunk.
+        """
         colors = ["red", "green", "blue"]
         if self.high_resolution_color not in colors:
             raise ValueError("SelfSharpenedRGB requires at least one high resolution band, not "
                              "'{}'".format(self.high_resolution_color))
 
         high_res = datasets[colors.index(self.high_resolution_color)]
-        high_mean = self.four_element_average_dask(high_res)
-        red = high_mean if self.high_resolution_color == "red" else datasets[0]
-        green = high_mean if self.high_resolution_color == "green" else datasets[1]
-        blue = high_mean if self.high_resolution_color == "blue" else datasets[2]
-        return super(SelfSharpenedRGB, self).__call__((red, green, blue), optional_datasets=(high_res,), **attrs)
+        return super(SelfSharpenedRGB, self).__call__(tuple(datasets), optional_datasets=(high_res,), **attrs)
 
 
 class LuminanceSharpeningCompositor(GenericCompositor):
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import os
 import warnings
+from collections.abc import MutableMapping
 from functools import lru_cache, update_wrapper
 from typing import Callable, Iterable
 
@@ -30,11 +31,102 @@ from yaml import UnsafeLoader
 import satpy
 from satpy import DataID, DataQuery
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._config_cache import CompiledConfigCache, _get_file_stamps
 from satpy.dataset.dataid import minimal_default_keys_config
 from satpy.utils import recursive_dict_update
 
 logger = logging.getLogger(__name__)
 
+COMPOSITE_CONFIG_CACHE = CompiledConfigCache("composites")
+
+
+class LazyCompositor:
+    """Placeholder for a compositor that is only created when first requested.
+
+    Creating the compositor objects of all composites configured for a sensor
+    is a significant part of the time needed to create a ``Scene``, while
+    usually only a few of them are used.
+
+    """
+
+    __slots__ = ("loader", "key", "options", "_compositor")
+
+    def __init__(self, loader, key, options):
+        """Store the compositor class, its DataID and options."""
+        self.loader = loader
+        self.key = key
+        self.options = options
+        self._compositor = None
+
+    def get_compositor(self):
+        """Get the compositor object, creating it on first use."""
+        if self._compositor is None:
+            self._compositor = self.loader(_satpy_id=self.key, **self.options)
+        return self._compositor
+
+    def __repr__(self):
+        """Represent the placeholder."""
+        return "<LazyCompositor: {} {}>".format(self.loader.__name__, self.key["name"])
+
+
+def resolve_compositor(comp):
+    """Get the compositor object for ``comp`` which may be a :class:`LazyCompositor`."""
+    if isinstance(comp, LazyCompositor):
+        return comp.get_compositor()
+    return comp
+
+
+class _CompositorDict(MutableMapping):
+    """Mapping of compositors creating each compositor when it is accessed.
+
+    Use :meth:`lazy_items` to get the placeholders without creating the
+    compositors and :meth:`load_all` to create all compositors.
+
+    """
+
+    #: Identifies the configuration files and their state the compositors were loaded from
+    config_stamp = None
+
+    def __init__(self):
+        self._compositors = {}
+
+    def __getitem__(self, key):
+        return resolve_compositor(self._compositors[key])
+
+    def __setitem__(self, key, comp):
+        self._compositors[key] = comp
+
+    def __delitem__(self, key):
+        del self._compositors[key]
+
+    def __contains__(self, key):
+        return key in self._compositors
+
+    def __iter__(self):
+        return iter(self._compositors)
+
+    def __len__(self):
+        return len(self._compositors)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._compositors)
+
+    def lazy_items(self):
+        """Get the (DataID, compositor or :class:`LazyCompositor`) pairs without creating any compositor."""
+        return self._compositors.items()
+
+    def load_all(self):
+        """Create all compositors that haven't been created yet."""
+        for comp in self._compositors.values():
+            resolve_compositor(comp)
+
+
+class _ModifierDict(dict):
+    """Dictionary of modifier configurations."""
+
+    #: Identifies the configuration files and their state the modifiers were loaded from
+    config_stamp = None
+
 
 def _convert_dep_info_to_data_query(dep_info):
     key_item = dep_info.copy()
@@ -59,7 +151,7 @@ class _CompositeConfigHelper:
 
     def _create_comp_from_info(self, composite_info, loader):
         key = DataID(self.sensor_id_keys, **composite_info)
-        comp = loader(_satpy_id=key, **composite_info)
+        comp = LazyCompositor(loader, key, composite_info)
         return key, comp
 
     def _handle_inline_comp_dep(self, dep_info, dep_num, parent_name):
@@ -173,33 +265,41 @@ class _ModifierConfigHelper:
                                "'{}'".format(composite_configs))
 
 
-def _load_config(composite_configs):
-    if not isinstance(composite_configs, (list, tuple)):
-        composite_configs = [composite_configs]
-
+def _read_yaml_configs(composite_configs):
     conf = {}
     for composite_config in composite_configs:
         with open(composite_config, "r", encoding="utf-8") as conf_file:
             conf = recursive_dict_update(conf, yaml.load(conf_file, Loader=UnsafeLoader))
+    return conf
+
+
+def _load_config(composite_configs):
+    if not isinstance(composite_configs, (list, tuple)):
+        composite_configs = [composite_configs]
+
+    conf = COMPOSITE_CONFIG_CACHE.get(composite_configs, "UnsafeLoader",
+                                      lambda: _read_yaml_configs(composite_configs))
     try:
         sensor_name = conf["sensor_name"]
     except KeyError:
         logger.debug('No "sensor_name" tag found in %s, skipping.',
                      composite_configs)
-        return {}, {}, {}
+        return _CompositorDict(), _ModifierDict(), {}
 
-    sensor_compositors = {}
-    sensor_modifiers = {}
+    sensor_compositors = _CompositorDict()
+    sensor_modifiers = _ModifierDict()
 
     dep_id_keys = None
+    dep_stamp = None
     sensor_deps = sensor_name.split("/")[:-1]
     if sensor_deps:
         # get dependent
         for sensor_dep in sensor_deps:
             dep_comps, dep_mods, dep_id_keys = load_compositor_configs_for_sensor(sensor_dep)
         # the last parent should include all of its parents so only add the last one
-        sensor_compositors.update(dep_comps)
+        sensor_compositors.update(dep_comps.lazy_items())
         sensor_modifiers.update(dep_mods)
+        dep_stamp = getattr(dep_comps, "config_stamp", None)
 
     id_keys = _get_sensor_id_keys(conf, dep_id_keys)
     mod_config_helper = _ModifierConfigHelper(sensor_modifiers, id_keys)
@@ -209,6 +309,9 @@ def _load_config(composite_configs):
     comp_config_helper = _CompositeConfigHelper(sensor_compositors, id_keys)
     configured_composites = conf.get("composites", {})
     comp_config_helper.parse_config(configured_composites, composite_configs)
+    config_paths = tuple(os.path.abspath(config_file) for config_file in composite_configs)
+    config_stamp = (dep_stamp, config_paths, _get_file_stamps(config_paths))
+    sensor_compositors.config_stamp = sensor_modifiers.config_stamp = config_stamp
     return sensor_compositors, sensor_modifiers, id_keys
 
 
@@ -254,6 +357,11 @@ def load_compositor_configs_for_sensor(sensor_name: str) -> tuple[dict[str, dict
         sensor_name: Sensor name that has matching ``sensor_name.yaml``
             config files.
 
+    The parsed YAML configuration is taken from the persistent index of
+    compiled configurations if the ``cache_configs`` Satpy configuration
+    option is set. The compositor objects are only created when they are
+    accessed in the returned dictionary.
+
     Returns:
         (comps, mods, data_id_keys): Where `comps` is a dictionary:
 
@@ -277,7 +385,7 @@ def load_compositor_configs_for_sensor(sensor_name: str) -> tuple[dict[str, dict
     if not composite_configs:
         logger.debug("No composite config found called %s",
                      config_filename)
-        return {}, {}, minimal_default_keys_config
+        return _CompositorDict(), _ModifierDict(), minimal_default_keys_config
     return _load_config(composite_configs)
 
 
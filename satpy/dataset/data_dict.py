@@ -17,9 +17,15 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Classes and functions related to a dictionary with DataID keys."""
 
+import numbers
+from collections.abc import KeysView
+
 import numpy as np
 
-from .dataid import DataID, create_filtered_query, minimal_default_keys_config
+from .dataid import DataID, WavelengthRange, create_filtered_query, minimal_default_keys_config
+
+#: DataID keys with an exact value index in :class:`DataIDIndex`
+INDEXED_ID_KEYS = ("name", "resolution", "calibration", "modifiers", "polarization", "level")
 
 
 class TooManyResults(KeyError):
@@ -102,7 +108,7 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     """
     key = create_filtered_query(key, query)
 
-    res = key.filter_dataids(key_container)
+    res = _filter_dataids(key, key_container)
     if not res:
         raise KeyError("No dataset matching '{}' found".format(str(key)))
 
@@ -121,7 +127,240 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     return res[:num_results]
 
 
-class DatasetDict(dict):
+def _filter_dataids(query, key_container):
+    if isinstance(key_container, DataIDKeysView):
+        key_container = key_container.mapping
+    if isinstance(key_container, DataIDDict):
+        return key_container.filter_keys(query)
+    return query.filter_dataids(key_container)
+
+
+class DataIDIndex:
+    """Secondary indexes of DataIDs for fast filtering with a DataQuery.
+
+    The DataIDs are indexed by value for the keys in :data:`INDEXED_ID_KEYS`
+    and by wavelength range. :meth:`candidates` only narrows the DataIDs
+    down to a superset of the matching ones, the exact matching is still
+    done with :meth:`DataQuery.filter_dataids <satpy.dataset.dataid.DataQuery.filter_dataids>`
+    on the candidates. Keys that are not DataIDs or have unhashable values
+    are never excluded.
+
+    """
+
+    def __init__(self, keys=()):
+        """Create the index and add ``keys`` to it."""
+        self._order = {}
+        self._counter = 0
+        self._by_value = {id_key: {} for id_key in INDEXED_ID_KEYS}
+        self._unindexed = {id_key: set() for id_key in INDEXED_ID_KEYS + ("wavelength",)}
+        self._wavelengths = {}
+        self._wavelength_arrays = None
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        """Get the number of indexed keys."""
+        return len(self._order)
+
+    def add(self, key):
+        """Add ``key`` to the index."""
+        if key in self._order:
+            return
+        self._order[key] = self._counter
+        self._counter += 1
+        for id_key in INDEXED_ID_KEYS:
+            value = _get_id_value(key, id_key)
+            try:
+                self._by_value[id_key].setdefault(value, set()).add(key)
+            except TypeError:
+                self._unindexed[id_key].add(key)
+        wavelength = _get_id_value(key, "wavelength")
+        if isinstance(wavelength, WavelengthRange):
+            self._wavelengths[key] = wavelength
+            self._wavelength_arrays = None
+        else:
+            self._unindexed["wavelength"].add(key)
+
+    def discard(self, key):
+        """Remove ``key`` from the index if it is in it."""
+        if self._order.pop(key, None) is None:
+            return
+        for id_key in INDEXED_ID_KEYS:
+            value = _get_id_value(key, id_key)
+            self._unindexed[id_key].discard(key)
+            try:
+                bucket = self._by_value[id_key].get(value)
+            except TypeError:
+                continue
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._by_value[id_key][value]
+        self._unindexed["wavelength"].discard(key)
+        if self._wavelengths.pop(key, None) is not None:
+            self._wavelength_arrays = None
+
+    def candidates(self, query):
+        """Get the keys that may match ``query``, in the order they were added."""
+        candidates = None
+        for id_key, value in query.items():
+            if value == "*":
+                continue
+            if id_key == "wavelength":
+                id_key_candidates = self._wavelength_candidates(value)
+            elif id_key in self._by_value:
+                id_key_candidates = self._value_candidates(id_key, value)
+            else:
+                continue
+            if id_key_candidates is None:
+                continue
+            candidates = id_key_candidates if candidates is None else candidates & id_key_candidates
+        if candidates is None:
+            return list(self._order)
+        return sorted(candidates, key=self._order.__getitem__)
+
+    def _value_candidates(self, id_key, value):
+        """Get the keys with one of the query ``value``.
+
+        A list or tuple matches DataID values equal to the sequence itself
+        (for tuple values like modifiers) or to any of its elements.
+
+        """
+        lookup_values = [value]
+        if isinstance(value, (list, tuple)):
+            lookup_values = [tuple(value)] + list(value)
+        by_value = self._by_value[id_key]
+        candidates = set(self._unindexed[id_key])
+        try:
+            for lookup_value in lookup_values:
+                candidates.update(by_value.get(lookup_value, ()))
+        except TypeError:
+            return None
+        return candidates
+
+    def _wavelength_candidates(self, value):
+        values = value if isinstance(value, list) else [value]
+        if not all(isinstance(val, (numbers.Number, WavelengthRange)) for val in values):
+            return None
+        keys, mins, maxs = self._get_wavelength_arrays()
+        candidates = set(self._unindexed["wavelength"])
+        for val in values:
+            if isinstance(val, WavelengthRange):
+                candidates.update(key for key in keys if self._wavelengths[key] == val)
+            else:
+                matches = np.nonzero((mins <= val) & (val <= maxs))[0]
+                candidates.update(keys[idx] for idx in matches)
+        return candidates
+
+    def _get_wavelength_arrays(self):
+        if self._wavelength_arrays is None:
+            keys = list(self._wavelengths)
+            mins = np.array([self._wavelengths[key].min for key in keys], dtype=np.float64)
+            maxs = np.array([self._wavelengths[key].max for key in keys], dtype=np.float64)
+            self._wavelength_arrays = (keys, mins, maxs)
+        return self._wavelength_arrays
+
+
+def _get_id_value(key, id_key):
+    """Get the value of ``id_key`` in ``key``, or an unhashable placeholder if it can't be indexed.
+
+    DataIDs without ``id_key`` may not be checked for it at all when matching,
+    so they must not be indexed by a value.
+
+    """
+    if not isinstance(key, DataID) or id_key not in key:
+        return []
+    return key[id_key]
+
+
+class DataIDKeysView(KeysView):
+    """Keys view of a :class:`DataIDDict` that can use the DataIDDict indexes in :func:`get_key`."""
+
+    @property
+    def mapping(self):
+        """Get the viewed dictionary."""
+        return self._mapping
+
+
+class DataIDDict(dict):
+    """Dictionary with `DataID` keys maintaining secondary indexes of its keys.
+
+    The indexes (see :class:`DataIDIndex`) are built on the first query with
+    :meth:`filter_keys` and kept up to date when items are set or deleted.
+    Other modifications rebuild them on the next query.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create the dictionary."""
+        super().__init__(*args, **kwargs)
+        self._index = None
+
+    def __reduce__(self):
+        """Reduce to the contents only, the indexes are rebuilt when needed."""
+        return self.__class__, (dict(self),)
+
+    def keys(self):
+        """Get a view of the keys."""
+        return DataIDKeysView(self)
+
+    def filter_keys(self, query):
+        """Get the keys matching the DataQuery ``query``."""
+        if self._index is None or len(self._index) != len(self):
+            self._index = DataIDIndex(dict.keys(self))
+        return query.filter_dataids(self._index.candidates(query))
+
+    def __setitem__(self, key, value):
+        """Set an item and index its key."""
+        super().__setitem__(key, value)
+        if self._index is not None:
+            self._index.add(key)
+
+    def __delitem__(self, key):
+        """Delete an item and remove its key from the index."""
+        super().__delitem__(key)
+        if self._index is not None:
+            self._index.discard(key)
+
+    def _invalidate_index(self):
+        self._index = None
+
+    def update(self, *args, **kwargs):
+        """Update the dictionary."""
+        super().update(*args, **kwargs)
+        self._invalidate_index()
+
+    def __ior__(self, other):
+        """Update the dictionary in place."""
+        res = super().__ior__(other)
+        self._invalidate_index()
+        return res
+
+    def setdefault(self, key, default=None):
+        """Get the item or set it to ``default``."""
+        res = super().setdefault(key, default)
+        self._invalidate_index()
+        return res
+
+    def pop(self, *args):
+        """Remove an item and get its value."""
+        res = super().pop(*args)
+        self._invalidate_index()
+        return res
+
+    def popitem(self):
+        """Remove the last item and get it."""
+        res = super().popitem()
+        self._invalidate_index()
+        return res
+
+    def clear(self):
+        """Remove all items."""
+        super().clear()
+        self._invalidate_index()
+
+
+class DatasetDict(DataIDDict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
     Note: Internal dictionary keys are `DataID` objects.
@@ -155,7 +394,7 @@ class DatasetDict(dict):
             **dfilter (dict): See `get_key` function for more information.
 
         """
-        return get_key(match_key, self.keys(), num_results=num_results,
+        return get_key(match_key, self, num_results=num_results,
                        best=best, **dfilter)
 
     def getitem(self, item):
@@ -17,6 +17,7 @@
 
 import logging
 import numbers
+import weakref
 from collections import namedtuple
 from contextlib import suppress
 from copy import copy, deepcopy
@@ -288,23 +289,69 @@ class DataID(dict):
 
     DataID is a dict that holds identifying and classifying
     information about a DataArray.
+
+    DataIDs are immutable and interned: creating a DataID equal to an
+    existing one, with the same id keys, returns the existing instance.
     """
 
+    __slots__ = ("_hash", "_orig_id_keys", "_id_keys", "__weakref__")
+
+    _instances: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+    _fixed_id_keys: dict = {}
+
+    def __new__(cls, id_keys, **keyval_dict):
+        """Get the DataID, creating it if no equal DataID exists."""
+        orig_id_keys, fixed_id_keys = cls._get_fixed_id_keys(id_keys)
+        curated = cls._convert_dict(fixed_id_keys, keyval_dict)
+        try:
+            intern_key = (cls, id(fixed_id_keys), tuple((key, type(val), val) for key, val in curated.items()))
+            instance = cls._instances.get(intern_key)
+        except TypeError:
+            # unhashable values, don't intern
+            intern_key = instance = None
+        if instance is not None:
+            return instance
+        instance = super().__new__(cls)
+        instance._hash = None
+        instance._orig_id_keys = orig_id_keys
+        instance._id_keys = fixed_id_keys
+        dict.update(instance, curated)
+        if intern_key is not None:
+            cls._instances[intern_key] = instance
+        return instance
+
     def __init__(self, id_keys, **keyval_dict):
         """Init the DataID.
 
         The *id_keys* dictionary has to be formed as described in :doc:`../dev_guide/satpy_internals`.
         The other keyword arguments are values to be assigned to the keys. Note that
         `None` isn't a valid value and will simply be ignored.
+
+        The DataID is fully initialized in :meth:`__new__`.
         """
-        self._hash = None
-        self._orig_id_keys = id_keys
-        self._id_keys = self.fix_id_keys(id_keys or {})
-        if keyval_dict:
-            curated = self.convert_dict(keyval_dict)
-        else:
-            curated = {}
-        super(DataID, self).__init__(curated)
+
+    @classmethod
+    def _get_fixed_id_keys(cls, id_keys):
+        """Get the original and fixed id keys, shared between all DataIDs with equal id keys.
+
+        Sharing the fixed id keys avoids creating new enum classes for every
+        DataID and makes the values of equal DataIDs identical.
+        """
+        id_keys = id_keys or {}
+        try:
+            frozen = _freeze_id_keys(id_keys)
+            return cls._fixed_id_keys[frozen]
+        except TypeError:
+            return id_keys, cls.fix_id_keys(id_keys)
+        except KeyError:
+            pass
+        # the original id keys are used for pickling, keep them safe from modifications
+        orig_id_keys = deepcopy(id_keys)
+        fixed_id_keys = cls.fix_id_keys(id_keys)
+        cls._fixed_id_keys[frozen] = (orig_id_keys, fixed_id_keys)
+        # DataIDs created from the fixed id keys (see `from_dict`) use the same ones
+        cls._fixed_id_keys.setdefault(_freeze_id_keys(fixed_id_keys), (orig_id_keys, fixed_id_keys))
+        return orig_id_keys, fixed_id_keys
 
     @staticmethod
     def fix_id_keys(id_keys):
@@ -323,10 +370,14 @@ class DataID(dict):
 
     def convert_dict(self, keyvals):
         """Convert a dictionary's values to the types defined in this object's id_keys."""
+        return self._convert_dict(self._id_keys, keyvals)
+
+    @staticmethod
+    def _convert_dict(id_keys, keyvals):
         curated = {}
         if not keyvals:
             return curated
-        for key, val in self._id_keys.items():
+        for key, val in id_keys.items():
             if val is None:
                 val = {}
             if key in keyvals or val.get("default") is not None or val.get("required"):
@@ -481,6 +532,16 @@ class DataID(dict):
         return bool(self[key])
 
 
+def _freeze_id_keys(id_keys):
+    """Get a hashable version of the *id_keys* configuration, keeping the order of the keys."""
+    if isinstance(id_keys, dict):
+        return tuple((key, _freeze_id_keys(val)) for key, val in id_keys.items())
+    if isinstance(id_keys, list):
+        return (list, tuple(_freeze_id_keys(val) for val in id_keys))
+    hash(id_keys)
+    return id_keys
+
+
 def _generalize_value_for_comparison(val):
     """Get a generalize value for comparisons."""
     if isinstance(val, numbers.Number):
@@ -20,12 +20,17 @@
 
 import datetime as dt
 import warnings
+import weakref
+from collections import OrderedDict
 from collections.abc import Collection
 from functools import partial, reduce
 from operator import eq, is_
+from threading import Lock
 
 import numpy as np
 
+import satpy
+from satpy._compat import cache
 from satpy.writers.utils import flatten_dict
 
 
@@ -48,7 +53,12 @@ def combine_metadata(*metadata_objects, average_times=None):
        Before Satpy 0.47, all times, including `start_time` and `end_time`, were averaged.
 
     In the interest of processing time, lazy arrays are compared by object
-    identity rather than by their contents.
+    identity rather than by their contents. Identical values are never
+    compared, and comparison results for immutable objects like areas and
+    DataIDs are cached. The ``metadata_compare_array_keys`` option of the
+    Satpy configuration can restrict the comparison of the contents of
+    in-memory arrays to the listed top-level keys, arrays in other keys are
+    then also compared by identity.
 
     Args:
         *metadata_objects: MetadataObject or dict objects to combine
@@ -67,7 +77,7 @@ def combine_metadata(*metadata_objects, average_times=None):
         )
 
     info_dicts = _get_valid_dicts(metadata_objects)
-    if len(info_dicts) == 1:
+    if len(info_dicts) == 1 or _all_identical(info_dicts):
         return info_dicts[0].copy()
 
     shared_keys = _shared_keys(info_dicts)
@@ -96,18 +106,20 @@ def _shared_keys(info_dicts):
 
 def _combine_shared_info(shared_keys, info_dicts):
     shared_info = {}
+    array_keys = satpy.config.get("metadata_compare_array_keys", None)
     for key in shared_keys:
         values = [info[key] for info in info_dicts]
-        _combine_values(key, values, shared_info)
+        compare_arrays = array_keys is None or key in array_keys
+        _combine_values(key, values, shared_info, compare_arrays)
     return shared_info
 
 
-def _combine_values(key, values, shared_info):
+def _combine_values(key, values, shared_info, compare_arrays=True):
     if "time" in key:
         times = _combine_times(key, values)
         if times is not None:
             shared_info[key] = times
-    elif _are_values_combinable(values):
+    elif _all_identical(values) or _are_values_combinable(values, compare_arrays):
         shared_info[key] = values[0]
 
 
@@ -157,16 +169,18 @@ def average_datetimes(datetime_list):
     return dt.datetime.fromtimestamp(sum(total) / len(total))
 
 
-def _are_values_combinable(values):
+def _are_values_combinable(values, compare_arrays=True):
     """Check if the *values* can be combined."""
+    if _are_immutable(values):
+        return _pairwise_all(_cached_immutable_equal, values)
     if _contain_dicts(values):
-        return _all_dicts_equal(values)
-    return _all_non_dicts_equal(values)
+        return _all_dicts_equal(values, compare_arrays)
+    return _all_non_dicts_equal(values, compare_arrays)
 
 
-def _all_non_dicts_equal(values):
+def _all_non_dicts_equal(values, compare_arrays=True):
     if _contain_arrays(values):
-        return _all_arrays_equal(values)
+        return _all_arrays_equal(values, compare_arrays)
     if _contain_collections_of_arrays(values):
         # in the real world, the `ancillary_variables` attribute may be
         # List[xarray.DataArray], this means our values are now
@@ -174,7 +188,7 @@ def _all_non_dicts_equal(values):
         # note that this list_of_arrays check is also true for any
         # higher-dimensional ndarray, but we only use this check after we have
         # checked any_arrays so this false positive should have no impact
-        return _all_list_of_arrays_equal(values)
+        return _all_list_of_arrays_equal(values, compare_arrays)
     return _all_values_equal(values)
 
 
@@ -194,12 +208,12 @@ def _contain_dicts(values):
 nan_allclose = partial(np.allclose, equal_nan=True)
 
 
-def _all_arrays_equal(arrays):
+def _all_arrays_equal(arrays, compare_arrays=True):
     """Check if the arrays are equal.
 
-    If the arrays are lazy, just check if they have the same identity.
+    If the arrays are lazy or *compare_arrays* is False, just check if they have the same identity.
     """
-    if hasattr(arrays[0], "compute"):
+    if not compare_arrays or hasattr(arrays[0], "compute"):
         return _all_identical(arrays)
     return _all_values_equal(arrays)
 
@@ -213,15 +227,15 @@ def _all_values_equal(values):
         return _all_equal(values)
 
 
-def _all_dicts_equal(dicts):
+def _all_dicts_equal(dicts, compare_arrays=True):
     try:
-        return _pairwise_all(_dict_equal, dicts)
+        return _pairwise_all(partial(_dict_equal, compare_arrays=compare_arrays), dicts)
     except AttributeError:
         # There is something else than a dictionary in the list
         return False
 
 
-def _dict_equal(d1, d2):
+def _dict_equal(d1, d2, compare_arrays=True):
     """Check that two dictionaries are equal.
 
     Nested dictionaries are flattened to facilitate comparison.
@@ -232,7 +246,9 @@ def _dict_equal(d1, d2):
         return False
     for key in d1_flat.keys():
         value_pair = [d1_flat[key], d2_flat[key]]
-        if not _all_non_dicts_equal(value_pair):
+        if value_pair[0] is value_pair[1]:
+            continue
+        if not _all_non_dicts_equal(value_pair, compare_arrays):
             return False
     return True
 
@@ -243,6 +259,8 @@ def _dict_keys_equal(d1, d2):
 
 def _pairwise_all(func, values):
     for value in values[1:]:
+        if value is values[0]:
+            continue
         if not _is_equal(values[0], value, func):
             return False
     return True
@@ -257,7 +275,7 @@ def _is_equal(a, b, comp_func):
 
 def _all_identical(values):
     """Check that the identities of all values are the same."""
-    return _pairwise_all(is_, values)
+    return all(is_(value, values[0]) for value in values[1:])
 
 
 def _all_close(values):
@@ -283,9 +301,77 @@ def _is_all_arrays(value):
     return all([_is_array(sub_value) for sub_value in value])
 
 
-def _all_list_of_arrays_equal(array_lists):
+def _all_list_of_arrays_equal(array_lists, compare_arrays=True):
     """Check that the lists of arrays are equal."""
     for array_list in zip(*array_lists):
-        if not _all_arrays_equal(array_list):
+        if not _all_arrays_equal(array_list, compare_arrays):
             return False
     return True
+
+
+@cache
+def _get_immutable_types():
+    """Get the types considered immutable, for which comparison results can be cached."""
+    from pyresample.geometry import BaseDefinition
+
+    from satpy.dataset.dataid import DataID
+    return (BaseDefinition, DataID)
+
+
+def _are_immutable(values):
+    immutable_types = _get_immutable_types()
+    return all(isinstance(value, immutable_types) for value in values)
+
+
+class _ComparisonCache:
+    """Least recently used cache of comparison results between pairs of objects.
+
+    The objects are identified by their ``id`` and referenced weakly, so
+    that a result is never used for new objects reusing the ``id`` of
+    deleted ones.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, obj1, obj2):
+        """Get the cached comparison result of *obj1* and *obj2*, or None."""
+        key = (id(obj1), id(obj2))
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None or entry[0]() is not obj1 or entry[1]() is not obj2:
+                return None
+            self._results.move_to_end(key)
+            return entry[2]
+
+    def set(self, obj1, obj2, result):
+        """Cache the comparison result of *obj1* and *obj2*."""
+        try:
+            entry = (weakref.ref(obj1), weakref.ref(obj2), result)
+        except TypeError:
+            # not weak referenceable
+            return
+        with self._lock:
+            self._results[(id(obj1), id(obj2))] = entry
+            self._results.move_to_end((id(obj1), id(obj2)))
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """Remove all results."""
+        with self._lock:
+            self._results.clear()
+
+
+_COMPARISON_CACHE = _ComparisonCache()
+
+
+def _cached_immutable_equal(obj1, obj2):
+    """Check that two immutable objects are equal, reusing earlier results."""
+    result = _COMPARISON_CACHE.get(obj1, obj2)
+    if result is None:
+        result = bool(obj1 == obj2)
+        _COMPARISON_CACHE.set(obj1, obj2, result)
+    return result
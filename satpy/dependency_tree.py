@@ -19,11 +19,16 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Container, Iterable, Optional
 
 import numpy as np
 
-from satpy import DataID, DatasetDict
+import satpy
+from satpy import DataID, DataQuery, DatasetDict
+from satpy.composites.config_loader import _CompositorDict, resolve_compositor
 from satpy.dataset import ModifierTuple, create_filtered_query
 from satpy.dataset.data_dict import TooManyResults, get_key
 from satpy.node import EMPTY_LEAF_NAME, LOG, CompositorNode, MissingDependencies, Node, ReaderNode
@@ -146,6 +151,118 @@ class Tree:
         return self._root.display()
 
 
+class _ResolvedTreeCache:
+    """Least recently used cache of resolved dependency subtrees."""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_RESOLVED_TREES = _ResolvedTreeCache()
+
+
+def _freeze_value(value):
+    if isinstance(value, (list, set)):
+        value = tuple(value)
+    return type(value).__name__, value
+
+
+def _freeze_dataset_key(key):
+    """Get a hashable representation of ``key`` with exact equality.
+
+    ``DataQuery`` and ``WavelengthRange`` objects compare equal to similar
+    but different objects, so they can't be used as cache keys directly.
+
+    """
+    if isinstance(key, (DataID, DataQuery)):
+        return (type(key).__name__,) + tuple(sorted((field, _freeze_value(value))
+                                                    for field, value in key.items()))
+    return _freeze_value(key)
+
+
+_READER_SIGNATURES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_readers_signature(readers):
+    signature = []
+    for reader_name, reader in sorted(readers.items()):
+        reader_signature = _get_reader_signature(reader)
+        if reader_signature is None:
+            return None
+        signature.append((reader_name, type(reader)) + reader_signature)
+    return tuple(signature)
+
+
+def _get_reader_signature(reader):
+    """Get the frozen dataset IDs of ``reader``, reusing them while its ID dictionaries are unchanged."""
+    all_ids = getattr(reader, "all_ids", None)
+    available_ids = getattr(reader, "available_ids", None)
+    if not isinstance(available_ids, dict):
+        available_ids = None
+    try:
+        cached = _READER_SIGNATURES.get(reader)
+    except TypeError:
+        cached = None
+    if cached is not None and _ids_unchanged(cached[0], all_ids) and _ids_unchanged(cached[1], available_ids):
+        return cached[2]
+    try:
+        reader_signature = (frozenset(all_ids),
+                            frozenset(available_ids) if available_ids is not None else None)
+    except TypeError:
+        return None
+    try:
+        _READER_SIGNATURES[reader] = ((all_ids, _get_size(all_ids)),
+                                      (available_ids, _get_size(available_ids)),
+                                      reader_signature)
+    except TypeError:
+        # readers that can't be weakly referenced
+        pass
+    return reader_signature
+
+
+def _ids_unchanged(cached_ids, ids):
+    return ids is cached_ids[0] and _get_size(ids) == cached_ids[1]
+
+
+def _get_size(ids):
+    try:
+        return len(ids)
+    except TypeError:
+        return None
+
+
+def _get_config_source_stamp(config_dict):
+    """Get an identifier of the content of ``config_dict`` or None if it has none."""
+    stamp = getattr(config_dict, "config_stamp", None)
+    if stamp is None and not config_dict:
+        return ()
+    return stamp
+
+
 class DependencyTree(Tree):
     """Structure to discover and store `Dataset` dependencies.
 
@@ -153,6 +270,13 @@ class DependencyTree(Tree):
     Dependencies are stored used a series of `Node` objects which this
     class is a subclass of.
 
+    If the ``cache_configs`` Satpy configuration option is set, resolved
+    subtrees are cached per process and reused by trees with readers
+    providing the same datasets, compositor and modifier configurations
+    loaded from the same unchanged configuration files and the same already
+    resolved nodes, which makes loading the same composites for every new
+    ``Scene`` cheap. Nodes are copied when they are taken from the cache.
+
     """
 
     def __init__(self, readers, compositors=None, modifiers=None, available_only=False):
@@ -186,6 +310,7 @@ class DependencyTree(Tree):
         self.compositors = {}
         self.modifiers = {}
         self._available_only = available_only
+        self._config_sources = []
         self.update_compositors_and_modifiers(compositors or {}, modifiers or {})
 
     def update_compositors_and_modifiers(self, compositors: dict, modifiers: dict) -> None:
@@ -202,9 +327,17 @@ class DependencyTree(Tree):
 
         """
         for sensor_name, sensor_comps in compositors.items():
-            self.compositors.setdefault(sensor_name, DatasetDict()).update(sensor_comps)
+            # copy without creating compositors that are created on first access
+            comp_items = sensor_comps.lazy_items() if isinstance(sensor_comps, _CompositorDict) else sensor_comps
+            self.compositors.setdefault(sensor_name, DatasetDict()).update(comp_items)
+            self._add_config_source(sensor_name, sensor_comps)
         for sensor_name, sensor_mods in modifiers.items():
             self.modifiers.setdefault(sensor_name, {}).update(sensor_mods)
+            self._add_config_source(sensor_name, sensor_mods)
+
+    def _add_config_source(self, sensor_name, config_dict):
+        if not any(config_dict is source for _, source in self._config_sources):
+            self._config_sources.append((sensor_name, config_dict))
 
     def copy(self):
         """Copy this node tree.
@@ -216,6 +349,7 @@ class DependencyTree(Tree):
         any datasets not already existing in the dependency tree.
         """
         new_tree = DependencyTree({}, self.compositors, self.modifiers)
+        new_tree._config_sources = list(self._config_sources)
         for c in self._root.children:
             c = c.copy(node_cache=new_tree._all_nodes)
             new_tree.add_child(new_tree._root, c)
@@ -242,6 +376,24 @@ class DependencyTree(Tree):
             (Node, set): Root node of the dependency tree and a set of unknown datasets
 
         """
+        cache_key = self._get_resolved_tree_cache_key(dataset_keys, query)
+        cached = _RESOLVED_TREES.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            known_nodes = self._add_cached_nodes(cached[0])
+            unknown_datasets = cached[1]
+        else:
+            known_nodes, unknown_datasets = self._create_subtrees_for_keys(dataset_keys, query)
+            if cache_key is not None:
+                _RESOLVED_TREES.set(cache_key, (_copy_nodes(known_nodes, {}), unknown_datasets))
+
+        for key in dataset_keys.copy():
+            dataset_keys.discard(key)
+        for node in known_nodes:
+            dataset_keys.add(node.name)
+        if unknown_datasets:
+            raise MissingDependencies(unknown_datasets, "Unknown datasets:")
+
+    def _create_subtrees_for_keys(self, dataset_keys, query):
         unknown_datasets = list()
         known_nodes = list()
         for key in dataset_keys.copy():
@@ -253,13 +405,41 @@ class DependencyTree(Tree):
             else:
                 known_nodes.append(node)
                 self.add_child(self._root, node)
-
-        for key in dataset_keys.copy():
-            dataset_keys.discard(key)
-        for node in known_nodes:
-            dataset_keys.add(node.name)
-        if unknown_datasets:
-            raise MissingDependencies(unknown_datasets, "Unknown datasets:")
+        return known_nodes, unknown_datasets
+
+    def _get_resolved_tree_cache_key(self, dataset_keys, query):
+        """Get the key of the resolved subtrees in the cache or None if they can't be cached."""
+        if not satpy.config.get("cache_configs", False):
+            return None
+        config_stamps = tuple((sensor_name, _get_config_source_stamp(source))
+                              for sensor_name, source in self._config_sources)
+        if any(stamp is None for _, stamp in config_stamps):
+            # configurations not loaded from configuration files
+            return None
+        readers_signature = _get_readers_signature(self.readers)
+        if readers_signature is None:
+            return None
+        try:
+            return (readers_signature,
+                    self._available_only,
+                    config_stamps,
+                    frozenset(dict.keys(self._all_nodes)),
+                    frozenset(_freeze_dataset_key(key) for key in dataset_keys),
+                    _freeze_dataset_key(query) if query is not None else None)
+        except TypeError:
+            # unhashable dataset keys
+            return None
+
+    def _add_cached_nodes(self, cached_nodes):
+        """Copy cached nodes into the tree, reusing the nodes already in the tree."""
+        node_cache = dict(dict.items(self._all_nodes))
+        nodes = _copy_nodes(cached_nodes, node_cache)
+        for name, node in node_cache.items():
+            if not self.contains(name):
+                self._all_nodes[name] = node
+        for node in nodes:
+            self.add_child(self._root, node)
+        return nodes
 
     def _create_subtree_for_key(self, dataset_key, query=None):
         """Find the dependencies for *dataset_key*.
@@ -492,9 +672,10 @@ class DependencyTree(Tree):
         """Get a compositor."""
         for sensor_name in sorted(self.compositors):
             try:
-                return self.compositors[sensor_name][key]
+                comp = self.compositors[sensor_name][key]
             except KeyError:
                 continue
+            return resolve_compositor(comp)
 
         raise KeyError("Could not find compositor '{}'".format(key))
 
@@ -582,6 +763,11 @@ class DependencyTree(Tree):
         return prereq_nodes, unknown_datasets
 
 
+def _copy_nodes(nodes, node_cache):
+    """Copy ``nodes`` and their children, reusing the nodes in the ``node_cache`` dictionary of exact names."""
+    return [node.copy(node_cache=node_cache) for node in nodes]
+
+
 class _DataIDContainer(dict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
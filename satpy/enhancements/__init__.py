@@ -37,8 +37,22 @@ LOG = logging.getLogger(__name__)
 
 
 def stretch(img, **kwargs):
-    """Perform stretch."""
-    return img.stretch(**kwargs)
+    """Perform stretch.
+
+    The keyword arguments are passed to :meth:`trollimage.xrimage.XRImage.stretch`.
+    If the ``statistics`` keyword argument is ``"sketch"`` or ``"reuse"``, the
+    statistics needed by the crude stretch without limits, the linear stretch
+    and the histogram equalization are instead computed chunk by chunk, or
+    taken from the previous time step of the product in the ``"reuse"`` case. See
+    :mod:`satpy.enhancements.statistics` for more information.
+    """
+    statistics = kwargs.pop("statistics", None)
+    if statistics is None:
+        return img.stretch(**kwargs)
+    if statistics not in ("sketch", "reuse"):
+        raise ValueError(f"Unknown stretch statistics '{statistics}', expected 'sketch' or 'reuse'.")
+    from satpy.enhancements.statistics import stretch_with_statistics
+    return stretch_with_statistics(img, reuse=statistics == "reuse", **kwargs)
 
 
 def gamma(img, **kwargs):
@@ -328,9 +342,14 @@ def colorize(img, **kwargs):  # noqa: D417
 
     If multiple palettes are supplied, they are concatenated before applied.
 
+    Images of 8 or 16 bit integer data, like categorical products, are
+    colorized with a lookup table of the colors of every possible value,
+    applied with a single gather per chunk.
+
     """
     full_cmap = _merge_colormaps(kwargs, img)
-    img.colorize(full_cmap)
+    if not _apply_colormap_lut(img, full_cmap, "colorize"):
+        img.colorize(full_cmap)
 
 
 def palettize(img, **kwargs):
@@ -343,7 +362,47 @@ def palettize(img, **kwargs):
     directly in trollimage).
     """
     full_cmap = _merge_colormaps(kwargs, img)
-    img.palettize(full_cmap)
+    if not _apply_colormap_lut(img, full_cmap, "palettize"):
+        img.palettize(full_cmap)
+
+
+def _apply_colormap_lut(img, cmap, method):
+    """Apply the colormap to an integer image with a lookup table of all its possible values.
+
+    The lookup table is made by colorizing or palettizing an image of all the
+    values of the integer data type with trollimage, so the result is the same
+    as applying the colormap to the image directly.
+
+    Returns:
+        False if the image isn't a single band image of 8 or 16 bit integers,
+        True otherwise.
+
+    """
+    data = img.data
+    if img.mode != "L" or data.dtype.kind not in "iu" or data.dtype.itemsize > 2 or \
+            not isinstance(data.data, da.Array):
+        return False
+    iinfo = np.iinfo(data.dtype)
+    all_values = np.arange(iinfo.min, iinfo.max + 1, dtype=data.dtype).reshape((1, 1, -1))
+    lut_img = XRImage(xr.DataArray(all_values, dims=("bands", "y", "x"), coords={"bands": ["L"]},
+                                   attrs=data.attrs.copy()))
+    getattr(lut_img, method)(cmap)
+    lut = np.asarray(lut_img.data.transpose("bands", "y", "x").values[:, 0, :])
+
+    arr = data.transpose("bands", "y", "x").data
+    new_data = da.map_blocks(_gather_lut, arr, lut=lut, offset=iinfo.min, dtype=lut.dtype,
+                             chunks=((lut.shape[0],),) + arr.chunks[1:], meta=np.array((), dtype=lut.dtype))
+    img.data = xr.DataArray(new_data, dims=("bands", "y", "x"),
+                            coords={**dict(data.coords), "bands": lut_img.data.coords["bands"]},
+                            attrs=lut_img.data.attrs)
+    if method == "palettize":
+        img.palette = lut_img.palette
+    return True
+
+
+def _gather_lut(block, lut=None, offset=0):
+    indices = block[0].astype(np.int64) - offset
+    return lut[:, indices]
 
 
 def _merge_colormaps(kwargs, img=None):
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Execution of enhancement chains with fused element-wise operations.
+
+Every operation of an enhancement chain adds its own layers to the dask graph
+of the image, most of them going over the full image with new xarray objects
+(selecting the bands without alpha, concatenating them back, ...). Runs of
+consecutive element-wise operations, where every output pixel only depends on
+the same input pixel, are instead applied with a single
+:func:`~dask.array.map_blocks` call running the whole run on each chunk, so
+the intermediate results only exist for one chunk at a time. Other operations,
+like the stretches computing statistics of the image or ``colorize``, are
+applied one at a time as before.
+
+The fused execution makes the graphs much smaller, but runs the operations of
+a chunk one after the other in a single task, which is usually slower than
+the step-wise graph computing the bands in parallel. It is therefore only
+used when the ``fuse_enhancements`` option of the Satpy configuration is
+set, see :ref:`config_fuse_enhancements_setting`.
+
+"""
+import logging
+
+import dask
+import dask.array as da
+import numpy as np
+import xarray as xr
+from trollimage.xrimage import XRImage
+
+import satpy
+from satpy.enhancements import (
+    btemp_threshold,
+    cira_stretch,
+    gamma,
+    lookup,
+    piecewise_linear_stretch,
+    reinhard_to_srgb,
+)
+
+LOG = logging.getLogger(__name__)
+
+ELEMENTWISE_ENHANCEMENTS = (
+    btemp_threshold,
+    cira_stretch,
+    gamma,
+    lookup,
+    piecewise_linear_stretch,
+    reinhard_to_srgb,
+)
+
+
+def apply_enhancement_operations(img, operations):
+    """Apply the enhancement ``operations`` to ``img``, fusing runs of element-wise operations.
+
+    The operations are fused only if the ``fuse_enhancements`` option of the
+    Satpy configuration is set, otherwise they are applied one at a time.
+
+    Args:
+        img (XRImage): Image to enhance in place.
+        operations (list): Operations as configured in the enhancement
+            YAML files, with the ``method`` to call and optional ``args``
+            and ``kwargs``.
+
+    """
+    if not satpy.config.get("fuse_enhancements", False):
+        _apply_operations(img, operations)
+        return
+    for run in _split_elementwise_runs(operations):
+        if len(run) > 1:
+            _apply_fused(img, run)
+        else:
+            _apply_operation(img, run[0])
+
+
+def _split_elementwise_runs(operations):
+    runs = []
+    for operation in operations:
+        if runs and _is_elementwise(operation) and _is_elementwise(runs[-1][-1]):
+            runs[-1].append(operation)
+        else:
+            runs.append([operation])
+    return runs
+
+
+def _is_elementwise(operation):
+    return operation["method"] in ELEMENTWISE_ENHANCEMENTS
+
+
+def _apply_operation(img, operation):
+    fun = operation["method"]
+    args = operation.get("args", [])
+    kwargs = operation.get("kwargs", {})
+    fun(img, *args, **kwargs)
+
+
+def _apply_operations(img, operations):
+    for operation in operations:
+        _apply_operation(img, operation)
+
+
+def _apply_fused(img, operations):
+    """Apply the element-wise ``operations`` chunk by chunk in one dask task per chunk."""
+    data = img.data
+    if not isinstance(data.data, da.Array):
+        _apply_operations(img, operations)
+        return
+    # the step-wise result of a single pixel gives the output dtype and metadata
+    traced = XRImage(data[:, :1, :1].copy())
+    _apply_operations(traced, operations)
+    if traced.data.dims != data.dims or traced.data.sizes["bands"] != data.sizes["bands"]:
+        _apply_operations(img, operations)
+        return
+
+    LOG.debug("Applying %d fused enhancement operations", len(operations))
+    bands = list(data.coords["bands"].values)
+    # operations on separate bands or mixing bands need all the bands of a pixel
+    arr = data.data.rechunk({0: -1})
+    fused = da.map_blocks(_apply_operations_to_block, arr, bands, operations, traced.data.dtype,
+                          dtype=traced.data.dtype, meta=np.array((), dtype=traced.data.dtype),
+                          token="fused_enhancement")
+    img.data = xr.DataArray(fused, dims=data.dims, coords=data.coords, attrs=traced.data.attrs)
+
+
+def _apply_operations_to_block(block, bands, operations, dtype):
+    block_arr = da.from_array(block, chunks=block.shape, name=False)
+    block_img = XRImage(xr.DataArray(block_arr, dims=("bands", "y", "x"), coords={"bands": bands}))
+    _apply_operations(block_img, operations)
+    new_block, = dask.compute(block_img.data.data, scheduler="synchronous")
+    return np.asarray(new_block).astype(dtype, copy=False)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Streaming statistics for data-dependent stretches.
+
+The linear (percentile) and histogram equalization stretches of trollimage
+compute exact quantiles of the image, which needs the full image of every
+band in a single dask chunk. The :class:`QuantileSketch` used here instead
+summarizes every chunk separately by a fixed number of its quantiles and
+merges these summaries, so the statistics are computed chunk by chunk with
+a bounded memory use. The quantiles of a sketch of size ``n`` have a rank
+error of at most about ``2 / n`` of the number of valid values, the minimum
+and maximum are exact.
+
+These statistics are used by the :func:`~satpy.enhancements.stretch`
+enhancement when its ``statistics`` keyword argument is given:
+
+* ``statistics: sketch`` computes the sketches lazily with the rest of the
+  image.
+* ``statistics: reuse`` stretches the image with the statistics of the
+  previous time step of the same product, so the statistics don't need to
+  be computed before the image itself. The sketches of every stretched
+  image are recorded chunk by chunk while the image is computed and replace
+  the stored statistics of the product, identified by its dataset name,
+  bands, position in the enhancement chain, area and platform. The stored
+  statistics are used by the next images of the same product with the same
+  or a later start time. When there are none, for the first time step, the
+  statistics of the image itself are computed as with ``sketch``. This is
+  meant for animations of a :class:`~satpy.multiscene.MultiScene` or
+  operational processing of successive time steps. The statistics of a
+  reference Scene are used by computing its enhanced images first. The
+  stored statistics are removed with :func:`clear_stretch_statistics`.
+  The statistics are not recorded when computing with ``dask.distributed``.
+
+For example:
+
+.. code-block:: yaml
+
+    ir_linear_stretch:
+      name: IR_108
+      operations:
+      - name: stretch
+        method: !!python/name:satpy.enhancements.stretch
+        kwargs: {stretch: linear, cutoffs: [0.02, 0.02], statistics: reuse}
+
+"""
+import logging
+import threading
+import uuid
+
+import dask
+import dask.array as da
+import numpy as np
+import xarray as xr
+from dask.delayed import Delayed
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_SKETCH_SIZE = 2048
+
+# start time and computed sketches of the last time step of every product, for the "reuse" statistics mode
+_STRETCH_STATISTICS: dict = {}
+_STRETCH_STATISTICS_LOCK = threading.Lock()
+
+
+class QuantileSketch:
+    """Mergeable summary of the distribution of the values of an array.
+
+    The summary is a sorted set of at most ``size`` representative values
+    with the number of input values each of them stands for, and the exact
+    minimum and maximum of the input.
+    """
+
+    def __init__(self, values, weights, vmin=np.nan, vmax=np.nan, size=DEFAULT_SKETCH_SIZE):
+        """Initialize the sketch from sorted ``values`` and their ``weights``."""
+        self.values = values
+        self.weights = weights
+        self.min = vmin
+        self.max = vmax
+        self.size = size
+
+    @classmethod
+    def from_array(cls, arr, size=DEFAULT_SKETCH_SIZE):
+        """Create the sketch of the non-NaN values of ``arr``."""
+        valid = np.asarray(arr, dtype=np.float64).ravel()
+        valid = valid[~np.isnan(valid)]
+        num_values = valid.size
+        if num_values == 0:
+            return cls(np.empty(0), np.empty(0), size=size)
+        if num_values <= size:
+            return cls(np.sort(valid), np.ones(num_values), valid.min(), valid.max(), size)
+        ranks = ((np.arange(size) + 0.5) * (num_values / size)).astype(np.int64)
+        values = np.partition(valid, ranks)[ranks]
+        return cls(values, np.full(size, num_values / size), valid.min(), valid.max(), size)
+
+    @classmethod
+    def merge(cls, sketches):
+        """Merge ``sketches`` into a single sketch of the size of the first one."""
+        size = sketches[0].size
+        values = np.concatenate([sketch.values for sketch in sketches])
+        weights = np.concatenate([sketch.weights for sketch in sketches])
+        vmin = np.nanmin([sketch.min for sketch in sketches]) if values.size else np.nan
+        vmax = np.nanmax([sketch.max for sketch in sketches]) if values.size else np.nan
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        weights = weights[order]
+        if values.size > size:
+            cum_weights = np.cumsum(weights)
+            total = cum_weights[-1]
+            targets = (np.arange(size) + 0.5) * (total / size)
+            values = values[np.searchsorted(cum_weights, targets)]
+            weights = np.full(size, total / size)
+        return cls(values, weights, vmin, vmax, size)
+
+    @property
+    def count(self):
+        """Get the number of values summarized by the sketch."""
+        return self.weights.sum()
+
+    def quantile(self, q):
+        """Get the approximate quantiles ``q`` (between 0 and 1) of the values."""
+        q = np.asarray(q, dtype=np.float64)
+        if self.values.size == 0:
+            return np.full(q.shape, np.nan)
+        mid_ranks = np.cumsum(self.weights) - self.weights / 2
+        res = np.interp(q * self.count, mid_ranks, self.values)
+        return np.where(q <= 0, self.min, np.where(q >= 1, self.max, res))
+
+
+def compute_band_sketches(data_arr, size=DEFAULT_SKETCH_SIZE):
+    """Get the delayed sketches of every band of ``data_arr``.
+
+    Args:
+        data_arr (xarray.DataArray): Image data with a ``bands`` dimension.
+        size (int): Maximum number of values kept in the sketches.
+
+    Returns:
+        List of one delayed :class:`QuantileSketch` per band.
+
+    """
+    arr = data_arr.transpose("bands", ...).data
+    if not isinstance(arr, da.Array):
+        arr = da.from_array(arr, chunks=arr.shape)
+    sketches = []
+    for band_arr in arr:
+        chunk_sketches = [dask.delayed(QuantileSketch.from_array)(chunk, size)
+                          for chunk in band_arr.to_delayed().ravel()]
+        sketches.append(dask.delayed(QuantileSketch.merge)(chunk_sketches))
+    return sketches
+
+
+def clear_stretch_statistics():
+    """Remove the statistics stored by the ``reuse`` statistics mode of the stretches."""
+    with _STRETCH_STATISTICS_LOCK:
+        _STRETCH_STATISTICS.clear()
+
+
+def _get_band_sketches(img, reuse, size):
+    """Get the sketches of the bands of the image, from the previous time step if they are reused."""
+    if not reuse:
+        return compute_band_sketches(img.data, size)
+    attrs = img.data.attrs
+    area = attrs.get("area")
+    key = (attrs.get("name"), tuple(img.data.coords["bands"].values), len(attrs.get("enhancement_history", [])),
+           size, None if area is None else hash(area), attrs.get("platform_name"))
+    start_time = attrs.get("start_time")
+    previous = _get_previous_statistics(key, start_time)
+    if previous is None:
+        LOG.debug("No previous stretch statistics of %s, computing them from the image", key[0])
+        sketches = compute_band_sketches(img.data, size)
+        stored = dask.delayed(_store_statistics, pure=False)(key, start_time, sketches)
+        return [stored[idx] for idx in range(len(sketches))]
+    # record the statistics of this image for the next time step while it is computed
+    img.data.data = _record_statistics(img.data.data, key, start_time, size)
+    return previous
+
+
+def _get_previous_statistics(key, start_time):
+    with _STRETCH_STATISTICS_LOCK:
+        previous_time, sketches = _STRETCH_STATISTICS.get(key, (None, None))
+    if sketches is None or not _is_not_later(previous_time, start_time):
+        return None
+    return sketches
+
+
+def _is_not_later(time1, time2):
+    return time1 is None or time2 is None or time1 <= time2
+
+
+def _store_statistics(key, start_time, sketches):
+    """Store the sketches of a time step of a product, unless later ones are already stored."""
+    with _STRETCH_STATISTICS_LOCK:
+        stored_time, _ = _STRETCH_STATISTICS.get(key, (None, None))
+        if _is_not_later(stored_time, start_time):
+            _STRETCH_STATISTICS[key] = (start_time, sketches)
+    return sketches
+
+
+def _record_statistics(arr, key, start_time, size):
+    """Pass the data through a step recording the sketches of its chunks when they are computed."""
+    recorder = _StatisticsRecorder(key, start_time, arr.shape[0], arr.npartitions, size)
+    return da.map_blocks(_record_block, arr, recorder=recorder, dtype=arr.dtype, meta=np.array((), dtype=arr.dtype),
+                         name=f"record_stretch_statistics-{uuid.uuid4().hex}")
+
+
+def _record_block(block, recorder=None, block_info=None):
+    # the recorder is None when computing in other processes
+    if recorder is not None and block_info is not None:
+        recorder.record(block, block_info[0]["chunk-location"], block_info[0]["array-location"][0][0])
+    return block
+
+
+def _no_recorder():
+    return None
+
+
+class _StatisticsRecorder:
+    """Merge the sketches of the chunks of an image and store them when all chunks are computed."""
+
+    def __init__(self, key, start_time, num_bands, num_chunks, size):
+        self.key = key
+        self.start_time = start_time
+        self.num_chunks = num_chunks
+        self.size = size
+        self._band_sketches = [[] for _ in range(num_bands)]
+        self._recorded = set()
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        """Don't record the statistics in other processes, they wouldn't be stored in this one."""
+        return _no_recorder, ()
+
+    def record(self, block, chunk_location, first_band):
+        """Record the sketches of the bands of a chunk at ``chunk_location``."""
+        sketches = [QuantileSketch.from_array(band_block, self.size) for band_block in block]
+        with self._lock:
+            if chunk_location in self._recorded:
+                return
+            self._recorded.add(chunk_location)
+            for band_idx, sketch in enumerate(sketches, start=first_band):
+                self._band_sketches[band_idx].append(sketch)
+            if len(self._recorded) < self.num_chunks:
+                return
+            merged = [QuantileSketch.merge(band_sketches) for band_sketches in self._band_sketches]
+        _store_statistics(self.key, self.start_time, merged)
+
+
+def _sketch_quantile(sketch, q):
+    if isinstance(sketch, Delayed):
+        q = np.asarray(q)
+        return da.from_delayed(dask.delayed(QuantileSketch.quantile)(sketch, q), shape=q.shape, dtype=np.float64)
+    return sketch.quantile(q)
+
+
+def _sketch_limit(sketch, kind):
+    if isinstance(sketch, Delayed):
+        return da.from_delayed(getattr(sketch, kind), shape=(), dtype=np.float64)
+    return getattr(sketch, kind)
+
+
+def _to_band_array(img, values):
+    if any(isinstance(val, da.Array) for val in values):
+        values = da.stack([da.asarray(val) for val in values])
+    else:
+        values = np.array(values)
+    return xr.DataArray(values, dims=("bands",), coords={"bands": img.data["bands"]})
+
+
+def stretch_with_statistics(img, stretch="crude", reuse=False, sketch_size=DEFAULT_SKETCH_SIZE, **kwargs):
+    """Stretch the image with limits from quantile sketches.
+
+    Supports the same stretches as :meth:`trollimage.xrimage.XRImage.stretch`.
+    Only the crude stretch without limits, the linear stretch and the
+    histogram equalization need statistics, the other stretches are passed to
+    trollimage.
+
+    Args:
+        img (XRImage): Image to stretch.
+        stretch (str or tuple): Kind of stretch or linear stretch cutoffs.
+        reuse (bool): Reuse the statistics of previous images, see the module
+            documentation.
+        sketch_size (int): Maximum number of values in the sketches.
+        kwargs: Other keyword arguments of the stretch.
+
+    """
+    if isinstance(stretch, (tuple, list)):
+        kwargs["cutoffs"] = stretch
+        stretch = "linear"
+    if stretch in ("crude", "crude-stretch"):
+        return _crude_stretch(img, reuse, sketch_size, **kwargs)
+    if stretch == "linear":
+        return _linear_stretch(img, reuse, sketch_size, **kwargs)
+    if stretch == "histogram":
+        return _histogram_equalize(img, reuse, sketch_size)
+    return img.stretch(stretch=stretch, **kwargs)
+
+
+def _crude_stretch(img, reuse, size, min_stretch=None, max_stretch=None):
+    if min_stretch is None or max_stretch is None:
+        sketches = _get_band_sketches(img, reuse, size)
+        if min_stretch is None:
+            min_stretch = _to_band_array(img, [_sketch_limit(sketch, "min") for sketch in sketches])
+        if max_stretch is None:
+            max_stretch = _to_band_array(img, [_sketch_limit(sketch, "max") for sketch in sketches])
+    img.crude_stretch(min_stretch, max_stretch)
+
+
+def _linear_stretch(img, reuse, size, cutoffs=(0.005, 0.005)):
+    bands = img.data.coords["bands"].values
+    nb_bands = len(bands)
+    # same handling of the alpha band as trollimage
+    dont_stretch_alpha = "A" in bands and (np.isscalar(cutoffs[0]) or len(cutoffs) == nb_bands - 1)
+    if np.isscalar(cutoffs[0]):
+        cutoffs = [cutoffs] * nb_bands
+    sketches = _get_band_sketches(img, reuse, size)
+    left = []
+    right = []
+    for idx, band in enumerate(bands):
+        if dont_stretch_alpha and band == "A":
+            left.append(0.)
+            right.append(1.)
+            continue
+        quantiles = _sketch_quantile(sketches[idx], [cutoffs[idx][0], 1 - cutoffs[idx][1]])
+        left.append(quantiles[0])
+        right.append(quantiles[1])
+    img.crude_stretch(_to_band_array(img, left), _to_band_array(img, right))
+
+
+def _histogram_equalize(img, reuse, size):
+    cdf = np.arange(0.0, 1.0, 1.0 / 2048)
+    sketches = _get_band_sketches(img, reuse, size)
+    dtype = img.data.dtype
+    band_results = []
+    for idx, band in enumerate(img.data.coords["bands"].values):
+        band_data = img.data.sel(bands=band).data
+        if band == "A":
+            band_results.append(band_data)
+            continue
+        bins = da.asarray(_sketch_quantile(sketches[idx], cdf))
+        band_results.append(da.blockwise(_interp, "yx", band_data, "yx", bins, "b", cdf=cdf, dtype=dtype,
+                                         concatenate=True, meta=np.array((), dtype=dtype)))
+    img.data.data = da.stack(band_results, axis=img.data.dims.index("bands"))
+    img.data.attrs.setdefault("enhancement_history", []).append({"hist_equalize": True})
+
+
+def _interp(band_data, bins, cdf=None):
+    return np.interp(band_data, bins, cdf).astype(band_data.dtype, copy=False)
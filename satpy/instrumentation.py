@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Opt-in instrumentation of the stages of Scene processing.
+
+When activated with :func:`instrument`, the main stages of the processing
+of a :class:`~satpy.scene.Scene` are recorded:
+
+* ``reader``: creation of the file handlers of a reader
+* ``dataset``: loading of datasets by a reader
+* ``compositor`` and ``modifier``: call of a compositor or modifier
+* ``resampler``: preparation of a resampler (precomputation) and resampling
+  of a dataset
+* ``writer``: saving datasets with a writer and computing the results
+
+For every stage the wall time is recorded and, for stages producing dask
+collections, the number of tasks and layers of their graph and the
+estimated number of bytes of the output arrays. Since most of the
+computations are delayed until the data is saved or computed, the time of
+a stage is the time needed to build its part of the graph, the task counts
+show how much work it adds to the final computation.
+
+Example::
+
+    from satpy import Scene
+    from satpy.instrumentation import instrument
+
+    with instrument() as report:
+        scn = Scene(filenames=filenames, reader="abi_l1b")
+        scn.load(["true_color"])
+        new_scn = scn.resample("eurol")
+        new_scn.save_datasets()
+
+    report.save_json("satpy_report.json")
+    # open in chrome://tracing or https://ui.perfetto.dev
+    report.save_chrome_trace("satpy_trace.json")
+
+When no report is active, the instrumentation only costs a list check per
+stage.
+
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+STAGE_KINDS = ("reader", "dataset", "compositor", "modifier", "resampler", "writer")
+
+_ACTIVE_REPORTS: list[InstrumentationReport] = []
+_ACTIVE_REPORTS_LOCK = threading.Lock()
+_STAGE_DEPTH = threading.local()
+# number of tasks of the graph layers described while reports are active
+_LAYER_TASKS: dict[str, int] = {}
+
+
+class InstrumentationReport:
+    """Records of the stages run while the report is active.
+
+    Every record is a dictionary with the ``kind`` and ``name`` of the stage,
+    its ``start`` time in seconds since the report was created, its
+    ``duration`` in seconds, the ``thread`` it ran in, its nesting ``depth``,
+    and, if the stage produced dask collections or arrays, the number of
+    ``dask_tasks`` and ``graph_layers`` of their graphs and the estimated
+    number of bytes (``nbytes``) of the arrays. Additional information
+    specific to the stage is stored in ``info``.
+
+    """
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.records = []
+        self._start = time.perf_counter()
+        self._start_wall = time.time()
+        self._lock = threading.Lock()
+
+    def add_record(self, record):
+        """Add the record of a stage."""
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self):
+        """Summarize the records by kind of stage.
+
+        Returns:
+            dict: Mapping of stage kind to a dictionary with the number of
+            stages (``count``) and their total ``duration``.
+
+        """
+        summary = {}
+        for record in self.records:
+            kind_summary = summary.setdefault(record["kind"], {"count": 0, "duration": 0.0})
+            kind_summary["count"] += 1
+            kind_summary["duration"] += record["duration"]
+        return summary
+
+    def to_dict(self):
+        """Convert the report to a JSON serializable dictionary."""
+        return {
+            "start_time": self._start_wall,
+            "records": sorted(self.records, key=lambda record: record["start"]),
+            "summary": self.summary(),
+        }
+
+    def save_json(self, filename):
+        """Save the report as JSON to *filename*."""
+        with open(filename, "w") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2, default=str)
+
+    def to_chrome_trace(self):
+        """Convert the records to the Chrome trace event format.
+
+        See https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+        for the format specification.
+
+        """
+        events = []
+        pid = os.getpid()
+        for record in self.records:
+            args = {key: val for key, val in record.items()
+                    if key not in ("kind", "name", "start", "duration", "thread")}
+            events.append({
+                "name": record["name"],
+                "cat": record["kind"],
+                "ph": "X",
+                "ts": record["start"] * 1e6,
+                "dur": record["duration"] * 1e6,
+                "pid": pid,
+                "tid": record["thread"],
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename):
+        """Save the records to *filename* in the Chrome trace event format."""
+        with open(filename, "w") as json_file:
+            json.dump(self.to_chrome_trace(), json_file, default=str)
+
+    def _elapsed(self, perf_counter):
+        return perf_counter - self._start
+
+
+@contextmanager
+def instrument():
+    """Record the stages of Satpy processing run in this context.
+
+    Stages are recorded from all threads while the context is active.
+    Contexts can be nested, each of them gets all the stages run while it
+    is active.
+
+    Yields:
+        InstrumentationReport: The report the stages are recorded to.
+
+    """
+    report = InstrumentationReport()
+    with _ACTIVE_REPORTS_LOCK:
+        _ACTIVE_REPORTS.append(report)
+    try:
+        yield report
+    finally:
+        with _ACTIVE_REPORTS_LOCK:
+            _ACTIVE_REPORTS.remove(report)
+            if not _ACTIVE_REPORTS:
+                _LAYER_TASKS.clear()
+
+
+def is_instrumented():
+    """Check if the stages are currently recorded."""
+    return bool(_ACTIVE_REPORTS)
+
+
+class _Stage:
+    """A running stage."""
+
+    def __init__(self, kind, name, info):
+        self.kind = kind
+        self.name = name
+        self.info = info
+        self.output = None
+
+    def set_output(self, output):
+        """Set the output of the stage, to be described in the record."""
+        self.output = output
+
+
+class _NullStage:
+    """Stage used when nothing is recorded."""
+
+    def set_output(self, output):
+        """Ignore the output."""
+
+
+_NULL_STAGE = _NullStage()
+
+
+@contextmanager
+def record_stage(kind, name, **info):
+    """Record the stage run in this context in the active reports.
+
+    Args:
+        kind (str): Kind of stage, one of :data:`STAGE_KINDS`.
+        name (str): Name of the component (reader, compositor, ...) run.
+        info: Additional information to store in the record.
+
+    Yields:
+        Object with a ``set_output`` method to call with the output of the
+        stage (arrays or dask collections) so that it is described in the
+        record.
+
+    """
+    if not _ACTIVE_REPORTS:
+        yield _NULL_STAGE
+        return
+    stage = _Stage(kind, str(name), info)
+    depth = getattr(_STAGE_DEPTH, "depth", 0)
+    _STAGE_DEPTH.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield stage
+    finally:
+        end = time.perf_counter()
+        _STAGE_DEPTH.depth = depth
+        _add_stage_records(stage, start, end, depth)
+
+
+def _add_stage_records(stage, start, end, depth):
+    with _ACTIVE_REPORTS_LOCK:
+        reports = list(_ACTIVE_REPORTS)
+    if not reports:
+        return
+    description = describe_output(stage.output)
+    for report in reports:
+        record = {
+            "kind": stage.kind,
+            "name": stage.name,
+            "start": report._elapsed(start),
+            "duration": end - start,
+            "thread": threading.get_ident(),
+            "depth": depth,
+        }
+        record.update(description)
+        if stage.info:
+            record["info"] = stage.info
+        report.add_record(record)
+
+
+def describe_output(output):
+    """Describe the dask graph and size of the arrays in *output*.
+
+    Args:
+        output: Array, DataArray, dask collection or (nested) list, tuple or
+            dictionary values of them.
+
+    Returns:
+        dict: The number of ``dask_tasks`` and ``graph_layers`` of the
+        merged graphs of all dask collections, if any, and the estimated
+        total number of bytes (``nbytes``) of the arrays, if known.
+
+    """
+    collections = []
+    nbytes = 0
+    for obj in _iter_objects(output):
+        nbytes += _get_nbytes(obj)
+        data = getattr(obj, "data", obj)
+        if _is_dask_collection(data):
+            collections.append(data)
+        elif _is_dask_collection(obj):
+            collections.append(obj)
+    description = {}
+    if collections:
+        description.update(_describe_graph(collections))
+    if nbytes:
+        description["nbytes"] = nbytes
+    return description
+
+
+def _iter_objects(output):
+    if output is None:
+        return
+    if isinstance(output, dict):
+        output = list(output.values())
+    if isinstance(output, (list, tuple)):
+        for item in output:
+            yield from _iter_objects(item)
+        return
+    yield output
+
+
+def _is_dask_collection(obj):
+    return hasattr(obj, "__dask_graph__") and obj.__dask_graph__() is not None
+
+
+def _describe_graph(collections):
+    """Count the tasks and layers of the merged graphs of *collections*.
+
+    The tasks of a layer are counted from its output keys, without
+    materializing the graph, and the counts are kept while stages are
+    recorded so the layers a stage shares with the stages before it are not
+    counted again.
+
+    """
+    layer_tasks = {}
+    for collection in collections:
+        graph = collection.__dask_graph__()
+        layers = getattr(graph, "layers", None)
+        if layers is None:
+            layer_tasks[id(graph)] = len(graph)
+            continue
+        for name, layer in layers.items():
+            if name not in layer_tasks:
+                layer_tasks[name] = _count_layer_tasks(name, layer)
+    return {
+        "dask_tasks": sum(layer_tasks.values()),
+        "graph_layers": len(layer_tasks),
+    }
+
+
+def _count_layer_tasks(name, layer):
+    try:
+        return _LAYER_TASKS[name]
+    except KeyError:
+        pass
+    try:
+        num_tasks = len(layer.get_output_keys())
+    except (AttributeError, NotImplementedError):
+        num_tasks = len(layer)
+    with _ACTIVE_REPORTS_LOCK:
+        if _ACTIVE_REPORTS:
+            _LAYER_TASKS[name] = num_tasks
+    return num_tasks
+
+
+def _get_nbytes(obj):
+    try:
+        nbytes = obj.nbytes
+    except (AttributeError, TypeError, ValueError):
+        return 0
+    try:
+        nbytes = int(nbytes)
+    except (TypeError, ValueError, OverflowError):
+        # unknown (nan) sizes of dask arrays
+        return 0
+    return max(nbytes, 0)
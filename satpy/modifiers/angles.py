@@ -23,6 +23,8 @@ import hashlib
 import os
 import shutil
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import update_wrapper
 from glob import glob
 from typing import Any, Callable, Optional, Union
@@ -50,6 +52,82 @@ DEFAULT_UNCACHE_TYPES = (SwathDefinition, xr.DataArray, da.Array)
 HASHABLE_GEOMETRIES = (AreaDefinition, StackedAreaDefinition)
 
 
+class GeometryProvider:
+    """Provide angle arrays shared between modifiers and compositors.
+
+    Modifiers and compositors that need angles for the same area, such as
+    the :class:`~satpy.modifiers.geometry.SunZenithCorrector` and the
+    :class:`~satpy.composites.DayNightCompositor`, otherwise each build
+    their own dask graph for them.  While a provider is active (see
+    :func:`use_geometry_provider`), :func:`get_cos_sza`, :func:`get_angles`
+    and :func:`get_satellite_zenith_angle` build the angle arrays once per
+    area, start time and chunk size and reuse them afterwards.  Every
+    :class:`~satpy.scene.Scene` has a provider that is active while
+    composites are generated.
+
+    Only areas of the types in ``HASHABLE_GEOMETRIES`` are cached, angles
+    for other geometries are generated on every request.
+
+    """
+
+    def __init__(self):
+        """Initialize an empty provider."""
+        self._cache = {}
+
+    def __len__(self):
+        """Get the number of cached angle arrays."""
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all cached angle arrays."""
+        self._cache.clear()
+
+    def get_cos_sza(self, data_arr: xr.DataArray) -> xr.DataArray:
+        """Get the cosine of the solar zenith angle, see :func:`get_cos_sza`."""
+        return self._get_cached(_get_cos_sza_from_data_arr, data_arr, data_arr.dtype)
+
+    def get_sun_angles(self, data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+        """Get the solar azimuth and zenith angles."""
+        return self._get_cached(_get_sun_angles_from_data_arr, data_arr)
+
+    def get_sensor_angles(self, data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+        """Get the sensor azimuth and zenith angles."""
+        preference = satpy.config.get("sensor_angles_position_preference", "actual")
+        sat_pos = get_satpos(data_arr, preference=preference)
+        return self._get_cached(_get_sensor_angles_from_data_arr, data_arr, sat_pos, preference)
+
+    def _get_cached(self, func, data_arr, *extra_key):
+        area = data_arr.attrs["area"]
+        if not isinstance(area, HASHABLE_GEOMETRIES):
+            return func(data_arr)
+        key = (func.__name__, area, data_arr.attrs["start_time"],
+               _geo_chunks_from_data_arr(data_arr)) + extra_key
+        if key not in self._cache:
+            self._cache[key] = func(data_arr)
+        return _shallow_copy_angles(self._cache[key])
+
+
+def _shallow_copy_angles(angles):
+    # callers may modify the returned DataArrays in-place
+    if isinstance(angles, tuple):
+        return tuple(angle.copy(deep=False) for angle in angles)
+    return angles.copy(deep=False)
+
+
+_active_geometry_provider: ContextVar[Optional[GeometryProvider]] = ContextVar(
+    "geometry_provider", default=None)
+
+
+@contextmanager
+def use_geometry_provider(provider: GeometryProvider):
+    """Share the angles of ``provider`` with everything inside the context."""
+    token = _active_geometry_provider.set(provider)
+    try:
+        yield provider
+    finally:
+        _active_geometry_provider.reset(token)
+
+
 class ZarrCacheHelper:
     """Helper for caching function results to on-disk zarr arrays.
 
@@ -397,10 +475,20 @@ def get_satellite_zenith_angle(data_arr: xr.DataArray) -> xr.DataArray:
 def get_cos_sza(data_arr: xr.DataArray) -> xr.DataArray:
     """Generate the cosine of the solar zenith angle for the provided data.
 
+    If a :class:`GeometryProvider` is active, the result is shared with other
+    requests for the same area.
+
     Returns:
         DataArray with the same shape as ``data_arr``.
 
     """
+    provider = _active_geometry_provider.get()
+    if provider is not None:
+        return provider.get_cos_sza(data_arr)
+    return _get_cos_sza_from_data_arr(data_arr)
+
+
+def _get_cos_sza_from_data_arr(data_arr: xr.DataArray) -> xr.DataArray:
     chunks = _geo_chunks_from_data_arr(data_arr)
     lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
     if lons.dtype != data_arr.dtype and np.issubdtype(data_arr.dtype, np.floating):
@@ -421,6 +509,13 @@ def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto"
 
 
 def _get_sun_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+    provider = _active_geometry_provider.get()
+    if provider is not None:
+        return provider.get_sun_angles(data_arr)
+    return _get_sun_angles_from_data_arr(data_arr)
+
+
+def _get_sun_angles_from_data_arr(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
     chunks = _geo_chunks_from_data_arr(data_arr)
     lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
     suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats,
@@ -462,6 +557,13 @@ def _get_sun_azimuth_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.
 
 
 def _get_sensor_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+    provider = _active_geometry_provider.get()
+    if provider is not None:
+        return provider.get_sensor_angles(data_arr)
+    return _get_sensor_angles_from_data_arr(data_arr)
+
+
+def _get_sensor_angles_from_data_arr(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
     preference = satpy.config.get("sensor_angles_position_preference", "actual")
     sat_lon, sat_lat, sat_alt = get_satpos(data_arr, preference=preference)
     area_def = data_arr.attrs["area"]
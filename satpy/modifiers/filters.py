@@ -1,15 +1,34 @@
 """Tests for image filters."""
 import logging
+import warnings
 
+import dask.array as da
+import numpy as np
 import xarray as xr
 
 from satpy.modifiers import ModifierBase
 
 logger = logging.getLogger(__name__)
 
+# scipy/dask-image modes and their dask.array.overlap boundary equivalents
+_OVERLAP_BOUNDARIES = {
+    "reflect": "reflect",
+    "nearest": "nearest",
+    "wrap": "periodic",
+}
+
 
 class Median(ModifierBase):
-    """Apply a median filter to the band."""
+    """Apply a median filter to the band.
+
+    For 2D data and a square or rectangular kernel of odd size, the filter is
+    applied chunk by chunk with :func:`dask.array.map_overlap`, using the
+    kernel radius as overlap.  Integer data with few distinct values per
+    chunk, such as categorical products, use a histogram based median.
+    NaN values are ignored, a pixel is NaN only if all values in its
+    kernel are NaN.  For other parameters, such as a ``footprint``, the
+    filtering is delegated to dask-image's ``median_filter``.
+    """
 
     def __init__(self, median_filter_params, **kwargs):  # noqa: D417
         """Create the instance.
@@ -24,11 +43,102 @@ class Median(ModifierBase):
 
     def __call__(self, arrays, **info):
         """Get the median filtered band."""
-        from dask_image.ndfilters import median_filter
-
         data = arrays[0]
         logger.debug(f"Apply median filtering with parameters {self.median_filter_params}.")
-        res = xr.DataArray(median_filter(data.data, **self.median_filter_params),
-                           dims=data.dims, attrs=data.attrs, coords=data.coords)
+        if _supports_overlap_median(data.ndim, **self.median_filter_params):
+            filtered = median_filter(da.asarray(data.data), **self.median_filter_params)
+        else:
+            from dask_image.ndfilters import median_filter as dask_image_median_filter
+            filtered = dask_image_median_filter(data.data, **self.median_filter_params)
+        res = xr.DataArray(filtered, dims=data.dims, attrs=data.attrs, coords=data.coords)
         self.apply_modifier_info(data, res)
         return res
+
+
+def _supports_overlap_median(ndim, size=None, mode="reflect", **kwargs):
+    if ndim != 2 or size is None or kwargs or mode not in _OVERLAP_BOUNDARIES:
+        return False
+    return all(s % 2 == 1 for s in _get_kernel_size(size))
+
+
+def _get_kernel_size(size):
+    if np.isscalar(size):
+        return (int(size), int(size))
+    return tuple(int(s) for s in size)
+
+
+def median_filter(data, size, mode="reflect"):
+    """Median filter 2D dask array ``data`` chunk by chunk.
+
+    Args:
+        data: 2D dask array to filter.
+        size: Odd size of the kernel, as an integer or a ``(rows, cols)``
+            tuple.
+        mode: How to extend the data beyond its edges, one of
+            ``"reflect"``, ``"nearest"`` or ``"wrap"`` as in
+            :func:`scipy.ndimage.median_filter`.
+
+    Returns:
+        Filtered dask array with the same chunks and dtype as ``data``.
+    """
+    size = _get_kernel_size(size)
+    depth = tuple(s // 2 for s in size)
+    return da.map_overlap(_median_filter_block, data, depth=depth,
+                          boundary=_OVERLAP_BOUNDARIES[mode],
+                          dtype=data.dtype, meta=np.array((), dtype=data.dtype),
+                          size=size)
+
+
+def _median_filter_block(block, size):
+    """Median filter a block that is padded by the kernel radius on all sides."""
+    (ky, kx) = size
+    if min(block.shape[0] - ky, block.shape[1] - kx) < 0:
+        # dask probes the function with empty blocks
+        return block.copy()
+    if np.issubdtype(block.dtype, np.integer) and np.unique(block).size <= ky * kx:
+        filtered = _histogram_median(block, size)
+    else:
+        filtered = _sorting_median(block, size)
+    res = block.copy()
+    res[ky // 2:ky // 2 + filtered.shape[0], kx // 2:kx // 2 + filtered.shape[1]] = filtered
+    return res
+
+
+def _sorting_median(block, size):
+    if np.issubdtype(block.dtype, np.floating) and np.isnan(block).any():
+        windows = np.lib.stride_tricks.sliding_window_view(block, size)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "All-NaN slice", RuntimeWarning)
+            return np.nanmedian(windows, axis=(-2, -1)).astype(block.dtype)
+    from scipy.ndimage import median_filter as scipy_median_filter
+    (ky, kx) = size
+    return scipy_median_filter(block, size=size)[ky // 2:block.shape[0] - ky // 2,
+                                                 kx // 2:block.shape[1] - kx // 2]
+
+
+def _histogram_median(block, size):
+    """Get the median from cumulative histograms of the kernel.
+
+    For each distinct value in the block, the number of pixels in the kernel
+    having at most that value is counted with an integral image.  The median
+    is the first value for which this count exceeds half the kernel.  This is
+    fast when there are few distinct values, independent of the kernel size.
+    """
+    values = np.unique(block)
+    median_rank = (size[0] * size[1]) // 2
+    res = np.full((block.shape[0] - size[0] + 1, block.shape[1] - size[1] + 1), values[-1], dtype=block.dtype)
+    found = np.zeros(res.shape, dtype=bool)
+    counts = np.zeros(res.shape, dtype=np.intp)
+    for value in values[:-1]:
+        counts += _box_sum(block == value, size)
+        new = ~found & (counts > median_rank)
+        res[new] = value
+        found |= new
+    return res
+
+
+def _box_sum(mask, size):
+    (ky, kx) = size
+    integral = np.pad(mask.cumsum(axis=0, dtype=np.intp).cumsum(axis=1), ((1, 0), (1, 0)))
+    return (integral[ky:, kx:] - integral[:-ky, kx:] -
+            integral[ky:, :-kx] + integral[:-ky, :-kx])
@@ -248,6 +248,18 @@ class ParallaxCorrection:
     performance, although dask should reuse identical calculations between
     multiple channels.
 
+    As an alternative to the procedure above, :meth:`corrected_dataset`
+    avoids the inversion and the subsequent nearest neighbour resampling
+    altogether.  It calculates the corrected position of each pixel as a
+    fractional row and column of the base area and then scatters each pixel
+    value directly to its corrected position, again retaining the value
+    from the highest cloud when several pixels end up in the same
+    destination.  Because the shift can never exceed the shift of a cloud
+    at the maximum height, this is done chunk by chunk with
+    :func:`dask.array.map_overlap`, using the maximum possible shift as the
+    overlap depth.  No KD-tree is needed, which makes this considerably
+    faster for large areas such as full disk imagery.
+
     """
 
     def __init__(self, base_area,
@@ -340,6 +352,132 @@ class ParallaxCorrection:
 
         return self._get_swathdef_from_lon_lat(proj_lon, proj_lat)
 
+    def corrected_dataset(self, dataset, cth_dataset,
+                          cth_resampler="nearest",
+                          cth_radius_of_influence=50000,
+                          lonlat_chunks=1024,
+                          max_height=20_000,
+                          min_elevation=5):
+        """Return the parallax corrected dataset using forward mapping.
+
+        Using the cloud top heights provided in ``cth_dataset``, shift each
+        pixel of ``dataset`` to the position where it would have been seen
+        if it had been viewed from straight above.  Contrary to
+        :meth:`corrected_area`, this does not construct a
+        :class:`~pyresample.geometry.SwathDefinition` to resample from, but
+        moves the pixels directly on the grid of the base area.  Pixels that
+        no value is moved to are set to NaN.  For details on the algorithm,
+        see the class docstring.
+
+        Args:
+            dataset (:class:`~xarray.DataArray`): Dataset to be corrected, on
+                the base area and with dimensions ``(y, x)``.
+            cth_dataset (:class:`~xarray.DataArray`): Cloud top height in
+                meters, see :meth:`corrected_area`.
+            cth_resampler (string, optional): Resampler to use when resampling the
+                (cloud top) height to the base area.  Defaults to "nearest".
+            cth_radius_of_influence (number, optional): Radius of influence to use when
+                resampling the (cloud top) height to the base area.  Defaults
+                to 50000.
+            lonlat_chunks (int, optional): Chunking to use when calculating
+                lon/lats.  This also determines the chunks in which the pixels
+                are shifted.  Defaults to 1024.
+            max_height (number, optional): Maximum (cloud top) height in
+                meters.  Higher values are clipped to this height.  This
+                bounds the overlap between chunks.  Defaults to 20000.
+            min_elevation (number, optional): Minimum satellite elevation in
+                degrees considered when bounding the overlap between chunks.
+                Near the limb, the shift of high clouds grows without bound,
+                which would make the overlap as large as the whole image.
+                Pixels whose shift exceeds the overlap, which can only happen
+                where the satellite elevation is below this value, are left
+                uncorrected.  Defaults to 5.
+
+        Returns:
+            :class:`~xarray.DataArray` with the parallax corrected data on the
+            base area.
+        """
+        self.diagnostics.clear()
+        logger.debug("Calculating forward parallax correction using heights from "
+                     f"{cth_dataset.attrs.get('name', cth_dataset.name)!s}, "
+                     f"with base area {self.base_area.name!s}.")
+        (sat_lon, sat_lat, sat_alt_m) = _get_satpos_from_cth(cth_dataset)
+        self._check_overlap(cth_dataset)
+
+        cth_dataset = self._prepare_cth_dataset(
+                cth_dataset, resampler=cth_resampler,
+                radius_of_influence=cth_radius_of_influence,
+                lonlat_chunks=lonlat_chunks)
+
+        (base_lon, base_lat) = self.base_area.get_lonlats(chunks=lonlat_chunks)
+        base_lon = da.asarray(base_lon)
+        base_lat = da.asarray(base_lat)
+        cth = da.clip(da.asarray(cth_dataset.data).rechunk(base_lon.chunks), 0, max_height)
+        data = da.asarray(dataset.data).rechunk(base_lon.chunks)
+
+        (row_shift, col_shift) = self._get_forward_shift(
+                sat_lon, sat_lat, sat_alt_m, base_lon, base_lat, cth)
+        depth = self._get_max_shift_pixels(
+                sat_lon, sat_lat, sat_alt_m, max_height, min_elevation=min_elevation)
+        logger.debug(f"Shifting pixels with an overlap of {depth:d} pixels between chunks.")
+        if depth > min(min(data.chunks[0]), min(data.chunks[1])):
+            warnings.warn(
+                f"Overlap of {depth:d} pixels for parallax correction exceeds the chunk "
+                "size, consider larger lonlat_chunks or a larger min_elevation.",
+                stacklevel=2)
+        corrected = da.map_overlap(
+                _forward_shift_block, data, row_shift, col_shift, cth,
+                depth=depth, boundary="none", max_shift=depth,
+                dtype=np.result_type(data.dtype, np.float32),
+                meta=np.array((), dtype=np.result_type(data.dtype, np.float32)))
+        if self.debug_mode:
+            self.diagnostics["row_shift"] = row_shift
+            self.diagnostics["col_shift"] = col_shift
+            self.diagnostics["depth"] = depth
+        return dataset.copy(data=corrected)
+
+    def _get_forward_shift(self, sat_lon, sat_lat, sat_alt_m, base_lon, base_lat, cth):
+        """Calculate the parallax shift in rows and columns of the base area."""
+        (corrected_lon, corrected_lat) = get_parallax_corrected_lonlats(
+                sat_lon, sat_lat, sat_alt_m, base_lon, base_lat, cth)
+        (cols, rows) = _get_array_coordinates_from_lonlat_dask(
+                self.base_area, corrected_lon, corrected_lat)
+        base_rows = da.arange(base_lon.shape[0], chunks=base_lon.chunks[0])[:, np.newaxis]
+        base_cols = da.arange(base_lon.shape[1], chunks=base_lon.chunks[1])[np.newaxis, :]
+        return (da.round(rows) - base_rows, da.round(cols) - base_cols)
+
+    def _get_max_shift_pixels(self, sat_lon, sat_lat, sat_alt_m, max_height,
+                              min_elevation=5, stride=64):
+        """Estimate the largest shift in pixels for the base area.
+
+        Calculate the shift for a cloud at ``max_height`` on a coarse grid
+        including the edges of the base area, ignoring points where the
+        satellite elevation is below ``min_elevation``.  The largest shift
+        occurs where the satellite elevation is lowest, which is at the edge
+        or varies smoothly within the area, so a coarse grid gives a
+        sufficient estimate.  One pixel is added as a safety margin.
+        """
+        (height, width) = self.base_area.shape
+        rows = np.unique(np.r_[np.arange(0, height, stride), height - 1])
+        cols = np.unique(np.r_[np.arange(0, width, stride), width - 1])
+        (cols, rows) = np.meshgrid(cols, rows)
+        (lon, lat) = self.base_area.get_lonlat_from_array_coordinates(cols, rows)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=RuntimeWarning)
+            valid = np.isfinite(lon) & np.isfinite(lat)
+            valid[valid] = _get_satellite_elevation(
+                    sat_lon, sat_lat, sat_alt_m, lon[valid], lat[valid]) >= min_elevation
+            if not valid.any():
+                return 0
+            (corrected_lon, corrected_lat) = get_parallax_corrected_lonlats(
+                    sat_lon, sat_lat, sat_alt_m, lon[valid], lat[valid],
+                    np.full(valid.sum(), max_height, dtype=np.float64))
+            (corr_cols, corr_rows) = self.base_area.get_array_coordinates_from_lonlat(
+                    corrected_lon, corrected_lat)
+            max_shift = np.nanmax(np.abs(np.r_[corr_rows - rows[valid], corr_cols - cols[valid]]),
+                                  initial=0)
+        return min(int(np.ceil(max_shift)) + 1, max(height, width))
+
     @staticmethod
     def _get_swathdef_from_lon_lat(lon, lat):
         """Return a SwathDefinition from lon/lat.
@@ -496,6 +634,21 @@ class ParallaxCorrectionModifier(ModifierBase):
         Radius of influence to use when resampling the dataset onto the
         swathdefinition describing the parallax-corrected area.  Defaults to
         50000.  This always uses nearest neighbour resampling.
+    engine
+        Either ``"swath"`` (the default) or ``"forward"``.  With ``"swath"``,
+        the dataset is resampled onto the swath returned by
+        :meth:`ParallaxCorrection.corrected_area`.  With ``"forward"``, pixels
+        are shifted directly to their corrected position with
+        :meth:`ParallaxCorrection.corrected_dataset`, which avoids the KD-tree
+        and is much faster for large areas.  In this case,
+        ``dataset_radius_of_influence`` is not used.
+    max_height
+        Only used with the ``"forward"`` engine.  Maximum (cloud top) height
+        in meters, higher values are clipped.  Defaults to 20000.
+    min_elevation
+        Only used with the ``"forward"`` engine.  Minimum satellite elevation
+        in degrees considered when bounding the overlap between chunks.
+        Pixels closer to the limb may be left uncorrected.  Defaults to 5.
 
     Alternately, you can use the lower-level API directly with the
     :class:`ParallaxCorrection` class, which may be more efficient if multiple
@@ -515,20 +668,36 @@ class ParallaxCorrectionModifier(ModifierBase):
         (to_be_corrected, cth) = projectables
         base_area = to_be_corrected.attrs["area"]
         corrector = self._get_corrector(base_area)
+        engine = self.attrs.get("engine", "swath")
+        if engine == "forward":
+            res = corrector.corrected_dataset(
+                    to_be_corrected, cth,
+                    cth_resampler=self.attrs.get("cth_resampler", "nearest"),
+                    cth_radius_of_influence=self.attrs.get("cth_radius_of_influence", 50_000),
+                    lonlat_chunks=self.attrs.get("lonlat_chunks", 1024),
+                    max_height=self.attrs.get("max_height", 20_000),
+                    min_elevation=self.attrs.get("min_elevation", 5),
+                    )
+        elif engine == "swath":
+            res = self._resample_to_corrected_area(corrector, to_be_corrected, cth)
+        else:
+            raise ValueError(f"Unknown parallax correction engine: {engine!r}")
+        res.attrs["area"] = to_be_corrected.attrs["area"]
+        self.apply_modifier_info(to_be_corrected, res)
+
+        return res
+
+    def _resample_to_corrected_area(self, corrector, to_be_corrected, cth):
         plax_corr_area = corrector(
                 cth,
                 cth_resampler=self.attrs.get("cth_resampler", "nearest"),
                 cth_radius_of_influence=self.attrs.get("cth_radius_of_influence", 50_000),
                 lonlat_chunks=self.attrs.get("lonlat_chunks", 1024),
                 )
-        res = resample_dataset(
+        return resample_dataset(
                 to_be_corrected, plax_corr_area,
                 radius_of_influence=self.attrs.get("dataset_radius_of_influence", 50_000),
                 fill_value=np.nan)
-        res.attrs["area"] = to_be_corrected.attrs["area"]
-        self.apply_modifier_info(to_be_corrected, res)
-
-        return res
 
     def _get_corrector(self, base_area):
         # only pass on those attributes that are arguments by
@@ -551,3 +720,47 @@ def _get_satpos_from_cth(cth_dataset):
     (sat_lon, sat_lat, sat_alt_km) = get_satpos(
             cth_dataset, use_tle=True)
     return (sat_lon, sat_lat, sat_alt_km * 1000)
+
+
+def _get_array_coordinates_from_lonlat_dask(area, lon, lat):
+    """Get fractional array coordinates (cols, rows) of ``area`` block by block."""
+    def _coords_block(lon_block, lat_block):
+        (cols, rows) = area.get_array_coordinates_from_lonlat(lon_block, lat_block)
+        # pyresample returns scalars for single-pixel blocks
+        return np.stack([np.reshape(cols, lon_block.shape), np.reshape(rows, lon_block.shape)])
+
+    coords = da.map_blocks(
+            _coords_block, lon, lat, new_axis=0,
+            chunks=((2,),) + lon.chunks, dtype=np.float64,
+            meta=np.array((), dtype=np.float64))
+    return (coords[0], coords[1])
+
+
+def _forward_shift_block(data, row_shift, col_shift, cth, max_shift=None):
+    """Move each pixel in a block by its parallax shift.
+
+    Where several pixels are moved to the same destination, the pixel with
+    the highest cloud top height is retained.  Destination pixels that no
+    pixel is moved to are set to NaN, as are pixels that would be moved
+    outside the block.  Pixels with a shift larger than ``max_shift`` are
+    not moved.
+    """
+    out = np.full(data.shape, np.nan, dtype=np.result_type(data.dtype, np.float32))
+    valid = np.isfinite(row_shift) & np.isfinite(col_shift)
+    if max_shift is not None:
+        too_far = valid & ((np.abs(row_shift) > max_shift) | (np.abs(col_shift) > max_shift))
+        row_shift = np.where(too_far, 0, row_shift)
+        col_shift = np.where(too_far, 0, col_shift)
+    (src_rows, src_cols) = np.nonzero(valid)
+    dst_rows = src_rows + row_shift[valid].astype(np.intp)
+    dst_cols = src_cols + col_shift[valid].astype(np.intp)
+    inside = ((dst_rows >= 0) & (dst_rows < data.shape[0]) &
+              (dst_cols >= 0) & (dst_cols < data.shape[1]))
+    values = data[valid][inside]
+    # highest clouds first, so np.unique keeps those
+    order = np.argsort(cth[valid][inside], kind="stable")[::-1]
+    dst_flat = np.ravel_multi_index(
+            (dst_rows[inside][order], dst_cols[inside][order]), data.shape)
+    (dst_flat, first) = np.unique(dst_flat, return_index=True)
+    out.flat[dst_flat] = values[order][first]
+    return out
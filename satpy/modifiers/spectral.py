@@ -18,6 +18,8 @@
 """Modifier classes dealing with spectral domain changes or corrections."""
 
 import logging
+import threading
+from functools import lru_cache
 
 import xarray as xr
 
@@ -36,6 +38,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# pyspectral calculators keep the results of the last computation as state
+_CALCULATOR_LOCK = threading.Lock()
+
 
 class NIRReflectance(ModifierBase):
     """Get the reflective part of NIR bands."""
@@ -122,18 +127,29 @@ class NIRReflectance(ModifierBase):
     def _get_reflectance_as_dask(self, da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata):
         """Calculate 3.x reflectance in % with pyspectral from dask arrays."""
         reflectance_3x_calculator = self._init_reflectance_calculator(metadata)
-        return reflectance_3x_calculator.reflectance_from_tbs(da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4) * 100
+        with _CALCULATOR_LOCK:
+            return reflectance_3x_calculator.reflectance_from_tbs(
+                da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4) * 100
 
     def _init_reflectance_calculator(self, metadata):
-        """Initialize the 3.x reflectance derivations."""
+        """Initialize the 3.x reflectance derivations.
+
+        Calculators are shared within the process, as creating them loads the
+        relative spectral responses, the solar flux and the brightness
+        temperature to radiance lookup table from disk.
+        """
         if not Calculator:
             logger.info("Couldn't load pyspectral")
             raise ImportError("No module named pyspectral.near_infrared_reflectance")
 
-        reflectance_3x_calculator = Calculator(metadata["platform_name"], metadata["sensor"], metadata["name"],
-                                               sunz_threshold=self.sun_zenith_threshold,
-                                               masking_limit=self.masking_limit)
-        return reflectance_3x_calculator
+        args = (metadata["platform_name"], metadata["sensor"], metadata["name"],
+                self.sun_zenith_threshold, self.masking_limit)
+        try:
+            hash(args)
+        except TypeError:
+            # unhashable metadata can't be used to share the calculator
+            return _get_reflectance_calculator.__wrapped__(*args)
+        return _get_reflectance_calculator(*args)
 
 
 class NIREmissivePartFromReflectance(NIRReflectance):
@@ -177,5 +193,13 @@ class NIREmissivePartFromReflectance(NIRReflectance):
         # Use the nir and thermal ir brightness temperatures and derive the reflectance using
         # PySpectral. The reflectance is stored internally in PySpectral and
         # needs to be derived first in order to get the emissive part.
-        reflectance_3x_calculator.reflectance_from_tbs(da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4)
-        return reflectance_3x_calculator.emissive_part_3x()
+        with _CALCULATOR_LOCK:
+            reflectance_3x_calculator.reflectance_from_tbs(da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4)
+            return reflectance_3x_calculator.emissive_part_3x()
+
+
+@lru_cache(maxsize=None)
+def _get_reflectance_calculator(platform_name, sensor, band_name, sunz_threshold, masking_limit):
+    return Calculator(platform_name, sensor, band_name,
+                      sunz_threshold=sunz_threshold,
+                      masking_limit=masking_limit)
@@ -21,10 +21,12 @@ from __future__ import annotations
 import copy
 import logging
 import warnings
+from collections import deque
 from queue import Queue
-from threading import Thread
+from threading import Condition, Thread
 from typing import Callable, Collection, Mapping
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
@@ -115,6 +117,88 @@ class _GroupAliasGenerator:
         return dataset.attrs["_satpy_id"].to_dict().keys()
 
 
+def _downscale_dataset(ds, factor):
+    """Reduce the resolution of ``ds`` by an integer ``factor`` in the dask graph.
+
+    Floating point data are averaged over blocks of ``factor`` by ``factor``
+    pixels, the last rows and columns not filling a block are dropped. Integer
+    data, like categorical products, are subsampled instead of averaged.
+    """
+    if factor is None or factor == 1:
+        return ds
+    y_size = ds.sizes["y"] - ds.sizes["y"] % factor
+    x_size = ds.sizes["x"] - ds.sizes["x"] % factor
+    ds = ds.isel(y=slice(0, y_size), x=slice(0, x_size))
+    if np.issubdtype(ds.dtype, np.floating):
+        new_ds = ds.coarsen(y=factor, x=factor).mean(keep_attrs=True)
+    else:
+        new_ds = ds.isel(y=slice(None, None, factor), x=slice(None, None, factor))
+    area = ds.attrs.get("area")
+    if area is not None:
+        new_ds.attrs["area"] = area[:y_size, :x_size].aggregate(y=factor, x=factor)
+    return new_ds
+
+
+class _FrameBuffer:
+    """Queue of computed animation frames bounded by their total size in bytes.
+
+    An item is always accepted when the buffer is empty, so a single item
+    larger than the limit doesn't block the pipeline.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = deque()
+        self._nbytes = 0
+        self._closed = False
+        self._cond = Condition()
+
+    def put(self, item, nbytes):
+        """Add ``item`` of size ``nbytes``, waiting for enough space.
+
+        Returns:
+            False if the buffer was closed and the item was dropped.
+
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed or not self._items or
+                                self._nbytes + nbytes <= self.max_bytes)
+            if self._closed:
+                return False
+            self._items.append((item, nbytes))
+            self._nbytes += nbytes
+            self._cond.notify_all()
+            return True
+
+    def get(self):
+        """Remove and return the oldest item, waiting for one if needed."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._items)
+            item, nbytes = self._items.popleft()
+            self._nbytes -= nbytes
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        """Stop accepting new items and wake up the waiting producer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+def _compute_frames_to_buffer(frames_to_write, frame_buffer):
+    """Compute the frames one time step at a time into the buffer, ending with ``None``."""
+    try:
+        for frame_arrays in frames_to_write:
+            computed = dask.compute(*frame_arrays)
+            if not frame_buffer.put(computed, sum(arr.nbytes for arr in computed)):
+                return
+    except Exception as err:
+        frame_buffer.put(err, 0)
+        return
+    frame_buffer.put(None, 0)
+
+
 class _SceneGenerator(object):
     """Fancy way of caching Scenes from a generator."""
 
@@ -458,12 +542,12 @@ class MultiScene(object):
         else:
             self._simple_save_datasets(scenes, **kwargs)
 
-    def _get_animation_info(self, all_datasets, filename, fill_value=None):
+    def _get_animation_info(self, all_datasets, filename, fill_value=None, downscale=None):
         """Determine filename and shape of animation to be created."""
         valid_datasets = [ds for ds in all_datasets if ds is not None]
         first_dataset = valid_datasets[0]
         last_dataset = valid_datasets[-1]
-        first_img = get_enhanced_image(first_dataset)
+        first_img = get_enhanced_image(_downscale_dataset(first_dataset, downscale))
         first_img_data = first_img.finalize(fill_value=fill_value)[0]
         shape = tuple(first_img_data.sizes.get(dim_name)
                       for dim_name in ("y", "x", "bands"))
@@ -493,11 +577,12 @@ class MultiScene(object):
                 deco["text"]["txt"] = deco["text"]["txt"].format(**ds.attrs)
         return deco_local
 
-    def _get_single_frame(self, ds, enh_args, fill_value):
+    def _get_single_frame(self, ds, enh_args, fill_value, downscale=None):
         """Get single frame from dataset.
 
         Yet a single image frame from a dataset.
         """
+        ds = _downscale_dataset(ds, downscale)
         enh_args = enh_args.copy()  # don't change caller's dict!
         if "decorate" in enh_args:
             enh_args["decorate"] = self._format_decoration(
@@ -512,7 +597,7 @@ class MultiScene(object):
         return data
 
     def _get_animation_frames(self, all_datasets, shape, fill_value=None,
-                              ignore_missing=False, enh_args=None):
+                              ignore_missing=False, enh_args=None, downscale=None):
         """Create enhanced image frames to save to a file."""
         if enh_args is None:
             enh_args = {}
@@ -524,7 +609,7 @@ class MultiScene(object):
                 data = da.zeros(shape, dtype=np.uint8, chunks=shape)
                 data = xr.DataArray(data)
             else:
-                data = self._get_single_frame(ds, enh_args, fill_value)
+                data = self._get_single_frame(ds, enh_args, fill_value, downscale=downscale)
             yield data.data
 
     def _get_client(self, client=True):
@@ -591,9 +676,34 @@ class MultiScene(object):
                 w = writers[frame_key]
                 w.append_data(product_frame.compute())
 
+    @staticmethod
+    def _streaming_frame_compute(writers, frame_keys, frames_to_write, max_buffer_bytes):
+        """Compute the next frames in a background thread while the current ones are written.
+
+        The computed frames waiting to be written are limited to
+        ``max_buffer_bytes`` in total, the computation waits for the writing
+        when this limit is reached.
+        """
+        frame_buffer = _FrameBuffer(max_buffer_bytes)
+        compute_thread = Thread(target=_compute_frames_to_buffer, args=(frames_to_write, frame_buffer),
+                                daemon=True)
+        compute_thread.start()
+        try:
+            while True:
+                computed = frame_buffer.get()
+                if computed is None:
+                    break
+                if isinstance(computed, Exception):
+                    raise computed
+                for frame_key, frame in zip(frame_keys, computed):
+                    writers[frame_key].append_data(frame)
+        finally:
+            frame_buffer.close()
+            compute_thread.join()
+
     def _get_writers_and_frames(
             self, filename, datasets, fill_value, ignore_missing,
-            enh_args, imio_args):
+            enh_args, imio_args, downscale=None):
         """Get writers and frames.
 
         Helper function for save_animation.
@@ -626,9 +736,10 @@ class MultiScene(object):
 
             all_datasets = scene_gen[dataset_id]
             info_datasets = [scn.get(dataset_id) for scn in info_scenes]
-            this_fn, shape, this_fill = self._get_animation_info(info_datasets, filename, fill_value=fill_value)
+            this_fn, shape, this_fill = self._get_animation_info(info_datasets, filename, fill_value=fill_value,
+                                                                 downscale=downscale)
             data_to_write = self._get_animation_frames(
-                all_datasets, shape, this_fill, ignore_missing, enh_args)
+                all_datasets, shape, this_fill, ignore_missing, enh_args, downscale=downscale)
 
             writer = imageio.get_writer(this_fn, **imio_args)
             frames[dataset_id] = data_to_write
@@ -637,7 +748,7 @@ class MultiScene(object):
 
     def save_animation(self, filename, datasets=None, fps=10, fill_value=None,
                        batch_size=1, ignore_missing=False, client=True,
-                       enh_args=None, **kwargs):
+                       enh_args=None, max_buffer_bytes=None, downscale=None, **kwargs):
         """Save series of Scenes to movie (MP4) or GIF formats.
 
         Supported formats are dependent on the `imageio` library and are
@@ -658,6 +769,13 @@ class MultiScene(object):
         option below). If the distributed library is not available then frames
         will be generated one at a time, one product at a time.
 
+        For long animations, ``max_buffer_bytes`` enables a streaming pipeline
+        where the frames of the next time steps are computed in a background
+        thread while the current frames are written, with at most
+        ``max_buffer_bytes`` of computed frames waiting to be written. Memory
+        use then stays bounded to about this buffer plus the frames being
+        computed and written, whatever the number of frames.
+
         Args:
             filename (str): Filename to save to. Can include python string
                             formatting keys from dataset ``.attrs``
@@ -691,6 +809,14 @@ class MultiScene(object):
                 ``enh_args={"decorate": {"decorate": [{"text": {"txt":
                 "{start_time:%H:%M}"}}]}`` will replace the decorated text
                 accordingly.
+            max_buffer_bytes (int): Optional, compute the frames with the
+                streaming pipeline described above, buffering at most this
+                number of bytes of computed frames. The frames are computed
+                with the current dask scheduler and ``client`` and
+                ``batch_size`` are not used.
+            downscale (int): Optional, reduce the resolution of the datasets
+                by this factor before they are enhanced, averaging floating
+                point data and subsampling integer data.
             kwargs: Additional keyword arguments to pass to
                    `imageio.get_writer`.
 
@@ -700,16 +826,19 @@ class MultiScene(object):
 
         (writers, frames) = self._get_writers_and_frames(
             filename, datasets, fill_value, ignore_missing,
-            enh_args, imio_args={"fps": fps, **kwargs})
+            enh_args, imio_args={"fps": fps, **kwargs}, downscale=downscale)
 
-        client = self._get_client(client=client)
         # get an ordered list of frames
         frame_keys, frames_to_write = list(zip(*frames.items()))
         frames_to_write = zip(*frames_to_write)
-        if client is not None:
-            self._distribute_frame_compute(writers, frame_keys, frames_to_write, client, batch_size=batch_size)
+        if max_buffer_bytes is not None:
+            self._streaming_frame_compute(writers, frame_keys, frames_to_write, max_buffer_bytes)
         else:
-            self._simple_frame_compute(writers, frame_keys, frames_to_write)
+            client = self._get_client(client=client)
+            if client is not None:
+                self._distribute_frame_compute(writers, frame_keys, frames_to_write, client, batch_size=batch_size)
+            else:
+                self._simple_frame_compute(writers, frame_keys, frames_to_write)
 
         for writer in writers.values():
             writer.close()
@@ -32,12 +32,26 @@ import yaml
 from yaml import UnsafeLoader
 
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
-
-from .yaml_reader import AbstractYAMLReader
-from .yaml_reader import load_yaml_configs as load_yaml_reader_configs
+from satpy.instrumentation import record_stage
 
 LOG = logging.getLogger(__name__)
 
+# imported from yaml_reader on first access (PEP 562) as it needs xarray and pyresample
+_LAZY_ATTRIBUTES = {
+    "AbstractYAMLReader": "AbstractYAMLReader",
+    "READER_CONFIG_CACHE": "READER_CONFIG_CACHE",
+    "load_yaml_reader_configs": "load_yaml_configs",
+}
+
+
+def __getattr__(name):
+    try:
+        attr_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from satpy.readers import yaml_reader
+    return getattr(yaml_reader, attr_name)
+
 
 # Old Name -> New Name
 PENDING_OLD_READER_NAMES = {"fci_l1c_fdhsi": "fci_l1c_nc", "viirs_l2_cloud_mask_nc": "viirs_edr"}
@@ -305,12 +319,16 @@ def _get_keys_with_empty_values(grp):
 
 def read_reader_config(config_files, loader=UnsafeLoader):
     """Read the reader `config_files` and return the extracted reader metadata."""
-    reader_config = load_yaml_reader_configs(*config_files, loader=loader)
+    from satpy.readers.yaml_reader import load_yaml_configs
+
+    reader_config = load_yaml_configs(*config_files, loader=loader)
     return reader_config["reader"]
 
 
 def load_reader(reader_configs, **reader_kwargs):
     """Import and setup the reader from *reader_info*."""
+    from satpy.readers.yaml_reader import AbstractYAMLReader
+
     return AbstractYAMLReader.from_config_files(*reader_configs, **reader_kwargs)
 
 
@@ -390,15 +408,18 @@ def available_readers(as_dict=False, yaml_loader=UnsafeLoader):
         a list of dictionaries including additionally reader information is returned.
 
     """
+    from satpy.readers.yaml_reader import READER_CONFIG_CACHE
+
     readers = []
-    for reader_configs in configs_for_reader():
-        try:
-            reader_info = read_reader_config(reader_configs, loader=yaml_loader)
-        except (KeyError, IOError, yaml.YAMLError):
-            LOG.debug("Could not import reader config from: %s", reader_configs)
-            LOG.debug("Error loading YAML", exc_info=True)
-            continue
-        readers.append(reader_info if as_dict else reader_info["name"])
+    with READER_CONFIG_CACHE.deferred_writes():
+        for reader_configs in configs_for_reader():
+            try:
+                reader_info = read_reader_config(reader_configs, loader=yaml_loader)
+            except (KeyError, IOError, yaml.YAMLError):
+                LOG.debug("Could not import reader config from: %s", reader_configs)
+                LOG.debug("Error loading YAML", exc_info=True)
+                continue
+            readers.append(reader_info if as_dict else reader_info["name"])
     if as_dict:
         readers = sorted(readers, key=lambda reader_info: reader_info["name"])
     else:
@@ -480,12 +501,15 @@ def find_files_and_readers(start_time=None, end_time=None, base_dir=None,
         filter_parameters["end_time"] = end_time
     reader_kwargs["filter_parameters"] = filter_parameters
 
-    for reader_configs in configs_for_reader(reader):
-        (reader_instance, loadables, this_sensor_supported) = _get_loadables_for_reader_config(
-                base_dir, reader, sensor, reader_configs, reader_kwargs, fs)
-        sensor_supported = sensor_supported or this_sensor_supported
-        if loadables:
-            reader_files[reader_instance.name] = list(loadables)
+    from satpy.readers.yaml_reader import READER_CONFIG_CACHE
+
+    with READER_CONFIG_CACHE.deferred_writes():
+        for reader_configs in configs_for_reader(reader):
+            (reader_instance, loadables, this_sensor_supported) = _get_loadables_for_reader_config(
+                    base_dir, reader, sensor, reader_configs, reader_kwargs, fs)
+            sensor_supported = sensor_supported or this_sensor_supported
+            if loadables:
+                reader_files[reader_instance.name] = list(loadables)
 
     if sensor and not sensor_supported:
         raise ValueError("Sensor '{}' not supported by any readers".format(sensor))
@@ -569,9 +593,10 @@ def load_readers(filenames=None, reader=None, reader_kwargs=None):
 
         loadables = reader_instance.select_files_from_pathnames(readers_files)
         if loadables:
-            reader_instance.create_storage_items(
-                    loadables,
-                    fh_kwargs=reader_kwargs_without_filter[None if reader is None else reader[idx]])
+            with record_stage("reader", reader_instance.name, files=len(loadables)):
+                reader_instance.create_storage_items(
+                        loadables,
+                        fh_kwargs=reader_kwargs_without_filter[None if reader is None else reader[idx]])
             reader_instances[reader_instance.name] = reader_instance
             remaining_filenames -= set(loadables)
 
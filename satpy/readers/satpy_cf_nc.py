@@ -25,6 +25,7 @@ There are several readers using the same satpy_cf_nc.py reader.
 
 * Generic reader ``satpy_cf_nc``
 * EUMETSAT GAC FDR reader ``avhrr_l1c_eum_gac_fdr_nc``
+* Zarr reader ``satpy_cf_zarr`` for stores written by the satpy zarr writer
 
 Generic reader
 --------------
@@ -81,6 +82,19 @@ Output:
 Notes:
     Available datasets and attributes will depend on the data saved with the cf_writer.
 
+Zarr reader
+-----------
+
+The ``satpy_cf_zarr`` reader reads the Zarr stores written by the
+:mod:`zarr writer <satpy.writers.zarr_writer>` with the same CF encoding:
+
+.. code-block:: none
+
+    '{platform_name}-{sensor}-{start_time:%Y%m%d%H%M%S}-{end_time:%Y%m%d%H%M%S}.zarr'
+
+The store is opened only once, the datasets keep the chunks they were written
+with and no data is read until it is computed.
+
 EUMETSAT AVHRR GAC FDR L1C reader
 ---------------------------------
 
@@ -178,6 +192,7 @@ Output:
 """
 import itertools
 import logging
+from functools import cached_property
 
 import xarray as xr
 from pyresample import AreaDefinition
@@ -194,6 +209,9 @@ CHUNK_SIZE = get_legacy_chunk_size()
 class SatpyCFFileHandler(BaseFileHandler):
     """File handler for Satpy's CF netCDF files."""
 
+    # chunks of the loaded datasets, None to keep the chunks of the file
+    dataset_chunks = {"y": CHUNK_SIZE, "x": CHUNK_SIZE}
+
     def __init__(self, filename, filename_info, filetype_info, numeric_name_prefix="CHANNEL_"):
         """Initialize file handler."""
         super().__init__(filename, filename_info, filetype_info)
@@ -262,9 +280,12 @@ class SatpyCFFileHandler(BaseFileHandler):
             pass
         return ds_info
 
+    def _open_dataset(self, chunks=None):
+        return xr.open_dataset(self.filename, engine=self.engine, chunks=chunks)
+
     def _dynamic_datasets(self):
         """Add information of dynamic datasets."""
-        nc = xr.open_dataset(self.filename, engine=self.engine)
+        nc = self._open_dataset()
         # get dynamic variables known to this file (that we created)
         for var_name, val in nc.data_vars.items():
             ds_info = self._assign_ds_info(var_name, val)
@@ -273,7 +294,7 @@ class SatpyCFFileHandler(BaseFileHandler):
 
     def _coordinate_datasets(self, configured_datasets=None):
         """Add information of coordinate datasets."""
-        nc = xr.open_dataset(self.filename, engine=self.engine)
+        nc = self._open_dataset()
         for var_name, val in nc.coords.items():
             ds_info = dict(val.attrs)
             ds_info["file_type"] = self.filetype_info["file_type"]
@@ -302,8 +323,7 @@ class SatpyCFFileHandler(BaseFileHandler):
     def get_dataset(self, ds_id, ds_info):
         """Get dataset."""
         logger.debug("Getting data for: %s", ds_id["name"])
-        nc = xr.open_dataset(self.filename, engine=self.engine,
-                             chunks={"y": CHUNK_SIZE, "x": CHUNK_SIZE})
+        nc = self._open_dataset(chunks=self.dataset_chunks)
         name = ds_info.get("nc_store_name", ds_id["name"])
         data = nc[ds_info.get("file_key", name)]
         if not self._dataid_attrs_equal(ds_id, data):
@@ -325,3 +345,45 @@ class SatpyCFFileHandler(BaseFileHandler):
             # with the yaml_reader NotImplementedError is raised.
             logger.debug("No AreaDefinition to load from nc file. Falling back to SwathDefinition.")
             raise NotImplementedError
+
+
+class SatpyCFZarrFileHandler(SatpyCFFileHandler):
+    """File handler for Satpy's CF Zarr stores.
+
+    The store is opened once with the chunks it was written with, so the
+    datasets, their attributes and areas are restored from the (consolidated)
+    metadata without reading any data. The datasets keep these chunks.
+
+    """
+
+    dataset_chunks = None
+
+    def __init__(self, filename, filename_info, filetype_info, numeric_name_prefix="CHANNEL_"):
+        """Initialize file handler."""
+        super().__init__(filename, filename_info, filetype_info, numeric_name_prefix=numeric_name_prefix)
+        self.engine = "zarr"
+
+    @cached_property
+    def _dataset(self):
+        return xr.open_dataset(self.filename, engine=self.engine, chunks={})
+
+    def _open_dataset(self, chunks=None):
+        # a shallow copy so that the attributes of the cached dataset stay untouched
+        dataset = self._dataset.copy()
+        if chunks:
+            dataset = dataset.chunk({dim: size for dim, size in chunks.items() if dim in dataset.dims})
+        return dataset
+
+    @cached_property
+    def _area_def(self):
+        try:
+            return AreaDefinition.from_cf(self._dataset)
+        except ValueError:
+            return None
+
+    def get_area_def(self, dataset_id):
+        """Get area definition from the CF encoded store."""
+        if self._area_def is None:
+            logger.debug("No AreaDefinition to load from zarr store. Falling back to SwathDefinition.")
+            raise NotImplementedError
+        return self._area_def
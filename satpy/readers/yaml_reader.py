@@ -42,14 +42,18 @@ except ImportError:
 
 from satpy import DatasetDict
 from satpy._compat import cache
+from satpy._config_cache import CompiledConfigCache
 from satpy.aux_download import DataDownloadMixin
 from satpy.dataset import DataID, DataQuery, get_key
+from satpy.dataset.data_dict import DataIDDict
 from satpy.dataset.dataid import default_co_keys_config, default_id_keys_config, get_keys_from_config
 from satpy.resample import add_crs_xy_coords, get_area_def
 from satpy.utils import recursive_dict_update
 
 logger = logging.getLogger(__name__)
 
+READER_CONFIG_CACHE = CompiledConfigCache("readers")
+
 
 def listify_string(something):
     """Take *something* and make it a list.
@@ -111,13 +115,27 @@ def load_yaml_configs(*config_files, loader=Loader):
         addition of `config['reader']['config_files']` (the list of
         YAML pathnames that were merged).
 
+    If the ``cache_configs`` Satpy configuration option is set, the merged
+    configuration is taken from the persistent index of compiled
+    configurations when none of the files changed since it was stored.
+
     """
+    config = READER_CONFIG_CACHE.get(config_files, _get_loader_name(loader),
+                                     lambda: _merge_yaml_configs(config_files, loader))
+    _verify_reader_info_assign_config_files(config, config_files)
+    return config
+
+
+def _get_loader_name(loader):
+    return loader.__module__ + "." + loader.__qualname__
+
+
+def _merge_yaml_configs(config_files, loader):
     config = {}
     logger.debug("Reading %s", str(config_files))
     for config_file in config_files:
         with open(config_file, "r", encoding="utf-8") as fd:
             config = recursive_dict_update(config, yaml.load(fd, Loader=loader))
-    _verify_reader_info_assign_config_files(config, config_files)
     return config
 
 
@@ -153,7 +171,7 @@ class AbstractYAMLReader(metaclass=ABCMeta):
         self._id_keys = self.info.get("data_identification_keys", default_id_keys_config)
         self._co_keys = self.info.get("coord_identification_keys", default_co_keys_config)
         self.info["filenames"] = []
-        self.all_ids = {}
+        self.all_ids = DataIDDict()
         self.load_ds_ids_from_config()
 
     @classmethod
@@ -480,7 +498,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         super().__init__(config_dict, filter_parameters, filter_filenames)
 
         self.file_handlers = {}
-        self.available_ids = {}
+        self.available_ids = DataIDDict()
         self.register_data_files()
 
     @property
@@ -680,7 +698,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
         """
         avail_datasets = self._file_handlers_available_datasets()
-        new_ids = {}
+        new_ids = DataIDDict()
         for is_avail, ds_info in avail_datasets:
             # especially from the yaml config
             coordinates = ds_info.get("coordinates")
@@ -1159,6 +1177,12 @@ class GEOSegmentYAMLReader(GEOFlippableFileYAMLReader):
     passed to :meth:`Scene.load` to control if padding is done (True by
     default). Passing `pad_data=False` will return data unpadded.
 
+    Segment files arriving after the reader was created, for example in
+    near-real-time processing, can be added with :meth:`add_segment_files`.
+    Loading the datasets again then replaces the padded empty segments with
+    the data of the new files. See :meth:`Scene.add_segments
+    <satpy.scene.Scene.add_segments>` to update the datasets of a Scene.
+
     When using this class in a reader's YAML configuration, segmented file
     types (files that may have multiple segments) should specify an extra
     ``expected_segments`` piece of file_type metadata. This tells this reader
@@ -1177,6 +1201,7 @@ class GEOSegmentYAMLReader(GEOFlippableFileYAMLReader):
         produce the correct order.
 
         """
+        self._fh_kwargs = fh_kwargs
         created_fhs = super(GEOSegmentYAMLReader, self).create_filehandlers(
             filenames, fh_kwargs=fh_kwargs)
 
@@ -1194,6 +1219,33 @@ class GEOSegmentYAMLReader(GEOFlippableFileYAMLReader):
         self._sort_segment_filehandler_by_segment_number()
         return created_fhs
 
+    def add_segment_files(self, filenames):
+        """Add the newly arrived segment files among *filenames* to the reader.
+
+        Files not matching the patterns of this reader or already known by it
+        are ignored. File handlers are created with the same keyword arguments
+        as the ones of the files the reader was created with.
+
+        Args:
+            filenames (iterable): Paths or :class:`~satpy.readers.FSFile`
+                objects of the new files.
+
+        Returns:
+            set: DataIDs of the available datasets read from the file types
+            that got new segments. These datasets have to be loaded again to
+            include the new segments.
+
+        """
+        known_files = set(self.info.get("filenames", []))
+        new_files = [filename for filename in self.select_files_from_pathnames(filenames)
+                     if filename not in known_files]
+        if not new_files:
+            return set()
+        created_fhs = self.create_filehandlers(new_files, fh_kwargs=getattr(self, "_fh_kwargs", None))
+        new_filetypes = set(created_fhs.keys())
+        return {ds_id for ds_id, ds_info in self.available_ids.items()
+                if new_filetypes & set(listify_string(ds_info["file_type"]))}
+
     def _sort_segment_filehandler_by_segment_number(self):
         if hasattr(self, "file_handlers"):
             for file_type in self.file_handlers.keys():
@@ -28,10 +28,14 @@ import xarray as xr
 from pyresample.geometry import AreaDefinition, BaseDefinition, SwathDefinition
 from xarray import DataArray
 
+from satpy._dask_graph import merge_duplicate_tasks, merge_duplicate_tasks_enabled, name_by_content
 from satpy.composites import IncompatibleAreas
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 from satpy.dataset import DataID, DataQuery, DatasetDict, combine_metadata, dataset_walker, replace_anc
 from satpy.dependency_tree import DependencyTree
+from satpy.instrumentation import record_stage
+from satpy.modifiers import ModifierBase
+from satpy.modifiers.angles import GeometryProvider, use_geometry_provider
 from satpy.node import CompositorNode, MissingDependencies, ReaderNode
 from satpy.readers import load_readers
 from satpy.resample import get_area_def, prepare_resampler, resample_dataset
@@ -41,6 +45,13 @@ from satpy.writers import load_writer
 LOG = logging.getLogger(__name__)
 
 
+def _get_compositor_stage(compositor, comp_id):
+    """Get the kind and name of the instrumentation stage of a compositor or modifier."""
+    if isinstance(compositor, ModifierBase) and comp_id.get("modifiers"):
+        return "modifier", comp_id["modifiers"][-1]
+    return "compositor", comp_id.get("name")
+
+
 def _get_area_resolution(area):
     """Attempt to retrieve resolution from AreaDefinition."""
     try:
@@ -159,6 +170,7 @@ class Scene:
         self._wishlist = set()
         self._dependency_tree = DependencyTree(self._readers)
         self._resamplers = {}
+        self._geometry_provider = GeometryProvider()
 
     @property
     def wishlist(self):
@@ -893,7 +905,10 @@ class Scene:
             self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
             kwargs = resample_kwargs.copy()
             kwargs["resampler"] = resamplers[source_area]
-            res = resample_dataset(dataset, destination_area, **kwargs)
+            with record_stage("resampler", type(kwargs["resampler"]).__name__,
+                              dataset=ds_id.get("name")) as stage:
+                res = resample_dataset(dataset, destination_area, **kwargs)
+                stage.set_output(res)
             new_datasets[ds_id] = res
             if ds_id in new_scn._datasets:
                 new_scn._datasets[ds_id] = res
@@ -914,8 +929,9 @@ class Scene:
 
     def _prepare_resampler(self, source_area, destination_area, resamplers, resample_kwargs):
         if source_area not in resamplers:
-            key, resampler = prepare_resampler(
-                source_area, destination_area, **resample_kwargs)
+            with record_stage("resampler", resample_kwargs.get("resampler") or "default", step="prepare"):
+                key, resampler = prepare_resampler(
+                    source_area, destination_area, **resample_kwargs)
             resamplers[source_area] = resampler
             self._resamplers[key] = resampler
 
@@ -1231,9 +1247,16 @@ class Scene:
         writer, save_kwargs = load_writer(writer,
                                           filename=filename,
                                           **kwargs)
-        return writer.save_dataset(self[dataset_id],
-                                   overlay=overlay, decorate=decorate,
-                                   compute=compute, **save_kwargs)
+        dataset = self[dataset_id]
+        if merge_duplicate_tasks_enabled():
+            dataset = merge_duplicate_tasks([dataset])[0]
+        with record_stage("writer", writer.name, compute=compute) as stage:
+            res = writer.save_dataset(dataset,
+                                      overlay=overlay, decorate=decorate,
+                                      compute=compute, **save_kwargs)
+            if not compute:
+                stage.set_output(res)
+        return res
 
     def save_datasets(self, writer=None, filename=None, datasets=None, compute=True,
                       **kwargs):
@@ -1293,7 +1316,13 @@ class Scene:
         writer, save_kwargs = load_writer(writer,
                                           filename=filename,
                                           **kwargs)
-        return writer.save_datasets(dataarrays, compute=compute, **save_kwargs)
+        if merge_duplicate_tasks_enabled():
+            dataarrays = merge_duplicate_tasks(dataarrays)
+        with record_stage("writer", writer.name, compute=compute, datasets=len(dataarrays)) as stage:
+            res = writer.save_datasets(dataarrays, compute=compute, **save_kwargs)
+            if not compute:
+                stage.set_output(res)
+        return res
 
     def compute(self, **kwargs):
         """Call `compute` on all Scene data arrays.
@@ -1301,10 +1330,16 @@ class Scene:
         See :meth:`xarray.DataArray.compute` for more details.
         Note that this will convert the contents of the DataArray to numpy arrays which
         may not work with all parts of Satpy which may expect dask arrays.
+        If the ``merge_duplicate_tasks`` option of the Satpy configuration is
+        ``True``, the tasks computing the same thing for several data arrays
+        are merged before computing them.
         """
         from dask import compute
         new_scn = self.copy()
-        datasets = compute(*(new_scn._datasets.values()), **kwargs)
+        datasets = list(new_scn._datasets.values())
+        if merge_duplicate_tasks_enabled():
+            datasets = merge_duplicate_tasks(datasets)
+        datasets = compute(*datasets, **kwargs)
 
         for i, k in enumerate(new_scn._datasets.keys()):
             new_scn[k] = datasets[i]
@@ -1457,6 +1492,85 @@ class Scene:
         if generate:
             self.generate_possible_composites(unload)
 
+    def add_segments(self, filenames, reader=None, **kwargs):
+        """Add newly arrived segment files and update the datasets using them.
+
+        In near-real-time processing, the segments of segmented geostationary
+        data (FCI, AHI or SEVIRI HRIT for example) arrive over several minutes.
+        Instead of waiting for the full time slot or creating a new Scene for
+        every new file, the new segment files can be added to the Scene. The
+        datasets read from file types getting new segments are loaded again,
+        replacing their padded empty segments by the new data, and only the
+        composites depending on them are generated again. Other datasets are
+        kept as they are.
+
+        Only readers based on
+        :class:`~satpy.readers.yaml_reader.GEOSegmentYAMLReader` support
+        adding segment files.
+
+        Args:
+            filenames (iterable): Paths of the new segment files.
+            reader (str): Name of the reader to add the files to. By default
+                the files are given to all readers of the Scene supporting
+                it, each of them using the files matching its patterns.
+            kwargs: Keyword arguments to pass to the reader's ``load`` method,
+                they should be the same as the ones passed to :meth:`load`.
+
+        Returns:
+            set: DataIDs of the datasets of the Scene that were updated. These
+            are the only products that need to be saved again, for example
+            with ``scn.save_datasets(datasets=updated_ids)``. Datasets
+            that can't be loaded again are removed from the Scene with a
+            warning.
+
+        """
+        new_ids = self._add_segment_files_to_readers(filenames, reader)
+        outdated_ids = self._get_datasets_depending_on(new_ids)
+        if not outdated_ids:
+            return set()
+        for ds_id in outdated_ids:
+            LOG.debug("Reloading dataset with new segments: %r", ds_id)
+            del self._datasets[ds_id]
+        kept_ids = set(self._datasets.keys())
+
+        self._read_datasets_from_storage(**kwargs)
+        # datasets that were loaded without being requested, for example
+        # with ``unload=False``
+        reader_nodes = [self._dependency_tree[ds_id] for ds_id in outdated_ids
+                        if ds_id not in self._datasets and isinstance(self._dependency_tree[ds_id], ReaderNode)]
+        self._read_dataset_nodes_from_storage(reader_nodes, **kwargs)
+        keepables = self._generate_composites_from_loaded_datasets()
+        self.unload(keepables=kept_ids | outdated_ids | keepables)
+        missing_ids = outdated_ids - set(self._datasets.keys())
+        if missing_ids:
+            missing_str = ", ".join(str(x) for x in missing_ids)
+            LOG.warning("The following datasets could not be loaded again with "
+                        "the new segments and were removed from the Scene: {}".format(missing_str))
+        return set(self._datasets.keys()) - kept_ids
+
+    def _add_segment_files_to_readers(self, filenames, reader_name):
+        if reader_name is not None:
+            readers = {reader_name: self._readers[reader_name]}
+            if not hasattr(readers[reader_name], "add_segment_files"):
+                raise ValueError(f"Reader '{reader_name}' does not support adding segment files.")
+        else:
+            readers = {name: reader for name, reader in self._readers.items()
+                       if hasattr(reader, "add_segment_files")}
+        filenames = list(filenames)
+        return {name: reader.add_segment_files(filenames) for name, reader in readers.items()}
+
+    def _get_datasets_depending_on(self, reader_ids):
+        """Get the DataIDs of the loaded datasets depending on the *reader_ids* of each reader."""
+        outdated_ids = set()
+        for ds_id in self._datasets.keys():
+            if not self._dependency_tree.contains(ds_id):
+                continue
+            for leaf in self._dependency_tree.leaves(limit_nodes_to=[ds_id]):
+                if isinstance(leaf, ReaderNode) and leaf.name in reader_ids.get(leaf.reader_name, ()):
+                    outdated_ids.add(ds_id)
+                    break
+        return outdated_ids
+
     def _update_dependency_tree(self, needed_datasets, query):
         try:
             comps, mods = load_compositor_configs_for_sensors(self.sensor_names)
@@ -1507,7 +1621,9 @@ class Scene:
         loaded_datasets = DatasetDict()
         for reader_name, ds_ids in reader_datasets.items():
             reader_instance = self._readers[reader_name]
-            new_datasets = reader_instance.load(ds_ids, **kwargs)
+            with record_stage("dataset", reader_name, datasets=sorted(str(ds_id["name"]) for ds_id in ds_ids)) as stage:
+                new_datasets = reader_instance.load(ds_ids, **kwargs)
+                stage.set_output(new_datasets)
             loaded_datasets.update(new_datasets)
         return loaded_datasets
 
@@ -1542,8 +1658,9 @@ class Scene:
     def _generate_composites_nodes_from_loaded_datasets(self, compositor_nodes):
         """Read (generate) composites."""
         keepables = set()
-        for node in compositor_nodes:
-            self._generate_composite(node, keepables)
+        with use_geometry_provider(self._geometry_provider):
+            for node in compositor_nodes:
+                self._generate_composite(node, keepables)
         return keepables
 
     def _generate_composite(self, comp_node: CompositorNode, keepables: set):
@@ -1601,9 +1718,16 @@ class Scene:
             return
 
         try:
-            composite = compositor(prereq_datasets,
-                                   optional_datasets=optional_datasets,
-                                   **comp_node.name.to_dict())
+            with record_stage(*_get_compositor_stage(compositor, comp_node.name),
+                              compositor=type(compositor).__name__,
+                              dataset=comp_node.name.get("name")) as stage:
+                composite = compositor(prereq_datasets,
+                                       optional_datasets=optional_datasets,
+                                       **comp_node.name.to_dict())
+                if merge_duplicate_tasks_enabled():
+                    composite = name_by_content(composite, compositor, prereq_datasets, optional_datasets,
+                                                **comp_node.name.to_dict())
+                stage.set_output(composite)
             cid = DataID.new_id_from_dataarray(composite)
             self._datasets[cid] = composite
 
@@ -17,6 +17,7 @@
 
 import contextlib
 import os
+import warnings
 from tempfile import NamedTemporaryFile
 from unittest import mock
 
@@ -172,6 +173,46 @@ class TestEnhancementStretch:
         expected = np.array([[[10, 0, 0, 10, 10], [10, 10, 10, 10, 10]]])
         run_and_check_enhancement(palettize, self.ch1, expected, palettes=brbg)
 
+    @pytest.mark.parametrize("method", ["colorize", "palettize"])
+    @pytest.mark.parametrize("dtype", [np.uint8, np.int16])
+    @pytest.mark.parametrize("fill_value", [None, 255])
+    def test_colormap_integer_lut(self, method, dtype, fill_value):
+        """Test that integer data colorized with a lookup table gives the trollimage result."""
+        from trollimage.colormap import Colormap
+        from trollimage.xrimage import XRImage
+
+        from satpy import enhancements
+
+        cmap = Colormap(values=np.arange(0, 12), colors=np.random.default_rng(0).random((12, 3)))
+        values = np.random.default_rng(1).integers(0, 15, (1, 20, 30)).astype(dtype)
+        values[0, 0, :5] = 255
+        attrs = {"name": "cloud_type"}
+        if fill_value is not None:
+            attrs["_FillValue"] = fill_value
+
+        def _make_image():
+            return XRImage(xr.DataArray(da.from_array(values, chunks=(1, 10, 10)), dims=("bands", "y", "x"),
+                                        coords={"bands": ["L"]}, attrs=attrs.copy()))
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Palettizing", category=UserWarning)
+            img = _make_image()
+            with mock.patch.object(img, method) as trollimage_method:
+                getattr(enhancements, method)(img, palettes=cmap)
+            trollimage_method.assert_not_called()
+            expected = _make_image()
+            getattr(expected, method)(cmap)
+
+        assert isinstance(img.data.data, da.Array)
+        assert img.data.chunks == expected.data.chunks
+        np.testing.assert_array_equal(img.data.values, expected.data.values)
+        assert img.data.dtype == expected.data.dtype
+        assert list(img.data.coords["bands"].values) == list(expected.data.coords["bands"].values)
+        assert img.data.attrs.get("_FillValue") == expected.data.attrs.get("_FillValue")
+        assert len(img.data.attrs["enhancement_history"]) == 1
+        if method == "palettize":
+            np.testing.assert_array_equal(img.palette, expected.palette)
+
     def test_three_d_effect(self):
         """Test the three_d_effect enhancement function."""
         from satpy.enhancements import three_d_effect
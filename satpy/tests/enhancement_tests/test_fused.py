@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the fused execution of enhancement chains."""
+
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+from trollimage.xrimage import XRImage
+
+import satpy
+from satpy.enhancements import (
+    btemp_threshold,
+    cira_stretch,
+    gamma,
+    lookup,
+    piecewise_linear_stretch,
+    reinhard_to_srgb,
+    stretch,
+)
+from satpy.enhancements._fused import _apply_operations, apply_enhancement_operations
+
+
+def _make_image(bands=("R", "G", "B", "A")):
+    rng = np.random.default_rng(42)
+    data = da.from_array(rng.random((len(bands), 50, 60)).astype(np.float32) * 100, chunks=(1, 20, 30))
+    return XRImage(xr.DataArray(data, dims=("bands", "y", "x"), coords={"bands": list(bands)},
+                                attrs={"name": "test", "enhancement_history": [{"scale": 2.0}]}))
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [{"method": cira_stretch}, {"method": gamma, "kwargs": {"gamma": 1.7}}],
+        [{"method": reinhard_to_srgb, "kwargs": {"saturation": 1.1}},
+         {"method": piecewise_linear_stretch, "kwargs": {"xp": [0, 0.5, 1], "fp": [0, 0.8, 1]}},
+         {"method": btemp_threshold, "kwargs": {"min_in": 0, "max_in": 1, "threshold": 0.4}},
+         {"method": lookup, "kwargs": {"luts": np.arange(256 * 3).reshape(256, 3) % 256}}],
+        [{"method": stretch, "kwargs": {"stretch": "crude", "min_stretch": 0, "max_stretch": 100}},
+         {"method": gamma, "kwargs": {"gamma": [1.5, 1.6, 1.7, 1.0]}},
+         {"method": cira_stretch},
+         {"method": stretch, "kwargs": {"stretch": "crude", "min_stretch": -1, "max_stretch": 1}}],
+    ]
+)
+def test_fused_operations(operations):
+    """Test that fused operations give the same result as the step-wise operations."""
+    expected = _make_image()
+    _apply_operations(expected, operations)
+    img = _make_image()
+    with satpy.config.set(fuse_enhancements=True):
+        apply_enhancement_operations(img, operations)
+
+    assert img.data.dtype == expected.data.dtype
+    assert img.data.attrs == expected.data.attrs
+    assert img.data.attrs["enhancement_history"] is not expected.data.attrs["enhancement_history"]
+    assert len(img.data.data.__dask_graph__()) < len(expected.data.data.__dask_graph__())
+    np.testing.assert_allclose(img.data.values, expected.data.values, rtol=1e-5)
+
+
+def test_single_elementwise_operation_not_fused():
+    """Test that a single element-wise operation is applied as usual."""
+    img = _make_image(bands=("L",))
+    with satpy.config.set(fuse_enhancements=True):
+        apply_enhancement_operations(img, [{"method": cira_stretch}])
+    assert not any(name.startswith("fused_enhancement") for name in img.data.data.__dask_graph__().layers)
+
+
+def test_not_fused_by_default():
+    """Test that the operations are only fused when enabled in the configuration."""
+    img = _make_image()
+    apply_enhancement_operations(img, [{"method": cira_stretch}, {"method": gamma, "kwargs": {"gamma": 1.7}}])
+    assert not any(name.startswith("fused_enhancement") for name in img.data.data.__dask_graph__().layers)
+    assert len(img.data.attrs["enhancement_history"]) == 2
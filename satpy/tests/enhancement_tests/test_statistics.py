@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the streaming statistics of the stretches."""
+
+import datetime as dt
+from unittest import mock
+
+import dask
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+from trollimage.xrimage import XRImage
+
+from satpy.enhancements import stretch
+from satpy.enhancements.statistics import QuantileSketch, clear_stretch_statistics, compute_band_sketches
+
+
+def _make_data():
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(3, 200, 300)).astype(np.float32)
+    data[0, :10] = np.nan
+    return data
+
+
+def _make_image(data, name="test", **attrs):
+    arr = da.from_array(data, chunks=(1, 50, 100))
+    return XRImage(xr.DataArray(arr, dims=("bands", "y", "x"), coords={"bands": ["R", "G", "B"]},
+                                attrs={"name": name, **attrs}))
+
+
+def _stretched_max(data, **attrs):
+    img = _make_image(data, **attrs)
+    stretch(img, stretch="crude", statistics="reuse")
+    return np.nanmax(img.data.values, axis=(1, 2))
+
+
+@pytest.fixture(autouse=True)
+def _clear_statistics():
+    yield
+    clear_stretch_statistics()
+
+
+class TestQuantileSketch:
+    """Test the quantile sketches."""
+
+    @pytest.mark.parametrize("size", [64, 2048])
+    def test_merged_quantiles(self, size):
+        """Test that the quantiles of merged chunk sketches are within the rank error."""
+        data = _make_data()[0].ravel()
+        sketch = QuantileSketch.merge([QuantileSketch.from_array(chunk, size)
+                                       for chunk in np.array_split(data, 37)])
+        valid = np.sort(data[~np.isnan(data)])
+        assert sketch.count == pytest.approx(valid.size)
+        assert len(sketch.values) <= size
+        q = np.array([0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0])
+        ranks = np.searchsorted(valid, sketch.quantile(q)) / valid.size
+        np.testing.assert_allclose(ranks, q, atol=2 / size)
+        assert sketch.quantile(0.0) == valid[0]
+        assert sketch.quantile(1.0) == valid[-1]
+
+    def test_empty(self):
+        """Test sketches of arrays without valid values."""
+        sketch = QuantileSketch.merge([QuantileSketch.from_array(np.full(10, np.nan)),
+                                       QuantileSketch.from_array(np.arange(3.))])
+        np.testing.assert_array_equal(sketch.quantile([0, 0.5, 1]), [0, 1, 2])
+        assert np.isnan(QuantileSketch.from_array(np.full(10, np.nan)).quantile(0.5))
+
+    def test_compute_band_sketches(self):
+        """Test computing the sketches of all the bands of an image chunk by chunk."""
+        data = _make_data()
+        sketches = dask.compute(*compute_band_sketches(_make_image(data).data))
+        assert len(sketches) == 3
+        for band_data, sketch in zip(data, sketches):
+            assert sketch.min == np.nanmin(band_data)
+            assert sketch.max == np.nanmax(band_data)
+
+
+class TestStretchWithStatistics:
+    """Test the stretches with streaming statistics."""
+
+    @pytest.mark.parametrize("statistics", ["sketch", "reuse"])
+    def test_crude(self, statistics):
+        """Test the crude stretch with limits from the data."""
+        data = _make_data()
+        img = _make_image(data)
+        stretch(img, stretch="crude", statistics=statistics)
+        res = img.data.values
+        np.testing.assert_allclose(np.nanmin(res, axis=(1, 2)), 0, atol=1e-6)
+        np.testing.assert_allclose(np.nanmax(res, axis=(1, 2)), 1, atol=1e-6)
+
+    @pytest.mark.parametrize("statistics", ["sketch", "reuse"])
+    def test_linear(self, statistics):
+        """Test the linear stretch with the cutoff quantiles from the sketches."""
+        data = _make_data()
+        img = _make_image(data)
+        stretch(img, stretch="linear", cutoffs=(0.02, 0.05), statistics=statistics)
+        res = img.data.values
+        for band_data, band_res in zip(data, res):
+            left, right = np.nanquantile(band_data, [0.02, 0.95])
+            np.testing.assert_allclose(band_res, (band_data - left) / (right - left), atol=0.01)
+
+    def test_histogram(self):
+        """Test the histogram equalization with the quantiles from the sketches."""
+        data = _make_data()
+        img = _make_image(data)
+        stretch(img, stretch="histogram", statistics="sketch")
+        res = img.data.values
+        assert img.data.attrs["enhancement_history"] == [{"hist_equalize": True}]
+        assert np.isnan(res[0, :10]).all()
+        for band_res in res:
+            valid = band_res[~np.isnan(band_res)]
+            # the equalized values are uniformly distributed
+            np.testing.assert_allclose(np.quantile(valid, [0.1, 0.5, 0.9]), [0.1, 0.5, 0.9], atol=0.01)
+
+    def test_other_stretches(self):
+        """Test that stretches without statistics are passed to trollimage."""
+        img = _make_image(_make_data())
+        with mock.patch.object(img, "stretch") as img_stretch:
+            stretch(img, stretch="logarithmic", factor=10, statistics="sketch")
+        img_stretch.assert_called_once_with(stretch="logarithmic", factor=10)
+
+    def test_unknown_statistics(self):
+        """Test that unknown statistics modes are refused."""
+        with pytest.raises(ValueError, match="Unknown stretch statistics"):
+            stretch(_make_image(_make_data()), stretch="crude", statistics="exact")
+
+    def test_reuse_previous_time_step(self):
+        """Test that the statistics of the previous time step are used and updated."""
+        data = _make_data()
+        vmin = np.nanmin(data, axis=(1, 2))
+        vmax = np.nanmax(data, axis=(1, 2))
+        times = [dt.datetime(2024, 1, 1, hour) for hour in range(3)]
+        # the first time step uses its own statistics
+        np.testing.assert_allclose(_stretched_max(data, start_time=times[0]), 1, atol=1e-6)
+
+        with mock.patch("satpy.enhancements.statistics.compute_band_sketches") as compute:
+            second_max = _stretched_max(data * 2, start_time=times[1])
+            third_max = _stretched_max(data * 3, start_time=times[2])
+        compute.assert_not_called()
+        np.testing.assert_allclose(second_max, (2 * vmax - vmin) / (vmax - vmin), rtol=1e-5)
+        # the statistics recorded while computing the second time step are used for the third one
+        np.testing.assert_allclose(third_max, (3 * vmax - 2 * vmin) / (2 * vmax - 2 * vmin), rtol=1e-5)
+
+    @pytest.mark.parametrize(
+        "attrs",
+        [
+            {"platform_name": "Meteosat-10"},
+            {"area": "other_area"},
+            {"start_time": dt.datetime(2023, 12, 31)},
+        ]
+    )
+    def test_reuse_other_product(self, attrs):
+        """Test that statistics of other platforms, areas or later time steps aren't used."""
+        data = _make_data()
+        reference_attrs = {"platform_name": "Meteosat-11", "area": "area", "start_time": dt.datetime(2024, 1, 1)}
+        _stretched_max(data, **reference_attrs)
+        np.testing.assert_allclose(_stretched_max(data * 2, **{**reference_attrs, **attrs}), 1, atol=1e-6)
+
+    def test_clear_statistics(self):
+        """Test that the stored statistics are removed."""
+        data = _make_data()
+        _stretched_max(data)
+        clear_stretch_statistics()
+        np.testing.assert_allclose(_stretched_max(data * 2), 1, atol=1e-6)
+
+    def test_recorder_not_pickled(self):
+        """Test that the statistics aren't recorded in other processes."""
+        import pickle
+
+        from satpy.enhancements.statistics import _StatisticsRecorder
+
+        recorder = _StatisticsRecorder("key", None, 3, 4, 16)
+        assert pickle.loads(pickle.dumps(recorder)) is None
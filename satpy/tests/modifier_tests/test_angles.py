@@ -385,3 +385,63 @@ class TestAngleGeneration:
 
         assert np.all(azi > 0)
         assert azi.dtype == dtype
+
+
+class TestGeometryProvider:
+    """Test sharing angles between modifiers and compositors."""
+
+    def test_cos_sza_shared(self):
+        """Test that cos(SZA) is generated once per area while a provider is active."""
+        from satpy.modifiers.angles import GeometryProvider, get_cos_sza, use_geometry_provider
+        data = _get_angle_test_data()
+        provider = GeometryProvider()
+        with mock.patch("satpy.modifiers.angles._get_cos_sza", wraps=satpy.modifiers.angles._get_cos_sza) as gcs, \
+                use_geometry_provider(provider):
+            cos_sza1 = get_cos_sza(data)
+            cos_sza2 = get_cos_sza(data.copy())
+        assert gcs.call_count == 1
+        assert len(provider) == 1
+        assert cos_sza1.data.name == cos_sza2.data.name
+        get_cos_sza(data)
+        assert len(provider) == 1
+
+    def test_inplace_modification_does_not_change_cache(self):
+        """Test that modifying a returned array in-place does not modify the shared array."""
+        from satpy.modifiers.angles import GeometryProvider, get_cos_sza, use_geometry_provider
+        data = _get_angle_test_data()
+        with use_geometry_provider(GeometryProvider()):
+            cos_sza1 = get_cos_sza(data)
+            expected = cos_sza1.values.copy()
+            cos_sza1 -= 1
+            cos_sza2 = get_cos_sza(data)
+        np.testing.assert_allclose(cos_sza2.values, expected)
+
+    def test_different_areas_not_shared(self):
+        """Test that angles for different areas or times are not shared."""
+        from satpy.modifiers.angles import GeometryProvider, get_angles, use_geometry_provider
+        data = _get_angle_test_data()
+        provider = GeometryProvider()
+        with use_geometry_provider(provider):
+            get_angles(data)
+            get_angles(_similar_sat_pos_datetime(data))
+            get_angles(_get_stacked_angle_test_data())
+            get_angles(data)
+        # sun and sensor angles for each of the three different inputs
+        assert len(provider) == 6
+        provider.clear()
+        assert len(provider) == 0
+
+    def test_sunz_corrector_and_daynight_share_cos_sza(self):
+        """Test that the sun zenith corrector and day/night compositor share cos(SZA)."""
+        from satpy.composites import DayNightCompositor
+        from satpy.modifiers.angles import GeometryProvider, use_geometry_provider
+        from satpy.modifiers.geometry import SunZenithCorrector
+        data = _get_angle_test_data(chunks=5, dims=("y", "x"))
+        data.attrs.update(name="vis", standard_name="toa_bidirectional_reflectance")
+        provider = GeometryProvider()
+        with mock.patch("satpy.modifiers.angles._get_valid_lonlats",
+                        wraps=satpy.modifiers.angles._get_valid_lonlats) as gvl, \
+                use_geometry_provider(provider):
+            corrected = SunZenithCorrector(name="sunz_corrected")((data,))
+            DayNightCompositor(name="dn", day_night="day_only")((corrected,))
+        assert gvl.call_count == 1
@@ -1,9 +1,11 @@
 """Implementation of some image filters."""
 
 import logging
+from unittest import mock
 
 import dask.array as da
 import numpy as np
+import pytest
 import xarray as xr
 
 from satpy.modifiers.filters import Median
@@ -33,3 +35,44 @@ def test_median(caplog):
     np.testing.assert_equal(res.coords["x"], coordinates["x"])
     np.testing.assert_equal(res.coords["y"], coordinates["y"])
     assert "Apply median filtering with parameters {'size': 3}" in caplog.text
+
+
+@pytest.mark.parametrize("mode", ["reflect", "nearest", "wrap"])
+@pytest.mark.parametrize("size", [3, (5, 3)])
+@pytest.mark.parametrize(
+    "data",
+    [np.random.default_rng(42).integers(0, 4, size=(23, 31), dtype=np.uint8),
+     np.random.default_rng(42).integers(0, 1000, size=(23, 31), dtype=np.int32),
+     np.random.default_rng(42).random((23, 31)).astype(np.float32)])
+def test_median_filter_chunked(data, size, mode):
+    """Test that the chunked median filter matches scipy's."""
+    from scipy.ndimage import median_filter as scipy_median_filter
+
+    from satpy.modifiers.filters import median_filter
+    res = median_filter(da.from_array(data, chunks=7), size, mode=mode)
+    assert res.dtype == data.dtype
+    assert res.chunks == da.from_array(data, chunks=7).chunks
+    np.testing.assert_array_equal(res.compute(), scipy_median_filter(data, size=size, mode=mode))
+
+
+def test_median_filter_nan():
+    """Test that NaNs are ignored by the median filter."""
+    from satpy.modifiers.filters import median_filter
+    data = np.arange(25, dtype=np.float64).reshape(5, 5)
+    data[2, 2] = np.nan
+    data[:2, :] = np.nan
+    res = median_filter(da.from_array(data, chunks=3), 3).compute()
+    assert np.isnan(res[0, :]).all()
+    np.testing.assert_array_equal(res[1, 1:4], [10.5, 12, 13.5])
+    assert res[2, 2] == 16
+    assert np.isfinite(res[2:, :]).all()
+
+
+def test_median_footprint_uses_dask_image():
+    """Test that parameters not supported by the chunked filter go to dask-image."""
+    median_filter = Median(dict(footprint=np.ones((3, 3))), name="median_filter")
+    array = xr.DataArray(da.arange(36).reshape((6, 6)), dims=("y", "x"))
+    with mock.patch("dask_image.ndfilters.median_filter") as dask_image_median_filter:
+        dask_image_median_filter.return_value = array.data
+        median_filter([array])
+    dask_image_median_filter.assert_called_once()
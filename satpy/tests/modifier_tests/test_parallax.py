@@ -621,8 +621,9 @@ class TestParallaxCorrectionModifier:
 
         return (fake_bt, fake_cth, cma)
 
+    @pytest.mark.parametrize("engine", ["swath", "forward"])
     @pytest.mark.parametrize("test_area", ["foroyar", "ouagadougou"], indirect=["test_area"])
-    def test_modifier_interface_fog_no_shift(self, test_area):
+    def test_modifier_interface_fog_no_shift(self, test_area, engine):
         """Test that fog isn't masked or shifted."""
         from satpy.modifiers.parallax import ParallaxCorrectionModifier
 
@@ -632,17 +633,19 @@ class TestParallaxCorrectionModifier:
                 name="parallax_corrected_dataset",
                 prerequisites=[fake_bt, fake_cth],
                 optional_prerequisites=[],
-                debug_mode=True)
+                debug_mode=True,
+                engine=engine)
 
         res = modif([fake_bt, fake_cth], optional_datasets=[])
 
         assert np.isfinite(res).all()
         np.testing.assert_allclose(res, fake_bt)
 
+    @pytest.mark.parametrize("engine", ["swath", "forward"])
     @pytest.mark.parametrize("cth", [7500, 15000])
     @pytest.mark.parametrize("use_dask", [True, False])
     @pytest.mark.parametrize("test_area", ["foroyar", "ouagadougou"], indirect=["test_area"])
-    def test_modifier_interface_cloud_moves_to_observer(self, cth, use_dask, test_area):
+    def test_modifier_interface_cloud_moves_to_observer(self, cth, use_dask, test_area, engine):
         """Test that a cloud moves to the observer.
 
         With the modifier interface, use a high resolution area and test that
@@ -669,7 +672,8 @@ class TestParallaxCorrectionModifier:
                 name="parallax_corrected_dataset",
                 prerequisites=[fake_bt, fake_cth],
                 optional_prerequisites=[],
-                debug_mode=True)
+                debug_mode=True,
+                engine=engine)
 
         res = modif([fake_bt, fake_cth], optional_datasets=[])
 
@@ -691,6 +695,111 @@ class TestParallaxCorrectionModifier:
         # verify that all pixels at the new cloud location are indeed cloudy
         assert (res.data[dest_mask] < 250).all()
 
+    @pytest.mark.parametrize("test_area", ["foroyar"], indirect=["test_area"])
+    def test_modifier_interface_forward_chunked(self, test_area):
+        """Test that the forward engine gives the same result with several chunks."""
+        from satpy.modifiers.parallax import ParallaxCorrectionModifier
+
+        (fake_bt, fake_cth, _) = self._get_fake_cloud_datasets(test_area, 15000, use_dask=True)
+        results = {}
+        for (engine, chunks) in [("swath", 1024), ("forward", 1024), ("forward", 37)]:
+            modif = ParallaxCorrectionModifier(
+                    name="parallax_corrected_dataset",
+                    prerequisites=[fake_bt, fake_cth],
+                    optional_prerequisites=[],
+                    engine=engine,
+                    lonlat_chunks=chunks)
+            results[(engine, chunks)] = modif([fake_bt, fake_cth], optional_datasets=[])
+        assert len(results[("forward", 37)].data.chunks[0]) > 1
+        np.testing.assert_array_equal(results[("forward", 37)], results[("forward", 1024)])
+        # both engines agree, except where equally high cloud pixels collide
+        forward = results[("forward", 1024)].values
+        swath = results[("swath", 1024)].values
+        np.testing.assert_array_equal(np.isnan(forward), np.isnan(swath))
+        assert (forward[np.isfinite(forward)] != swath[np.isfinite(swath)]).sum() <= 5
+
+    def test_modifier_interface_unknown_engine(self):
+        """Test that an unknown engine raises a ValueError."""
+        from satpy.modifiers.parallax import ParallaxCorrectionModifier
+        (area_small, area_large) = _get_fake_areas((0, 0), [5, 9], 0.1)
+        fake_bt = xr.DataArray(
+                np.linspace(220, 230, 25).reshape(5, 5),
+                dims=("y", "x"),
+                attrs={"area": area_small, **_get_attrs(0, 0, 35_000)})
+        cth_clear = xr.DataArray(
+                np.full((9, 9), np.nan),
+                dims=("y", "x"),
+                attrs={"area": area_large, **_get_attrs(0, 0, 35_000)})
+        modif = ParallaxCorrectionModifier(
+                name="parallax_corrected_dataset",
+                prerequisites=[fake_bt, cth_clear],
+                optional_prerequisites=[],
+                engine="bogus")
+        with pytest.raises(ValueError, match="bogus"):
+            modif([fake_bt, cth_clear], optional_datasets=[])
+
+
+class TestForwardShift:
+    """Test the building blocks of the forward parallax correction."""
+
+    def test_forward_shift_block_highest_cloud_wins(self):
+        """Test that the highest cloud is retained when pixels collide."""
+        from satpy.modifiers.parallax import _forward_shift_block
+        data = np.array([[1., 2., 3.]])
+        row_shift = np.zeros((1, 3))
+        col_shift = np.array([[1., 0., 0.]])
+        cth = np.array([[10_000., 5_000., 0.]])
+        res = _forward_shift_block(data, row_shift, col_shift, cth)
+        np.testing.assert_array_equal(res, [[np.nan, 1., 3.]])
+        cth = np.array([[5_000., 10_000., 0.]])
+        res = _forward_shift_block(data, row_shift, col_shift, cth)
+        np.testing.assert_array_equal(res, [[np.nan, 2., 3.]])
+
+    def test_forward_shift_block_unfilled_is_nan(self):
+        """Test that destinations without any pixel and invalid shifts become NaN."""
+        from satpy.modifiers.parallax import _forward_shift_block
+        data = np.arange(6, dtype="f8").reshape(2, 3)
+        row_shift = np.array([[1., 0., np.nan], [0., 0., 0.]])
+        col_shift = np.zeros((2, 3))
+        cth = np.array([[5_000., 0., 0.], [0., 0., 0.]])
+        res = _forward_shift_block(data, row_shift, col_shift, cth)
+        np.testing.assert_array_equal(res, [[np.nan, 1., np.nan], [0., 4., 5.]])
+
+    def test_forward_shift_block_max_shift(self):
+        """Test that pixels shifted further than max_shift are not moved."""
+        from satpy.modifiers.parallax import _forward_shift_block
+        data = np.array([[1., 2., 3., 4.]])
+        row_shift = np.zeros((1, 4))
+        col_shift = np.array([[3., 0., 0., 0.]])
+        cth = np.array([[10_000., 0., 0., 0.]])
+        res = _forward_shift_block(data, row_shift, col_shift, cth, max_shift=2)
+        np.testing.assert_array_equal(res, data)
+
+    def test_get_max_shift_pixels(self):
+        """Test that the estimated overlap bounds the actual shift."""
+        from satpy.modifiers.parallax import ParallaxCorrection, _get_array_coordinates_from_lonlat_dask
+        (area, _) = _get_fake_areas((10, 20), [40, 40], 0.05)
+        corrector = ParallaxCorrection(area)
+        depth = corrector._get_max_shift_pixels(0, 0, 35_785_831, 20_000)
+        (lon, lat) = area.get_lonlats(chunks=13)
+        cth = da.full(lon.shape, 20_000., chunks=13)
+        (row_shift, col_shift) = corrector._get_forward_shift(0, 0, 35_785_831, lon, lat, cth)
+        max_shift = max(abs(row_shift).max().compute(), abs(col_shift).max().compute())
+        assert 0 < max_shift < depth <= 40
+        (cols, rows) = _get_array_coordinates_from_lonlat_dask(area, lon, lat)
+        np.testing.assert_allclose(cols[0, :], np.arange(40), atol=1e-6)
+        np.testing.assert_allclose(rows[:, 0], np.arange(40), atol=1e-6)
+
+    def test_get_max_shift_pixels_min_elevation(self):
+        """Test that the minimum elevation limits the overlap near the limb."""
+        from satpy.modifiers.parallax import ParallaxCorrection
+        area = pyresample.create_area_def(
+                "near-limb", 4326, area_extent=(-10, 60, 10, 80), resolution=0.05)
+        corrector = ParallaxCorrection(area)
+        depth_limb = corrector._get_max_shift_pixels(0, 0, 35_785_831, 20_000, min_elevation=0, stride=8)
+        depth = corrector._get_max_shift_pixels(0, 0, 35_785_831, 20_000, min_elevation=10, stride=8)
+        assert depth < depth_limb
+
 
 _test_yaml_code = """
 sensor_name: visir
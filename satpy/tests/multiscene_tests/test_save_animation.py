@@ -371,3 +371,81 @@ def test_save_mp4(smg, tmp_path):
     assert writer_mock.append_data.call_count == 2 + 2
     assert ("2018-01-02" in smg.call_args_list[-1][1]
             ["decorate"]["decorate"][0]["text"]["txt"])
+
+
+@mock.patch("satpy.multiscene._multiscene.get_enhanced_image", _fake_get_enhanced_image)
+@pytest.mark.parametrize("downscale", [None, 2])
+def test_save_mp4_streaming(tmp_path, downscale):
+    """Save a series of fake scenes to mp4 videos with the streaming frame pipeline."""
+    from satpy import MultiScene
+    area = _create_test_area()
+    scenes = _create_test_scenes(num_scenes=4, area=area)
+    for idx, scn in enumerate(scenes):
+        scn["ds1"] = scn["ds1"] + idx
+
+    mscn = MultiScene(scenes)
+    fn = str(tmp_path / "test_save_mp4_{name}.mp4")
+    writer_mocks = {}
+    with mock.patch("satpy.multiscene._multiscene.imageio.get_writer") as get_writer, \
+            mock.patch("satpy.multiscene._multiscene.get_client") as get_client:
+        get_writer.side_effect = lambda filename, **kwargs: writer_mocks.setdefault(
+            os.path.basename(filename), mock.MagicMock())
+        mscn.save_animation(fn, datasets=["ds1", "ds2"], max_buffer_bytes=1, downscale=downscale)
+    get_client.assert_not_called()
+
+    expected_shape = (2, 5, 2) if downscale else (5, 10, 2)
+    for name in ("ds1", "ds2"):
+        writer = writer_mocks[f"test_save_mp4_{name}.mp4"]
+        assert writer.append_data.call_count == 4
+        writer.close.assert_called_once()
+        frames = [args[0][0] for args in writer.append_data.call_args_list]
+        assert all(frame.shape == expected_shape for frame in frames)
+    # frames are written in the order of the scenes
+    ds1_frames = [args[0][0] for args in writer_mocks["test_save_mp4_ds1.mp4"].append_data.call_args_list]
+    assert [frame[0, 0, 0] for frame in ds1_frames] == [0, 255, 255, 255]
+
+
+@mock.patch("satpy.multiscene._multiscene.get_enhanced_image", _fake_get_enhanced_image)
+def test_save_mp4_streaming_error(tmp_path):
+    """Test that errors computing the frames are raised when streaming."""
+    from satpy import MultiScene
+    scenes = _create_test_scenes(area=_create_test_area())
+    mscn = MultiScene(scenes)
+    with mock.patch("satpy.multiscene._multiscene.imageio.get_writer"), \
+            mock.patch("satpy.multiscene._multiscene.MultiScene._get_single_frame",
+                       side_effect=RuntimeError("Enhancement failed")), \
+            mock.patch("satpy.multiscene._multiscene.MultiScene._get_animation_info",
+                       return_value=("test.mp4", (5, 10, 2), None)), \
+            pytest.raises(RuntimeError, match="Enhancement failed"):
+        mscn.save_animation(str(tmp_path / "test.mp4"), datasets=["ds1"], max_buffer_bytes=1000)
+
+
+def test_frame_buffer_backpressure():
+    """Test that the frame buffer blocks the producer when it is full."""
+    import threading
+
+    from satpy.multiscene._multiscene import _FrameBuffer
+
+    frame_buffer = _FrameBuffer(100)
+    # an item larger than the limit is accepted by an empty buffer
+    assert frame_buffer.put("large", 1000)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(frame_buffer.put("next", 10)))
+    thread.start()
+    thread.join(0.1)
+    assert thread.is_alive()
+    assert frame_buffer.get() == "large"
+    thread.join(5)
+    assert results == [True]
+    assert frame_buffer.put("small", 50)
+    assert frame_buffer.get() == "next"
+    assert frame_buffer.get() == "small"
+
+    # closing the buffer releases the waiting producer
+    assert frame_buffer.put("large", 1000)
+    thread = threading.Thread(target=lambda: results.append(frame_buffer.put("dropped", 10)))
+    thread.start()
+    frame_buffer.close()
+    thread.join(5)
+    assert results == [True, False]
+    assert frame_buffer.get() == "large"
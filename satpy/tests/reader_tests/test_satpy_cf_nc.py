@@ -21,6 +21,7 @@
 import datetime as dt
 import warnings
 
+import dask.array as da
 import numpy as np
 import pytest
 import xarray as xr
@@ -28,7 +29,7 @@ from pyresample import AreaDefinition, SwathDefinition
 
 from satpy import Scene
 from satpy.dataset.dataid import WavelengthRange
-from satpy.readers.satpy_cf_nc import SatpyCFFileHandler
+from satpy.readers.satpy_cf_nc import SatpyCFFileHandler, SatpyCFZarrFileHandler
 
 # NOTE:
 # The following fixtures are not defined in this file, but are used and injected by Pytest:
@@ -503,3 +504,52 @@ class TestCFReader:
                        modifiers=(), calibration="counts")
         res = reader.get_dataset(ds_id, {})
         assert res.attrs["resolution"] == 742
+
+
+def _zarr_versions_supported():
+    from satpy.writers.zarr_writer import check_zarr_versions
+    try:
+        check_zarr_versions()
+    except ImportError:
+        return False
+    return True
+
+
+class TestCFZarrReader:
+    """Test case for the CF Zarr reader."""
+
+    @pytest.mark.skipif(not _zarr_versions_supported(),
+                        reason="zarr 3 needs a more recent xarray")
+    def test_write_and_read(self, cf_scene, tmp_path):
+        """Save a Scene with the zarr writer and read it lazily again."""
+        filename = str(tmp_path / "tirosn-avhrr-20190401120000-20190401121500.zarr")
+        cf_scene.save_datasets(writer="zarr", filename=filename, flatten_attrs=True, pretty=True,
+                               datasets=["image0", "image1", "1", "lat", "lon"])
+        scn_ = Scene(reader="satpy_cf_zarr", filenames=[filename])
+        scn_.load(["image0", "image1", "1"])
+        assert isinstance(scn_["image0"].data, da.Array)
+        np.testing.assert_array_equal(scn_["image0"].data, cf_scene["image0"].data)
+        np.testing.assert_array_equal(scn_["1"].data, cf_scene["1"].data)
+        assert isinstance(scn_["image0"].attrs["wavelength"], WavelengthRange)
+        assert scn_["image0"].attrs["my_timestamp"] == cf_scene["image0"].attrs["my_timestamp"]
+        assert scn_["image0"].attrs["orbital_parameters_projection_longitude"] == 1
+        expected_area = cf_scene["image0"].attrs["area"]
+        actual_area = scn_["image0"].attrs["area"]
+        assert pytest.approx(expected_area.area_extent, 0.000001) == actual_area.area_extent
+        assert expected_area.shape == actual_area.shape
+        # the area is restored once for all datasets
+        assert scn_["image1"].attrs["area"] is actual_area
+        # reading datasets again doesn't change the metadata of the store
+        scn2 = Scene(reader="satpy_cf_zarr", filenames=[filename])
+        scn2.load(["image0"])
+        scn2.load(["image0"])
+        assert scn2["image0"].attrs["my_timestamp"] == cf_scene["image0"].attrs["my_timestamp"]
+
+    def test_open_dataset_chunks(self):
+        """Test that the datasets keep the chunks of the store unless other chunks are requested."""
+        file_handler = SatpyCFZarrFileHandler("test.zarr", {}, {})
+        file_handler.__dict__["_dataset"] = xr.Dataset(
+            {"image0": (("y", "x"), da.arange(60., chunks=5).reshape((6, 10)).rechunk((3, 5)))})
+        assert file_handler.dataset_chunks is None
+        assert file_handler._open_dataset()["image0"].chunks == ((3, 3), (5, 5))
+        assert file_handler._open_dataset(chunks={"y": 2, "z": 4})["image0"].chunks == ((2, 2, 2), (5, 5))
@@ -98,7 +98,6 @@ class TestHRITMSGFileHandlerHRV(TestHRITMSGBase):
     def test_get_dataset_non_fill(self, calibrate, parent_get_dataset):
         """Test getting a non-filled hrv dataset."""
         key = make_dataid(name="HRV", calibration="reflectance")
-        key.name = "HRV"
         info = setup.get_fake_dataset_info()
         self.reader.fill_hrv = False
         parent_get_dataset.return_value = mock.MagicMock()
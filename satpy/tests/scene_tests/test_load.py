@@ -15,6 +15,7 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for loading-related functionality in scene.py."""
 
+import logging
 from unittest import mock
 
 import pytest
@@ -673,3 +674,66 @@ def _data_array_none_sensor(name: str) -> xr.DataArray:
             "name": name,
             "sensor": None,
         })
+
+
+@pytest.mark.usefixtures("include_test_etc")
+class TestAddingSegments:
+    """Test adding newly arrived segment files to a Scene."""
+
+    def _create_scene(self):
+        return Scene(filenames=["fake_segment1_1.txt", "fake_segment2_1.txt"], reader="fake_segmented")
+
+    def test_add_segments(self):
+        """Test that the padded segments are replaced and only affected composites are regenerated."""
+        scene = self._create_scene()
+        scene.load(["comp1", "comp2", "ds2"])
+        assert scene["ds2"].isnull().sum() == 2 * 4 * 5
+        comp1 = scene["comp1"]
+        comp2 = scene["comp2"]
+        ds2 = scene["ds2"]
+
+        updated = scene.add_segments(["fake_segment1_3.txt", "unknown_file.txt"])
+        assert updated == {make_cid(name="comp1"), make_cid(name="comp2")}
+        assert scene["ds2"] is ds2
+        assert scene["comp1"] is not comp1
+        assert scene["comp2"] is not comp2
+        assert set(scene.keys()) == {make_cid(name="comp1"), make_cid(name="comp2"), ds2.attrs["_satpy_id"]}
+
+        updated = scene.add_segments(["fake_segment2_2.txt", "fake_segment2_3.txt"])
+        assert make_cid(name="comp1") not in updated
+        assert ds2.attrs["_satpy_id"] in updated
+        assert scene["ds2"].isnull().sum() == 0
+        assert (scene["ds2"].values[4:8] == 2).all()
+        assert scene.add_segments(["fake_segment2_3.txt"]) == set()
+
+    def test_add_segments_kept_dependencies(self):
+        """Test that datasets kept with ``unload=False`` are updated."""
+        scene = self._create_scene()
+        scene.load(["comp1"], unload=False)
+        ds1_id = make_dataid(name="ds1", resolution=250, calibration="reflectance")
+        assert ds1_id in scene
+        updated = scene.add_segments(["fake_segment1_2.txt"])
+        assert updated == {make_cid(name="comp1"), ds1_id}
+        assert (scene[ds1_id].values[4:8] == 2).all()
+
+    def test_add_segments_failed_reload(self, caplog):
+        """Test that datasets that can't be loaded again are reported."""
+        from satpy.dataset.data_dict import DatasetDict
+        scene = self._create_scene()
+        scene.load(["comp1", "ds2"])
+        reader = scene._readers["fake_segmented"]
+        with mock.patch.object(reader, "load", return_value=DatasetDict()), \
+                caplog.at_level(logging.WARNING):
+            updated = scene.add_segments(["fake_segment1_3.txt"])
+        assert updated == set()
+        assert make_cid(name="comp1") not in scene
+        assert "could not be loaded again" in caplog.text
+        assert "comp1" in caplog.text
+
+    def test_add_segments_unsupported_reader(self):
+        """Test adding segments with a reader not supporting it."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        scene.load(["ds1"])
+        with pytest.raises(ValueError, match="does not support"):
+            scene.add_segments(["fake1_2.txt"], reader="fake1")
+        assert scene.add_segments(["fake1_2.txt"]) == set()
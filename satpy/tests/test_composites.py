@@ -337,6 +337,39 @@ class TestRatioSharpenedCompositors:
         np.testing.assert_allclose(data[1], exp_g, rtol=1e-5)
         np.testing.assert_allclose(data[2], exp_b, rtol=1e-5)
 
+    def test_ratio_sharpening_chunked(self):
+        """Test that sharpening chunk by chunk in a single layer gives the same result."""
+        from satpy.composites import RatioSharpenedRGB
+        rng = np.random.default_rng(0)
+        red, green, blue, high_res = (rng.random((4, 6)) + 0.5 for _ in range(4))
+
+        def _to_data_arr(data, chunks, name):
+            return xr.DataArray(da.from_array(data, chunks=chunks), dims=("y", "x"),
+                                attrs={**self.ds4_big.attrs, "name": name})
+
+        comp = RatioSharpenedRGB(name="true_color", neutral_resolution_band="blue")
+        res = comp((_to_data_arr(red, 2, "r"), _to_data_arr(green, (4, 3), "g"), _to_data_arr(blue, 4, "b")),
+                   optional_datasets=(_to_data_arr(high_res, (2, 3), "hr"),))
+        assert len([name for name in res.data.dask.layers if name.startswith("_ratio_sharpen_block")]) == 1
+        ratio = np.clip(high_res / red, 0, 1.5)
+        np.testing.assert_allclose(res.values[0], high_res)
+        np.testing.assert_allclose(res.values[1], green * ratio)
+        np.testing.assert_allclose(res.values[2], blue)
+
+    def test_self_sharpened_chunked(self):
+        """Test that self sharpening with several chunks averages within each chunk correctly."""
+        from satpy.composites import SelfSharpenedRGB
+        data = np.arange(1, 17, dtype=np.float64).reshape(4, 4)
+        bands = [xr.DataArray(da.from_array(data * factor, chunks=2), dims=("y", "x"),
+                              attrs={**self.ds4_big.attrs, "name": str(factor)})
+                 for factor in (1, 2, 3)]
+        res = SelfSharpenedRGB(name="true_color")(bands)
+        mean4 = data.reshape(2, 2, 2, 2).mean(axis=(1, 3)).repeat(2, axis=0).repeat(2, axis=1)
+        ratio = np.clip(data / mean4, 0, 1.5)
+        np.testing.assert_allclose(res.values[0], data)
+        np.testing.assert_allclose(res.values[1], 2 * data * ratio)
+        np.testing.assert_allclose(res.values[2], 3 * data * ratio)
+
 
 class TestDifferenceCompositor(unittest.TestCase):
     """Test case for the difference compositor."""
@@ -758,6 +791,50 @@ class TestInlineComposites(unittest.TestCase):
         assert comps["seviri"][fog_dep_ids[1]].attrs["prerequisites"] == ["IR_108", "IR_087"]
 
 
+class TestCompositorConfigLoading:
+    """Test lazy and cached loading of compositor configurations."""
+
+    def test_compositors_created_on_access(self):
+        """Test that compositor objects are only created when accessed."""
+        from satpy.composites import GenericCompositor
+        from satpy.composites.config_loader import LazyCompositor, load_compositor_configs_for_sensors
+        from satpy.dependency_tree import DependencyTree
+
+        comps = load_compositor_configs_for_sensors(["visir"])[0]["visir"]
+        lazy_comps = [comp for _, comp in comps.lazy_items()]
+        assert all(isinstance(comp, LazyCompositor) for comp in lazy_comps)
+
+        tree = DependencyTree({}, {"visir": comps}, {})
+        assert all(comp._compositor is None for comp in lazy_comps)
+        overview = tree.get_compositor("overview")
+        assert isinstance(overview, GenericCompositor)
+        assert tree.get_compositor("overview") is overview
+        assert comps[overview.id] is overview
+        assert sum(comp._compositor is not None for comp in lazy_comps) == 1
+        assert overview.id in comps
+        assert len(list(comps)) == len(lazy_comps)
+        assert sum(comp._compositor is not None for comp in lazy_comps) == 1
+
+        comps.load_all()
+        assert all(comp._compositor is not None for comp in lazy_comps)
+
+    def test_cached_composite_configs(self, tmp_path):
+        """Test that the parsed composite YAML is taken from the persistent index."""
+        from satpy.composites.config_loader import COMPOSITE_CONFIG_CACHE, load_compositor_configs_for_sensor
+
+        with satpy.config.set(cache_configs=True, cache_dir=str(tmp_path)):
+            load_compositor_configs_for_sensor.cache_clear()
+            comps = load_compositor_configs_for_sensor("seviri")[0]
+            assert (tmp_path / "config_index" / "composites.pkl").is_file()
+            load_compositor_configs_for_sensor.cache_clear()
+            with mock.patch("satpy.composites.config_loader._read_yaml_configs") as read_yaml:
+                cached_comps = load_compositor_configs_for_sensor("seviri")[0]
+            read_yaml.assert_not_called()
+            assert set(cached_comps.keys()) == set(comps.keys())
+            COMPOSITE_CONFIG_CACHE.clear()
+        load_compositor_configs_for_sensor.cache_clear()
+
+
 class TestColormapCompositor(unittest.TestCase):
     """Test the ColormapCompositor."""
 
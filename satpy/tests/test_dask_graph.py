@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the deduplication of the dask graphs of a Scene."""
+
+import dask
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+
+import satpy
+from satpy._dask_graph import merge_duplicate_tasks, name_by_content
+
+# NOTE:
+# The following fixtures are not defined in this file, but are used and injected by Pytest:
+# - include_test_etc
+# - tmp_path
+
+
+class _FakeCompositor:
+    def __init__(self, name, **attrs):
+        self.attrs = {"name": name, "_satpy_id": object(), **attrs}
+
+
+def _counting_arrays(calls):
+    def _count(block):
+        calls.append(block.shape)
+        return block
+
+    base = da.arange(100., chunks=25)
+    first = da.map_blocks(_count, base, name="count1", meta=np.array((), dtype=float)) + 1
+    second = da.map_blocks(_count, base, name="count2", meta=np.array((), dtype=float)) * 2
+    return first, second
+
+
+def test_name_by_content():
+    """Test that equivalent compositor outputs get the same dask name."""
+    arr = xr.DataArray(da.arange(10., chunks=5), dims=("x",))
+    input1 = xr.DataArray(da.zeros(10, chunks=5), dims=("x",))
+    input2 = xr.DataArray(da.ones(10, chunks=5), dims=("x",))
+
+    res1 = name_by_content(arr, _FakeCompositor("my-comp"), [input1], None, name="my-comp")
+    res2 = name_by_content(arr.copy(), _FakeCompositor("my-comp"), [input1], None, name="my-comp")
+    assert res1.data.name == res2.data.name
+    assert res1.data.name.startswith("my_comp-")
+    assert res1.data.name != arr.data.name
+    np.testing.assert_array_equal(res1.values, arr.values)
+
+    other_inputs = name_by_content(arr, _FakeCompositor("my-comp"), [input2], None, name="my-comp")
+    other_attrs = name_by_content(arr, _FakeCompositor("my-comp", factor=2), [input1], None, name="my-comp")
+    other_kwargs = name_by_content(arr, _FakeCompositor("my-comp"), [input1], None, name="my-comp",
+                                   resolution=1000)
+    input1_other_attrs = input1.copy()
+    input1_other_attrs.attrs["platform_name"] = "Meteosat-11"
+    other_input_attrs = name_by_content(arr, _FakeCompositor("my-comp"), [input1_other_attrs], None,
+                                        name="my-comp")
+    with satpy.config.set(sensor_angles_position_preference="nadir"):
+        other_config = name_by_content(arr, _FakeCompositor("my-comp"), [input1], None, name="my-comp")
+    names = {res1.data.name, other_inputs.data.name, other_attrs.data.name, other_kwargs.data.name,
+             other_input_attrs.data.name, other_config.data.name}
+    assert len(names) == 6
+
+    numpy_arr = xr.DataArray(np.arange(10.))
+    assert name_by_content(numpy_arr, _FakeCompositor("my-comp"), [input1], None) is numpy_arr
+
+
+def test_merge_duplicate_tasks():
+    """Test that tasks doing the same work under different keys are computed once."""
+    calls = []
+    first, second = _counting_arrays(calls)
+    dask.compute(first, second)
+    assert len(calls) == 8
+
+    calls.clear()
+    numpy_arr = np.zeros(3)
+    new_first, new_second, new_numpy = merge_duplicate_tasks([xr.DataArray(first), second, numpy_arr])
+    assert new_numpy is numpy_arr
+    assert isinstance(new_first, xr.DataArray)
+    assert new_first.data.name == first.name
+    assert new_second.name == second.name
+    res_first, res_second = dask.compute(new_first, new_second)
+    assert len(calls) == 4
+    np.testing.assert_array_equal(res_first, np.arange(100.) + 1)
+    np.testing.assert_array_equal(res_second, np.arange(100.) * 2)
+
+
+def test_merge_duplicate_outputs():
+    """Test that arrays which are duplicates of each other keep their keys."""
+    arr1 = da.from_array(np.arange(10.), chunks=5, name="arr1") + 1
+    arr2 = da.from_array(np.arange(10.), chunks=5, name="arr2") + 1
+    new_arr1, new_arr2 = merge_duplicate_tasks([arr1, arr2])
+    assert new_arr2.name == arr2.name
+    # the second array is an alias of the first one
+    merged_keys = set(new_arr1.__dask_graph__()) | set(new_arr2.__dask_graph__())
+    assert len(merged_keys) == 4 + 2
+    np.testing.assert_array_equal(new_arr2.compute(), np.arange(10.) + 1)
+    assert merge_duplicate_tasks([arr1])[0] is arr1
+
+
+@pytest.mark.usefixtures("include_test_etc")
+def test_scene_composites_named_by_content():
+    """Test that the same composite generated by different Scenes has the same dask name."""
+    from satpy import Scene
+
+    names = []
+    with satpy.config.set(merge_duplicate_tasks=True):
+        for _ in range(2):
+            scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+            scene.load(["comp4"])
+            names.append(scene["comp4"].data.name)
+    assert names[0] == names[1]
+    assert names[0].startswith("comp4-")
+
+    scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+    scene.load(["comp4"])
+    assert not scene["comp4"].data.name.startswith("comp4-")
+
+
+@pytest.mark.usefixtures("include_test_etc")
+def test_scene_merge_duplicate_tasks(tmp_path):
+    """Test the duplicate tasks merging of the Scene when computing and saving."""
+    from satpy import Scene
+
+    scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+    scene.load(["comp4", "comp10"])
+    expected = scene.compute()
+    with satpy.config.set(merge_duplicate_tasks=True):
+        computed = scene.compute()
+        scene.save_datasets(writer="geotiff", base_dir=str(tmp_path), filename="{name}.tif")
+        scene.save_dataset("comp4", writer="geotiff", base_dir=str(tmp_path), filename="single.tif")
+    for name in ("comp4", "comp10"):
+        np.testing.assert_array_equal(computed[name].values, expected[name].values)
+    assert (tmp_path / "comp4.tif").is_file()
+    assert (tmp_path / "comp10.tif").is_file()
+    assert (tmp_path / "single.tif").is_file()
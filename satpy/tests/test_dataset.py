@@ -422,6 +422,38 @@ def test_combine_dicts_different(test_mda):
     assert not result
 
 
+def test_combine_metadata_compare_array_keys():
+    """Test restricting the comparison of array contents to some keys."""
+    import satpy
+    from satpy.dataset.metadata import combine_metadata
+    attrs1 = {"scan_angles": np.arange(10.), "raw_metadata": {"a": np.arange(3)}, "coefs": np.ones(2)}
+    attrs2 = {"scan_angles": np.arange(10.), "raw_metadata": {"a": np.arange(3)}, "coefs": attrs1["coefs"]}
+    assert combine_metadata(attrs1, attrs2).keys() == {"scan_angles", "raw_metadata", "coefs"}
+    with satpy.config.set(metadata_compare_array_keys=["raw_metadata"]):
+        result = combine_metadata(attrs1, attrs2)
+    # identical arrays are always combined
+    assert result.keys() == {"raw_metadata", "coefs"}
+
+
+def test_combine_metadata_immutable_comparisons_cached():
+    """Test that comparisons of areas are cached."""
+    from unittest import mock
+
+    from pyresample.geometry import AreaDefinition
+
+    from satpy.dataset.metadata import _COMPARISON_CACHE, combine_metadata
+    area1 = AreaDefinition("test", "test", "test", "EPSG:4326", 10, 10, (-10, -10, 10, 10))
+    area2 = AreaDefinition("test", "test", "test", "EPSG:4326", 10, 10, (-10, -10, 10, 10))
+    area3 = AreaDefinition("test", "test", "test", "EPSG:4326", 20, 20, (-10, -10, 10, 10))
+    _COMPARISON_CACHE.clear()
+    with mock.patch.object(AreaDefinition, "__eq__", autospec=True, side_effect=AreaDefinition.__eq__) as area_eq:
+        for _ in range(3):
+            assert combine_metadata({"area": area1}, {"area": area2}) == {"area": area1}
+            assert combine_metadata({"area": area1}, {"area": area3}) == {}
+            assert combine_metadata({"area": area1}, {"area": area1}) == {"area": area1}
+    assert area_eq.call_count == 2
+
+
 def test_dataid():
     """Test the DataID object."""
     from satpy.dataset.dataid import DataID, ModifierTuple, ValueList, WavelengthRange
@@ -441,11 +473,12 @@ def test_dataid():
     # Check that defaults are applied correctly
     assert did["modifiers"] == ModifierTuple()
 
-    # Check that from_dict creates a distinct instance...
+    # Check that from_dict creates an equal instance...
     did2 = did.from_dict(dict(name="cheese_shops", resolution=None))
-    assert did is not did2
-    # ...But is equal
     assert did2 == did
+    # ...which is interned
+    assert did2 is did
+    assert did.from_dict(dict(name="cheese_shops", resolution=1000)) is not did
 
     # Check that the instance is immutable
     with pytest.raises(TypeError):
@@ -549,6 +582,37 @@ def test_dataid_pickle():
     assert did == pickle.loads(pickle.dumps(did))
 
 
+def test_dataid_interned():
+    """Test that equal DataIDs are the same instance."""
+    import pickle
+
+    from satpy.dataset.dataid import DataID
+    from satpy.dataset.dataid import default_id_keys_config as dikc
+
+    did = DataID(dikc, name="a", wavelength=(10, 11, 12), resolution=1000, calibration="radiance")
+    did2 = DataID(dikc.copy(), name="a", wavelength=[10, 11, 12], resolution=1000, calibration="radiance")
+    assert did2 is did
+    assert did._id_keys is did2._id_keys
+    assert pickle.loads(pickle.dumps(did)) is did
+    assert did._replace(resolution=500) is DataID(dikc, name="a", wavelength=(10, 11, 12), resolution=500,
+                                                  calibration="radiance")
+    # equal but different values are not merged
+    did3 = DataID(dikc, name="a", wavelength=(10, 11, 12), resolution=1000.0, calibration="radiance")
+    assert did3 == did
+    assert did3 is not did
+    assert isinstance(did3["resolution"], float)
+
+
+def test_dataid_unhashable_not_interned():
+    """Test that DataIDs with unhashable values can still be created."""
+    from satpy.dataset.dataid import DataID
+
+    did = DataID({"name": {"required": True}, "levels": None}, name="a", levels=[1, 2])
+    did2 = DataID({"name": {"required": True}, "levels": None}, name="a", levels=[1, 2])
+    assert did == did2
+    assert did is not did2
+
+
 def test_dataid_elements_picklable():
     """Test individual elements of DataID can be pickled.
 
@@ -18,6 +18,8 @@
 import os
 import unittest
 
+import pytest
+
 from satpy.dependency_tree import DependencyTree
 from satpy.tests.utils import make_cid, make_dataid
 
@@ -147,6 +149,146 @@ class TestMultipleResolutionSameChannelDependency(unittest.TestCase):
             assert key.get("resolution", 1000) == 1000
 
 
+class TestResolvedTreeCache(unittest.TestCase):
+    """Test reusing resolved dependency trees between trees."""
+
+    def setUp(self):
+        """Create a reader and compositor configuration."""
+        import satpy
+        from satpy import DataQuery
+        from satpy._config import PACKAGE_CONFIG_PATH
+        from satpy.composites import GenericCompositor
+        from satpy.composites.config_loader import _CompositorDict, _ModifierDict
+        from satpy.dependency_tree import _RESOLVED_TREES
+        from satpy.modifiers.geometry import SunZenithCorrector
+        from satpy.readers.yaml_reader import FileYAMLReader
+
+        _RESOLVED_TREES.clear()
+        self._config = satpy.config.set(cache_configs=True)
+        config_file = os.path.join(PACKAGE_CONFIG_PATH, "readers", "modis_l1b.yaml")
+        self.readers = {"modis_l1b": FileYAMLReader.from_config_files(config_file)}
+        overview = {"_satpy_id": make_dataid(name="overview"),
+                    "name": "overview",
+                    "optional_prerequisites": [],
+                    "prerequisites": [DataQuery(name="1", modifiers=("sunz_corrected",)),
+                                      DataQuery(name="31")],
+                    "standard_name": "overview"}
+        # configurations loaded from files are identified by the files they were loaded from
+        self.compositors = {"modis": _CompositorDict()}
+        self.compositors["modis"][make_dataid(name="overview")] = GenericCompositor(**overview)
+        self.compositors["modis"].config_stamp = ("modis.yaml",)
+        self.modifiers = {"modis": _ModifierDict(sunz_corrected=(SunZenithCorrector,
+                                                                 {"optional_prerequisites": ["solar_zenith_angle"],
+                                                                  "name": "sunz_corrected",
+                                                                  "prerequisites": []}))}
+        self.modifiers["modis"].config_stamp = ("modis.yaml",)
+
+    def tearDown(self):
+        """Clear the cache."""
+        from satpy.dependency_tree import _RESOLVED_TREES
+        self._config.__exit__(None, None, None)
+        _RESOLVED_TREES.clear()
+
+    def _populate_new_tree(self, keys, query=None):
+        dep_tree = DependencyTree(self.readers, self.compositors, self.modifiers)
+        dataset_keys = set(keys)
+        dep_tree.populate_with_keys(dataset_keys, query)
+        return dep_tree, dataset_keys
+
+    def test_reuse_resolved_tree(self):
+        """Test that a new tree with the same readers and configs reuses the resolution."""
+        from unittest import mock
+
+        from satpy import DataQuery
+
+        tree1, keys1 = self._populate_new_tree(["overview"], DataQuery(resolution=1000))
+        with mock.patch.object(DependencyTree, "_create_subtrees_for_keys") as create_subtrees:
+            tree2, keys2 = self._populate_new_tree(["overview"], DataQuery(resolution=1000))
+        create_subtrees.assert_not_called()
+        assert keys1 == keys2
+        assert tree1._all_nodes.keys() == tree2._all_nodes.keys()
+        assert str(tree1) == str(tree2)
+        for name, node in tree2._all_nodes.items():
+            assert node is not tree1._all_nodes[name]
+            assert tree2[name] is node
+        # nodes are shared between parents
+        overview2 = tree2[keys2.pop()]
+        leaves = {leaf.name: leaf for leaf in tree2.leaves()}
+        for child in overview2.children:
+            for leaf in child.leaves():
+                assert leaves[leaf.name] is leaf
+
+        # modifying the nodes of a tree doesn't change the cached version
+        tree2.update_node_name(overview2, make_dataid(name="overview", resolution=1000))
+        tree3, _ = self._populate_new_tree(["overview"], DataQuery(resolution=1000))
+        assert str(tree3) == str(tree1)
+
+    def test_not_cached_by_default(self):
+        """Test that resolved trees are only cached if ``cache_configs`` is set."""
+        import satpy
+        from satpy.dependency_tree import _RESOLVED_TREES
+
+        with satpy.config.set(cache_configs=False):
+            self._populate_new_tree(["overview"])
+        assert len(_RESOLVED_TREES) == 0
+
+    def test_unstamped_configs_not_cached(self):
+        """Test that trees using configurations not loaded from files are not cached."""
+        from satpy.dataset import DatasetDict
+        from satpy.dependency_tree import _RESOLVED_TREES
+
+        self.compositors = {"modis": DatasetDict(self.compositors["modis"])}
+        self._populate_new_tree(["overview"])
+        assert len(_RESOLVED_TREES) == 0
+
+    def test_other_configs_not_reused(self):
+        """Test that trees are not reused with configurations loaded from other files."""
+        from satpy.dependency_tree import _RESOLVED_TREES
+
+        self._populate_new_tree(["overview"])
+        self.compositors["modis"].config_stamp = ("modis.yaml", "changed")
+        self._populate_new_tree(["overview"])
+        assert len(_RESOLVED_TREES) == 2
+
+    def test_reader_signature_reused(self):
+        """Test that the dataset IDs of unchanged readers are not frozen again."""
+        from unittest import mock
+
+        from satpy.dependency_tree import _get_readers_signature
+
+        signature = _get_readers_signature(self.readers)
+        with mock.patch("satpy.dependency_tree.frozenset", create=True) as frozen:
+            assert _get_readers_signature(self.readers) is not None
+        frozen.assert_not_called()
+        reader = self.readers["modis_l1b"]
+        reader.all_ids[make_dataid(name="new")] = {}
+        new_signature = _get_readers_signature(self.readers)
+        assert new_signature != signature
+        assert make_dataid(name="new") in new_signature[0][2]
+
+    def test_different_query_not_reused(self):
+        """Test that trees resolved for a different query or keys are not reused."""
+        from satpy import DataQuery
+
+        tree1, _ = self._populate_new_tree(["overview"], DataQuery(resolution=1000))
+        tree2, _ = self._populate_new_tree(["overview"], DataQuery(resolution=500))
+        assert tree1._all_nodes.keys() != tree2._all_nodes.keys()
+        band1_resolutions = {key["resolution"] for key in tree2._all_nodes.keys() if key["name"] == "1"}
+        assert band1_resolutions == {500}
+
+    def test_missing_dependencies_cached(self):
+        """Test that unknown datasets are also reported when taken from the cache."""
+        from satpy.node import MissingDependencies
+
+        for _ in range(2):
+            dep_tree = DependencyTree(self.readers, self.compositors, self.modifiers)
+            dataset_keys = {"overview", "unknown"}
+            with pytest.raises(MissingDependencies):
+                dep_tree.populate_with_keys(dataset_keys)
+            assert len(dataset_keys) == 1
+            assert "overview" in dep_tree
+
+
 class TestMultipleSensors(unittest.TestCase):
     """Test cases where multiple sensors are available.
 
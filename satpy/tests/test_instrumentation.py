@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the instrumentation of the Scene processing stages."""
+
+import json
+
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+
+from satpy.instrumentation import describe_output, instrument, is_instrumented, record_stage
+
+# NOTE:
+# The following fixtures are not defined in this file, but are used and injected by Pytest:
+# - include_test_etc
+# - tmp_path
+
+
+def test_record_stage_outside_report():
+    """Test that nothing is recorded without an active report."""
+    assert not is_instrumented()
+    with record_stage("compositor", "test") as stage:
+        stage.set_output(da.zeros((10, 10)))
+    with instrument() as report:
+        assert is_instrumented()
+    assert not is_instrumented()
+    assert report.records == []
+
+
+def test_record_nested_stages():
+    """Test recording nested stages in nested reports."""
+    with instrument() as outer_report:
+        with record_stage("writer", "outer", compute=True):
+            with instrument() as inner_report:
+                with record_stage("compositor", "inner") as stage:
+                    stage.set_output(xr.DataArray(da.zeros((10, 20), chunks=5, dtype=np.float32)))
+    assert [record["name"] for record in outer_report.records] == ["inner", "outer"]
+    assert [record["name"] for record in inner_report.records] == ["inner"]
+    inner, outer = outer_report.records
+    assert inner["depth"] == 1
+    assert outer["depth"] == 0
+    assert outer["info"] == {"compute": True}
+    assert outer["duration"] >= inner["duration"]
+    assert inner["nbytes"] == 10 * 20 * 4
+    assert inner["dask_tasks"] == 8
+    assert "dask_tasks" not in outer
+    assert outer_report.summary() == {
+        "compositor": {"count": 1, "duration": inner["duration"]},
+        "writer": {"count": 1, "duration": outer["duration"]},
+    }
+
+
+def test_describe_output():
+    """Test describing nested outputs."""
+    arr1 = da.ones((10, 10), chunks=5, dtype=np.uint8)
+    arr2 = arr1 + 1
+    description = describe_output({"a": [xr.DataArray(arr1), arr2], "b": np.zeros(3, dtype=np.float64)})
+    # the graphs are merged
+    assert description == {"dask_tasks": 8, "graph_layers": 2, "nbytes": 100 + 100 + 24}
+    assert describe_output(None) == {}
+    unknown_size = arr1[arr1 > 0]
+    assert "nbytes" not in describe_output(unknown_size)
+
+
+def test_describe_output_counts_layers_once():
+    """Test that the tasks of the layers described before are not counted again."""
+    from unittest import mock
+
+    from dask.blockwise import Blockwise
+
+    arr1 = da.ones((10, 10), chunks=5, dtype=np.uint8)
+    arr2 = arr1 + 1
+    with instrument():
+        assert describe_output(arr1) == {"dask_tasks": 4, "graph_layers": 1, "nbytes": 100}
+        with mock.patch.object(Blockwise, "get_output_keys", autospec=True,
+                               side_effect=Blockwise.get_output_keys) as get_output_keys:
+            assert describe_output(arr2) == {"dask_tasks": 8, "graph_layers": 2, "nbytes": 100}
+        # only the new layer is counted
+        get_output_keys.assert_called_once()
+
+
+@pytest.mark.usefixtures("include_test_etc")
+def test_scene_stages(tmp_path):
+    """Test that the stages of a Scene processing are recorded and exported."""
+    from satpy import Scene
+
+    with instrument() as report:
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        scene.load(["comp4", "comp10"])
+        new_scene = scene.resample(scene.coarsest_area(), resampler="native")
+        new_scene.save_datasets(writer="geotiff", datasets=["comp4"], base_dir=str(tmp_path),
+                                filename="{name}.tif")
+
+    records = {(record["kind"], record["name"]): record for record in report.records}
+    assert ("reader", "fake1") in records
+    assert records[("dataset", "fake1")]["dask_tasks"] > 0
+    assert records[("dataset", "fake1")]["nbytes"] > 0
+    assert ("compositor", "comp4") in records
+    assert ("modifier", "mod1") in records
+    assert any(kind == "resampler" for kind, _ in records)
+    assert records[("writer", "geotiff")]["info"]["compute"] is True
+    assert ("writer", "compute") in records
+
+    report.save_json(tmp_path / "report.json")
+    with open(tmp_path / "report.json") as json_file:
+        content = json.load(json_file)
+    assert len(content["records"]) == len(report.records)
+    assert content["summary"]["compositor"]["count"] >= 2
+
+    report.save_chrome_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as json_file:
+        trace = json.load(json_file)
+    events = trace["traceEvents"]
+    assert len(events) == len(report.records)
+    assert {event["ph"] for event in events} == {"X"}
+    assert {event["cat"] for event in events} == {"reader", "dataset", "compositor", "modifier",
+                                                 "resampler", "writer"}
@@ -205,6 +205,8 @@ class TestNIRReflectance(unittest.TestCase):
 
     def setUp(self):
         """Set up the test case for the NIRReflectance compositor."""
+        from satpy.modifiers.spectral import _get_reflectance_calculator
+        _get_reflectance_calculator.cache_clear()
         self.get_lonlats = mock.MagicMock()
         self.lons, self.lats = 1, 2
         self.get_lonlats.return_value = (self.lons, self.lats)
@@ -371,10 +373,46 @@ class TestNIRReflectance(unittest.TestCase):
 
         assert comp.masking_limit is not None
 
+    @mock.patch("satpy.modifiers.spectral.sun_zenith_angle")
+    @mock.patch("satpy.modifiers.NIRReflectance.apply_modifier_info")
+    @mock.patch("satpy.modifiers.spectral.Calculator")
+    def test_calculator_reused(self, calculator, apply_modifier_info, sza):
+        """Test that calculators are created once per band and configuration."""
+        from satpy.modifiers.spectral import NIRReflectance
+        calculator.return_value = mock.MagicMock(
+            reflectance_from_tbs=self.refl_from_tbs)
+
+        info = {"modifiers": None}
+        NIRReflectance(name="test")([self.nir, self.ir_], optional_datasets=[self.sunz], **info)
+        NIRReflectance(name="test")([self.nir, self.ir_], optional_datasets=[self.sunz], **info)
+        assert calculator.call_count == 1
+        NIRReflectance(name="test", sunz_threshold=84.0)([self.nir, self.ir_], optional_datasets=[self.sunz], **info)
+        assert calculator.call_count == 2
+
+    @mock.patch("satpy.modifiers.spectral.Calculator")
+    def test_calculator_type_error_not_retried(self, calculator):
+        """Test that errors creating the calculator are raised, and unhashable metadata isn't cached."""
+        from satpy.modifiers.spectral import NIRReflectance
+        calculator.side_effect = TypeError("bad calculator arguments")
+        with pytest.raises(TypeError, match="bad calculator arguments"):
+            NIRReflectance(name="test")._init_reflectance_calculator(self.metadata)
+        assert calculator.call_count == 1
+
+        calculator.side_effect = None
+        metadata = dict(self.metadata, sensor=["seviri"])
+        NIRReflectance(name="test")._init_reflectance_calculator(metadata)
+        NIRReflectance(name="test")._init_reflectance_calculator(metadata)
+        assert calculator.call_count == 3
+
 
 class TestNIREmissivePartFromReflectance(unittest.TestCase):
     """Test the NIR Emissive part from reflectance compositor."""
 
+    def setUp(self):
+        """Clear the cached calculators."""
+        from satpy.modifiers.spectral import _get_reflectance_calculator
+        _get_reflectance_calculator.cache_clear()
+
     @mock.patch("satpy.modifiers.spectral.sun_zenith_angle")
     @mock.patch("satpy.modifiers.NIRReflectance.apply_modifier_info")
     @mock.patch("satpy.modifiers.spectral.Calculator")
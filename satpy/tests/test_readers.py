@@ -242,6 +242,55 @@ class TestDatasetDict(unittest.TestCase):
         assert (1.2, 1.7, 2.2, "µm") in wl_keys
         assert None in wl_keys
 
+    def test_indexed_lookups_match_unindexed(self):
+        """Test that the indexed lookups find the same keys as filtering all keys."""
+        from satpy.dataset import DataQuery
+        from satpy.dataset.data_dict import DataIDDict
+        d = DataIDDict(self.regular_dict)
+        queries = [
+            DataQuery(name="test4"),
+            DataQuery(name=["test4", "test5"]),
+            DataQuery(wavelength=1.55),
+            DataQuery(wavelength=[0.5, 1.9]),
+            DataQuery(wavelength=WavelengthRange(1, 1.5, 2)),
+            DataQuery(wavelength=0.5, resolution=[500, 1000]),
+            DataQuery(name="test5", modifiers=("mod2",)),
+            DataQuery(name="test5", modifiers="*"),
+            DataQuery(name="test4", calibration="radiance"),
+            DataQuery(name="test6", level=200),
+            DataQuery(name="nonexistent"),
+        ]
+        for query in queries:
+            assert d.filter_keys(query) == query.filter_dataids(self.regular_dict.keys())
+
+    def test_index_follows_modifications(self):
+        """Test that the indexes are kept up to date when the dictionary changes."""
+        from satpy.dataset import DataQuery
+        d = self.test_dict
+        assert d.get_key(1.55)["name"] == "test2"
+        del d[make_dataid(name="test2", wavelength=(1, 1.5, 2), resolution=1000)]
+        assert d.get_key(1.55)["name"] == "test3"
+        d[make_dataid(name="test7", wavelength=(1.5, 1.55, 1.6), resolution=1000)] = "7"
+        assert d[1.55] == "7"
+        d.pop(d.get_key("test7"))
+        assert d[1.55] == "3"
+        d.update({make_dataid(name="test8", wavelength=(1.5, 1.55, 1.6)): "8"})
+        assert d[DataQuery(wavelength=1.55)] == "8"
+        d.clear()
+        assert 1.55 not in d
+
+    def test_pickle_indexed(self):
+        """Test that an indexed DatasetDict can be pickled."""
+        import pickle
+
+        from satpy import DatasetDict
+        d = self.test_dict
+        assert d[1.55] == "2"
+        new_d = pickle.loads(pickle.dumps(d))
+        assert isinstance(new_d, DatasetDict)
+        assert new_d == d
+        assert new_d[1.55] == "2"
+
     def test_setitem(self):
         """Test setitem method of DatasetDict."""
         d = self.test_dict
@@ -677,6 +726,45 @@ class TestYAMLFiles:
         assert "viirs_l1b" in reader_names
         assert len(reader_names) == len(list(glob_config("readers/*.yaml")))
 
+    def test_available_readers_cached_configs(self, tmp_path):
+        """Test that reader configs are read from the persistent index when enabled."""
+        import satpy
+        from satpy import available_readers
+        from satpy.readers import configs_for_reader
+        from satpy.readers.yaml_reader import READER_CONFIG_CACHE, _merge_yaml_configs
+
+        with satpy.config.set(cache_configs=True, cache_dir=str(tmp_path)):
+            reader_infos = available_readers(as_dict=True)
+            assert (tmp_path / "config_index" / "readers.pkl").is_file()
+            with mock.patch("satpy.readers.yaml_reader._merge_yaml_configs",
+                            wraps=_merge_yaml_configs) as merge:
+                assert available_readers(as_dict=True) == reader_infos
+            # only configs failing to load (missing dependencies) are parsed again
+            assert merge.call_count == len(list(configs_for_reader())) - len(reader_infos)
+            READER_CONFIG_CACHE.clear()
+        assert not (tmp_path / "config_index" / "readers.pkl").exists()
+
+    def test_cached_config_invalidated(self, tmp_path):
+        """Test that a cached reader config is recompiled when the YAML file changes."""
+        import satpy
+        from satpy.readers import read_reader_config
+        from satpy.readers.yaml_reader import READER_CONFIG_CACHE
+
+        config_file = tmp_path / "fake.yaml"
+        config_file.write_text("reader:\n  name: fake\n")
+        with satpy.config.set(cache_configs=True, cache_dir=str(tmp_path)):
+            assert read_reader_config([str(config_file)])["name"] == "fake"
+            config_file.write_text("reader:\n  name: changed\n")
+            os.utime(config_file, ns=(0, 0))
+            assert read_reader_config([str(config_file)])["name"] == "changed"
+            READER_CONFIG_CACHE._entries = None
+            with mock.patch("satpy.readers.yaml_reader._merge_yaml_configs") as merge:
+                reader_info = read_reader_config([str(config_file)])
+            merge.assert_not_called()
+            assert reader_info["name"] == "changed"
+            assert reader_info["config_files"] == (str(config_file),)
+            READER_CONFIG_CACHE.clear()
+
 
 class TestGroupFiles(unittest.TestCase):
     """Test the 'group_files' utility function."""
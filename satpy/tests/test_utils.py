@@ -653,3 +653,31 @@ def test_find_in_ancillary():
 def test_datetime64_to_pydatetime(dt64, expected):
     """Test conversion from datetime64 to Python datetime."""
     assert datetime64_to_pydatetime(dt64) == expected
+
+
+@pytest.mark.parametrize("code", [
+    "import satpy",
+    "from satpy import config, DataQuery",
+    "from satpy.readers import find_files_and_readers",
+    "from satpy.writers import available_writers",
+])
+def test_lightweight_imports(code):
+    """Test that importing the discovery functions does not import the heavy dependencies."""
+    import subprocess  # nosec B404
+    import sys
+
+    heavy_modules = ("dask.array", "xarray", "pyresample", "trollimage")
+    check = f"{code}\nimport sys\nprint([mod for mod in {heavy_modules!r} if mod in sys.modules])"
+    output = subprocess.check_output([sys.executable, "-c", check])  # nosec B603
+    assert output.decode().split("\n")[-2] == "[]"
+
+
+def test_lazy_package_attributes():
+    """Test that the lazily imported package attributes are available."""
+    import satpy
+    from satpy.scene import Scene
+
+    assert satpy.Scene is Scene
+    assert "Scene" in dir(satpy)
+    with pytest.raises(AttributeError):
+        satpy.NotAnAttribute
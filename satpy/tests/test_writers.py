@@ -25,6 +25,7 @@ import shutil
 import warnings
 from unittest import mock
 
+import dask
 import dask.array as da
 import numpy as np
 import pytest
@@ -44,7 +45,7 @@ class TestWritersModule:
         with pytest.raises(ValueError, match="Need at least a 2D array to make an image."):
             to_image(p)
 
-    @mock.patch("satpy.writers.XRImage")
+    @mock.patch("trollimage.xrimage.XRImage")
     def test_to_image_2d(self, mock_geoimage):
         """Conversion to image."""
         from satpy.writers import to_image
@@ -59,7 +60,7 @@ class TestWritersModule:
             data, mock_geoimage.call_args[0][0].values)
         mock_geoimage.reset_mock()
 
-    @mock.patch("satpy.writers.XRImage")
+    @mock.patch("trollimage.xrimage.XRImage")
     def test_to_image_3d(self, mock_geoimage):
         """Conversion to image."""
         from satpy.writers import to_image
@@ -117,6 +118,40 @@ class TestEnhancer:
         with pytest.raises(ValueError, match="YAML file doesn't exist or string is not YAML dict:.*"):
             Enhancer(enhancement_config_file="is_not_a_valid_filename_?.yaml")
 
+    def test_shared_enhancement_configs(self):
+        """Test that enhancement configuration files are parsed once for all Enhancer instances."""
+        from satpy import writers
+        writers._ENHANCEMENT_SECTIONS.clear()
+        with mock.patch("satpy.writers._read_enhancement_section",
+                        wraps=writers._read_enhancement_section) as read_section:
+            first = writers.Enhancer()
+            second = writers.Enhancer()
+            first.add_sensor_enhancements("abi")
+            first.add_sensor_enhancements({"abi"})
+            second.add_sensor_enhancements("abi")
+        read_files = [call.args[0] for call in read_section.call_args_list]
+        assert len(read_files) == len(set(read_files)) == 2
+        assert second.enhancement_tree.find_match(name="C01", sensor="abi")["operations"] is \
+            first.enhancement_tree.find_match(name="C01", sensor="abi")["operations"]
+
+    def test_find_match_cached(self):
+        """Test that the matches of the decision tree are remembered until the tree changes."""
+        from satpy.writers import DecisionTree
+        tree = DecisionTree({"default": {"useful_key": 0}, "a1": {"a": 1, "useful_key": 1}}, ("a", "b"),
+                            multival_keys=["a"])
+        with mock.patch.object(tree, "_find_match", wraps=tree._find_match) as find_match:
+            def _num_searches():
+                return sum(call.args[0] is tree._tree for call in find_match.call_args_list)
+
+            assert tree.find_match(a=1, b=2)["useful_key"] == 1
+            assert tree.find_match(a=1, b=2, c=3)["useful_key"] == 1
+            assert _num_searches() == 1
+            assert tree.find_match(a={1, 5}, b=2)["useful_key"] == 1
+            assert _num_searches() == 2
+            tree.add_config_to_tree({"a1b2": {"a": 1, "b": 2, "useful_key": 2}})
+            assert tree.find_match(a=1, b=2)["useful_key"] == 2
+            assert _num_searches() == 3
+
 
 class _CustomImageWriter(ImageWriter):
     def __init__(self, **kwargs):
@@ -647,6 +682,56 @@ class TestComputeWriterResults:
         assert os.path.isfile(fname1)
         assert os.path.isfile(fname2)
 
+    def test_concurrent_files(self):
+        """Test writing several files concurrently."""
+        import satpy
+        from satpy.writers import compute_writer_results
+        fnames = [os.path.join(self.base_dir, f"concurrent{idx}.tif") for idx in range(3)]
+        results = [self.scn.save_datasets(filename=fname, datasets=["test"], writer="geotiff", compute=False)
+                   for fname in fnames]
+        with satpy.config.set({"writers.io_concurrency": 2}):
+            compute_writer_results(results)
+        for fname in fnames:
+            assert os.path.isfile(fname)
+
+    def test_concurrency_limit(self):
+        """Test that the number of files written at the same time is limited."""
+        import threading
+        import time
+
+        import satpy
+        from satpy.writers import compute_writer_results
+
+        class _Target:
+            active = set()
+            max_active = 0
+            counter_lock = threading.Lock()
+
+            def __init__(self):
+                self.closed = False
+                self.data = np.zeros((4, 4))
+
+            def __setitem__(self, key, item):
+                with self.counter_lock:
+                    _Target.active.add(id(self))
+                    _Target.max_active = max(_Target.max_active, len(_Target.active))
+                time.sleep(0.01)
+                self.data[key] = item
+                with self.counter_lock:
+                    _Target.active.discard(id(self))
+
+            def close(self):
+                self.closed = True
+
+        targets = [_Target() for _ in range(6)]
+        sources = [da.full((4, 4), idx, chunks=2) for idx in range(6)]
+        with satpy.config.set({"writers.io_concurrency": 2}), dask.config.set(scheduler="threads", num_workers=6):
+            compute_writer_results([(sources, targets)])
+        assert _Target.max_active <= 2
+        for idx, target in enumerate(targets):
+            assert target.closed
+            np.testing.assert_array_equal(target.data, idx)
+
 
 class TestBaseWriter:
     """Test the base writer class."""
@@ -836,6 +921,55 @@ class TestOverlays:
                                              pil_args, pil_kwargs, fun_args, fun_kwargs)
                 ContourWriterAGG.assert_called_with(coast_dir)
 
+    @pytest.mark.parametrize("fill_value", [0, None])
+    def test_add_overlay_cached(self, fill_value):
+        """Test that the rendered overlay layer is cached and blended onto the image."""
+        from PIL import Image
+        from pycoast import ContourWriterAGG
+
+        from satpy.writers import _OVERLAY_CACHE, add_overlay
+        _OVERLAY_CACHE.clear()
+        layer = np.zeros((5, 5, 4), dtype=np.uint8)
+        layer[1, 2] = (255, 0, 0, 255)
+        layer[3, 4] = (0, 0, 255, 51)
+        add_overlay_from_dict = ContourWriterAGG.return_value.add_overlay_from_dict
+        add_overlay_from_dict.side_effect = lambda *args: Image.fromarray(layer, "RGBA")
+
+        overlays = {"coasts": {"outline": "red"}, "cache": {}}
+        new_img = add_overlay(self.orig_rgb_img, self.area_def, "", overlays=overlays, fill_value=fill_value)
+        add_overlay(self.orig_rgb_img, self.area_def, "", overlays=overlays, fill_value=fill_value)
+        add_overlay_from_dict.assert_called_once_with({"coasts": {"outline": "red"}}, self.area_def)
+
+        exp_mode = "RGB" if fill_value == 0 else "RGBA"
+        assert new_img.mode == exp_mode
+        res = new_img.data.transpose("y", "x", "bands").values
+        orig_arr = self.orig_rgb_img.pil_array(fill_value=fill_value)[0].compute() / 255.
+        np.testing.assert_allclose(res[1, 2, :3], [1, 0, 0])
+        np.testing.assert_allclose(res[3, 4, :3], orig_arr[3, 4, :3] * 0.8 + [0, 0, 0.2])
+        np.testing.assert_allclose(res[0], orig_arr[0])
+
+        add_overlay(self.orig_rgb_img, self.area_def, "", overlays={"coasts": {"outline": "blue"}, "cache": {}},
+                    fill_value=fill_value)
+        assert add_overlay_from_dict.call_count == 2
+
+    def test_add_overlay_cache_size(self):
+        """Test that the number of overlay layers kept in memory can be configured."""
+        from PIL import Image
+        from pycoast import ContourWriterAGG
+
+        from satpy.writers import _OVERLAY_CACHE, add_overlay
+        _OVERLAY_CACHE.clear()
+        add_overlay_from_dict = ContourWriterAGG.return_value.add_overlay_from_dict
+        add_overlay_from_dict.side_effect = lambda *args: Image.new("RGBA", (5, 5))
+
+        for color in ("red", "blue", "red"):
+            overlays = {"coasts": {"outline": color}, "cache": {"max_layers": 1}}
+            add_overlay(self.orig_rgb_img, self.area_def, "", overlays=overlays, fill_value=0)
+        assert add_overlay_from_dict.call_count == 3
+        assert len(_OVERLAY_CACHE) == 1
+        add_overlay_from_dict.assert_called_with({"coasts": {"outline": "red"}}, self.area_def)
+        _OVERLAY_CACHE.clear()
+
     def test_add_overlay_basic_l(self):
         """Test basic add_overlay usage with L data."""
         from satpy.writers import add_overlay
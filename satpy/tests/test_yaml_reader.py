@@ -1529,3 +1529,20 @@ class TestGEOVariableSegmentYAMLReader:
         new_height = 140
         new_empty_segment = geswh(empty_segment, new_height, dim)
         assert new_empty_segment is empty_segment
+
+
+@pytest.mark.usefixtures("include_test_etc")
+def test_geo_segment_add_segment_files():
+    """Test adding segment files to a GEOSegmentYAMLReader."""
+    from satpy.readers import load_readers
+
+    reader = load_readers(filenames=["fake_segment1_1.txt", "fake_segment2_1.txt"], reader="fake_segmented",
+                          reader_kwargs={"mouth": "omegna"})["fake_segmented"]
+    new_ids = reader.add_segment_files(["fake_segment1_3.txt", "fake_segment1_1.txt", "unknown_file.txt"])
+    assert {ds_id["name"] for ds_id in new_ids} == {"ds1"}
+    assert [fh.filename_info["segment"] for fh in reader.file_handlers["fake_segment1"]] == [1, 3]
+    assert reader.file_handlers["fake_segment1"][1].kwargs == {"mouth": "omegna"}
+    assert reader.add_segment_files(["fake_segment1_3.txt"]) == set()
+
+    ds1 = reader.load(list(new_ids))["ds1"]
+    np.testing.assert_array_equal(ds1.values[:, 0], [1.] * 4 + [np.nan] * 4 + [3.] * 4)
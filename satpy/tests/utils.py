@@ -276,6 +276,33 @@ class FakeFileHandler(BaseFileHandler):
             yield is_avail, ds_info
 
 
+class FakeSegmentFileHandler(FakeFileHandler):
+    """Fake file handler for one segment of segmented geostationary data.
+
+    The data of each segment is filled with its segment number.
+
+    """
+
+    segment_shape = (4, 5)
+
+    def get_dataset(self, data_id: DataID, ds_info: dict):
+        """Get fake DataArray of the segment."""
+        res = super().get_dataset(data_id, ds_info)
+        segment = self.filename_info["segment"]
+        return DataArray(data=da.full(self.segment_shape, segment, dtype=np.float64),
+                         attrs=res.attrs,
+                         dims=res.dims)
+
+    def get_area_def(self, dsid):
+        """Get the area of the segment, segments being stacked from north to south."""
+        rows, cols = self.segment_shape
+        segment = self.filename_info["segment"]
+        return create_area_def("fake_segment", {"proj": "geos", "lon_0": 0.0, "h": 35785831.0},
+                               width=cols, height=rows,
+                               area_extent=(-5000., -rows * 1000. * segment,
+                                            5000., -rows * 1000. * (segment - 1)))
+
+
 class CustomScheduler(object):
     """Scheduler raising an exception if data are computed too many times."""
 
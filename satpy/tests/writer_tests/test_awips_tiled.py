@@ -157,6 +157,37 @@ def _get_test_lcc_data(dask_arr, area_def, extra_attrs=None):
     return update_resampled_coords(ds, ds, area_def)
 
 
+def _get_tile_info():
+    from satpy.writers.awips_tiled import TileInfo, XYFactors
+    return TileInfo((1, 1), (200, 100), (200, 100), 0, 0, "T01", 1, None, None,
+                    XYFactors(1., 0., -1., 0.), None, None)
+
+
+@pytest.mark.parametrize(
+    ("data", "fill_value", "check_categories", "expected"),
+    [
+        (np.full((10, 10), np.nan), None, True, True),
+        (np.pad(np.full((1, 1), 1.), ((9, 0), (9, 0)), constant_values=np.nan), None, True, False),
+        (np.full((10, 10), 255, dtype=np.uint8), 255, True, True),
+        (np.pad(np.full((1, 1), 1, dtype=np.uint8), ((9, 0), (0, 9)), constant_values=255), 255, True, False),
+        (np.full((10, 10), 255, dtype=np.uint8), 255, False, True),
+        (np.full((10, 10), 255, dtype=np.uint8), None, True, False),
+    ]
+)
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_is_empty_tile(data, fill_value, check_categories, expected, use_dask, monkeypatch):
+    """Test detecting empty tiles one block of data at a time."""
+    from satpy.writers import awips_tiled
+    monkeypatch.setattr(awips_tiled, "_EMPTY_CHECK_BLOCK_SIZE", 20)
+    if use_dask:
+        data = da.from_array(data, chunks=3)
+    data_arr = xr.DataArray(data, dims=("y", "x"))
+    if fill_value is not None:
+        data_arr.attrs["_FillValue"] = fill_value
+    dataset = xr.Dataset({"data": data_arr, "scalar": xr.DataArray(1.)})
+    assert awips_tiled._is_empty_tile(dataset, check_categories) is expected
+
+
 class TestAWIPSTiledWriter:
     """Test basic functionality of AWIPS Tiled writer."""
 
@@ -256,6 +287,63 @@ class TestAWIPSTiledWriter:
             stime = input_data_arr.attrs["start_time"]
             assert unmasked_ds.attrs["start_date_time"] == stime.strftime("%Y-%m-%dT%H:%M:%S")
 
+    @pytest.mark.parametrize("write_in_background", [False, True])
+    def test_numbered_tiles_batches(self, write_in_background, tmp_path):
+        """Test computing and writing numbered tiles in batches."""
+        from satpy.tests.utils import CustomScheduler
+        from satpy.writers.awips_tiled import AWIPSTiledWriter
+        data = _get_test_data()
+        # the first rows are empty
+        data[:100] = np.nan
+        area_def = _get_test_area()
+        input_data_arr = _get_test_lcc_data(data, area_def)
+        save_kwargs = dict(sector_id="TEST", source_name="TESTS", tile_count=(3, 3))
+        expected_files = AWIPSTiledWriter(base_dir=str(tmp_path / "all")).save_datasets(
+            [input_data_arr], **save_kwargs)
+
+        w = AWIPSTiledWriter(base_dir=str(tmp_path / "batches"))
+        # valid range + ceil(9 / 4) batches
+        with dask.config.set(scheduler=CustomScheduler(1 + 3)):
+            written = w.save_datasets([input_data_arr], tile_batch_size=4,
+                                      write_in_background=write_in_background,
+                                      **save_kwargs)
+        assert expected_files
+        all_files = sorted(glob(os.path.join(str(tmp_path / "batches"), "TESTS_AII*.nc")))
+        assert len(all_files) == 6
+        assert sorted(written) == all_files
+        for fn in all_files:
+            batch_ds = xr.open_dataset(fn, mask_and_scale=False)
+            all_ds = xr.open_dataset(tmp_path / "all" / os.path.basename(fn), mask_and_scale=False)
+            xr.testing.assert_identical(batch_ds.drop_attrs(), all_ds.drop_attrs())
+            assert batch_ds.attrs["tile_row_offset"] == all_ds.attrs["tile_row_offset"]
+
+    def test_render_cache(self):
+        """Test that the attributes shared by the tiles are rendered once."""
+        from unittest import mock
+
+        from satpy.writers.awips_tiled import AWIPSNetCDFTemplate, AWIPSTiledWriter
+        w = AWIPSTiledWriter()
+        template = AWIPSNetCDFTemplate(w.config["templates"]["polar"])
+        data_arr = _get_test_lcc_data(_get_test_data(), _get_test_area())
+        tile_arrs = [data_arr[:100], data_arr[100:]]
+        with mock.patch.object(template, "_render_attrs", wraps=template._render_attrs) as render_attrs:
+            first = template.render([tile_arrs[0]], _get_test_area(), _get_tile_info(),
+                                    "TEST", shared_attrs=tile_arrs[0].attrs)
+            num_renders = render_attrs.call_count
+            second = template.render([tile_arrs[1]], _get_test_area(), _get_tile_info(),
+                                     "TEST", shared_attrs=tile_arrs[1].attrs)
+        assert render_attrs.call_count == num_renders
+        assert first.attrs == second.attrs
+        assert first["data"].attrs == second["data"].attrs
+        # cached values are not shared between tiles
+        first["data"].attrs["new_attr"] = 1
+        assert "new_attr" not in second["data"].attrs
+
+        tile_arrs[1].attrs = dict(tile_arrs[1].attrs, units="K")
+        third = template.render([tile_arrs[1]], _get_test_area(), _get_tile_info(),
+                                "TEST", shared_attrs=tile_arrs[1].attrs)
+        assert third["data"].attrs["units"] == "kelvin"
+
     def test_basic_lettered_tiles(self, tmp_path):
         """Test creating a lettered grid."""
         from satpy.writers.awips_tiled import AWIPSTiledWriter
@@ -241,3 +241,81 @@ class TestGeoTIFFWriter:
         ds = xr.open_dataset(filename, engine="rasterio")
         assert ds["band_data"].dtype == dtype
         np.testing.assert_allclose(ds["band_data"], -273.15)
+
+    @pytest.mark.parametrize(
+        ("overviews_resampling", "expected_overview"),
+        [
+            ("nearest", [[11, 13, 15, 17, 19], [31, 33, 35, 37, 39], [41, 43, 45, 47, 49]]),
+            ("average", [[6, 8, 10, 12, 14], [26, 28, 30, 32, 34], [40, 42, 44, 46, 48]]),
+        ]
+    )
+    def test_cog_write(self, overviews_resampling, expected_overview, tmp_path):
+        """Test writing a Cloud Optimized GeoTIFF and its overviews in one pass."""
+        import rasterio
+        from trollimage.xrimage import XRImage
+
+        from satpy.writers.geotiff import GeoTIFFWriter
+        data_arr = _get_test_datasets_2d()[0][:5, :10]
+        data_arr.data = da.arange(50, chunks=5, dtype=np.uint8).reshape((5, 10))
+        data_arr.attrs["area"] = data_arr.attrs["area"][:5, :10]
+        w = GeoTIFFWriter(base_dir=tmp_path, enhance=False)
+        filename = tmp_path / "test.tif"
+        w.save_image(XRImage(data_arr), filename=str(filename), driver="COG", blocksize=16,
+                     overviews=[2], overviews_resampling=overviews_resampling)
+
+        assert [path.name for path in tmp_path.iterdir()] == ["test.tif"]
+        with rasterio.open(filename) as cog:
+            assert cog.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+            assert cog.tags(ns="IMAGE_STRUCTURE")["COMPRESSION"] == "DEFLATE"
+            assert cog.block_shapes[0] == (16, 16)
+            assert cog.overviews(1) == [2]
+            np.testing.assert_array_equal(cog.read(1), np.arange(50).reshape((5, 10)))
+        with rasterio.open(filename, overview_level=0) as overview:
+            np.testing.assert_array_equal(overview.read(1), expected_overview)
+
+    def test_cog_failed_write(self, tmp_path):
+        """Test that no COG file is created when computing the data fails."""
+        from trollimage.xrimage import XRImage
+
+        from satpy.writers.geotiff import GeoTIFFWriter
+
+        def _fail(block):
+            raise RuntimeError("Computation failed")
+
+        data_arr = _get_test_datasets_2d()[0].astype(np.uint8)
+        data_arr.data = data_arr.data.map_blocks(_fail, dtype=np.uint8)
+        w = GeoTIFFWriter(base_dir=tmp_path, enhance=False)
+        with pytest.raises(RuntimeError, match="Computation failed"):
+            w.save_image(XRImage(data_arr), filename=str(tmp_path / "test.tif"), driver="COG", blocksize=16)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cog_delayed_write(self, tmp_path):
+        """Test that the COG file is created when the delayed results are computed."""
+        import rasterio
+        from trollimage.xrimage import XRImage
+
+        from satpy.writers import compute_writer_results
+        from satpy.writers.geotiff import GeoTIFFWriter
+        data_arr = _get_test_datasets_3d()[0].astype(np.uint8)
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        res = w.save_image(XRImage(data_arr), filename=str(tmp_path / "test.tif"), compute=False,
+                           driver="COG", blocksize=64)
+        assert not (tmp_path / "test.tif").exists()
+        compute_writer_results([res])
+        assert [path.name for path in tmp_path.iterdir()] == ["test.tif"]
+        with rasterio.open(tmp_path / "test.tif") as cog:
+            assert cog.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+            # overviews are added until they fit in a block
+            assert cog.overviews(1) == [2, 4]
+            assert cog.count == 4
+
+    def test_cog_driver_options(self, tmp_path):
+        """Test that GDAL's COG driver is used for options it is the only one to handle."""
+        from satpy.writers.geotiff import GeoTIFFWriter
+        datasets = _get_test_datasets_2d()
+        w = GeoTIFFWriter(base_dir=tmp_path)
+        with mock.patch("satpy.writers.XRImage.save") as save_method:
+            save_method.return_value = None
+            w.save_datasets(datasets, compute=False, driver="COG", tiling_scheme="GoogleMapsCompatible")
+        assert save_method.call_args[1]["driver"] == "COG"
+        assert save_method.call_args[1]["tiling_scheme"] == "GoogleMapsCompatible"
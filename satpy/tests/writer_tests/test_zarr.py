@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the Zarr writer."""
+
+import datetime as dt
+from unittest import mock
+
+import dask.array as da
+import numpy as np
+import pytest
+import xarray as xr
+from pyresample.geometry import AreaDefinition
+
+from satpy import Scene
+from satpy.writers.zarr_writer import check_zarr_versions
+
+# NOTE:
+# The following fixtures are not defined in this file, but are used and injected by Pytest:
+# - tmp_path
+
+
+def _zarr_versions_supported():
+    try:
+        check_zarr_versions()
+    except ImportError:
+        return False
+    return True
+
+
+requires_zarr_support = pytest.mark.skipif(not _zarr_versions_supported(),
+                                           reason="zarr 3 needs a more recent xarray")
+
+
+@pytest.fixture
+def scene():
+    """Create a Scene with two datasets on the same area."""
+    area = AreaDefinition("test_area", "test area", "test_area",
+                          {"proj": "geos", "h": 35785831.0, "lon_0": 0.0, "a": 6378169.0, "b": 6356583.8},
+                          10, 8, (-5000., -4000., 5000., 4000.))
+    x, y = area.get_proj_vectors()
+    scn = Scene()
+    for idx, name in enumerate(["IR_108", "VIS006"]):
+        data = da.arange(80., chunks=40).reshape((8, 10)) + idx
+        scn[name] = xr.DataArray(
+            data.rechunk((3, 10)), dims=("y", "x"), coords={"y": y, "x": x},
+            attrs={"name": name, "area": area, "platform_name": "Meteosat-11", "sensor": "seviri",
+                   "start_time": dt.datetime(2020, 1, 1, 12), "end_time": dt.datetime(2020, 1, 1, 12, 15),
+                   "units": "K", "orbital_parameters": {"satellite_nominal_longitude": 0.0}})
+    return scn
+
+
+@requires_zarr_support
+def test_save_datasets(scene, tmp_path):
+    """Test saving a Scene to a Zarr store with its chunks and CF metadata."""
+    filename = tmp_path / "test.zarr"
+    scene.save_datasets(writer="zarr", filename=str(filename), include_lonlats=False)
+    ds = xr.open_zarr(filename)
+    assert set(ds.data_vars) == {"IR_108", "VIS006", "test_area"}
+    assert ds["IR_108"].encoding["chunks"] == (3, 10)
+    assert ds["IR_108"].attrs["grid_mapping"] == "test_area"
+    assert ds["IR_108"].attrs["orbital_parameters"] == '{"satellite_nominal_longitude": 0.0}'
+    np.testing.assert_array_equal(ds["VIS006"].values, scene["VIS006"].values)
+
+
+@requires_zarr_support
+def test_save_irregular_chunks(scene, tmp_path):
+    """Test that irregular dask chunks are made regular before writing."""
+    filename = tmp_path / "test.zarr"
+    scene["IR_108"] = scene["IR_108"].chunk({"y": (2, 4, 2)})
+    scene.save_datasets(writer="zarr", filename=str(filename), datasets=["IR_108"])
+    ds = xr.open_zarr(filename)
+    assert ds["IR_108"].encoding["chunks"] == (4, 10)
+    np.testing.assert_array_equal(ds["IR_108"].values, scene["IR_108"].values)
+
+
+def test_check_zarr_versions():
+    """Test that incompatible versions of zarr and xarray are refused with a clear error."""
+    with mock.patch("zarr.__version__", "3.1.0"), mock.patch("xarray.__version__", "2024.7.0"), \
+            pytest.raises(ImportError, match="needs xarray 2025.01.2"):
+        check_zarr_versions()
+    with mock.patch("zarr.__version__", "2.18.0"), mock.patch("xarray.__version__", "2024.7.0"):
+        check_zarr_versions()
+
+
+@requires_zarr_support
+def test_save_delayed_groups(scene, tmp_path):
+    """Test saving groups of datasets when the results are computed later."""
+    from satpy.writers import compute_writer_results
+
+    filename = tmp_path / "test.zarr"
+    res = scene.save_datasets(writer="zarr", filename=str(filename), compute=False,
+                              groups={"ir": ["IR_108"], "vis": ["VIS006"]}, header_attrs={"source": "test"})
+    compute_writer_results([res])
+    assert xr.open_zarr(filename).attrs["source"] == "test"
+    for group, name in (("ir", "IR_108"), ("vis", "VIS006")):
+        ds = xr.open_zarr(filename, group=group, consolidated=False)
+        np.testing.assert_array_equal(ds[name].values, scene[name].values)
@@ -28,17 +28,18 @@ import platform
 import warnings
 from contextlib import contextmanager
 from copy import deepcopy
-from typing import Literal, Mapping, Optional
+from typing import TYPE_CHECKING, Literal, Mapping, Optional
 from urllib.parse import urlparse
 
-import dask.utils
 import numpy as np
-import xarray as xr
 import yaml
 from yaml import BaseLoader, UnsafeLoader
 
 from satpy._compat import DTypeLike
 
+if TYPE_CHECKING:
+    import xarray as xr
+
 _is_logging_on = False
 TRACE_LEVEL = 5
 
@@ -581,6 +582,8 @@ def unify_chunks(*data_arrays: xr.DataArray) -> tuple[xr.DataArray, ...]:
     together.
 
     """
+    import xarray as xr
+
     if not hasattr(xr, "unify_chunks"):
         return data_arrays
     if not _all_dims_same_size(data_arrays):
@@ -655,6 +658,8 @@ def get_chunk_size_limit(dtype=float):
 
 def get_dask_chunk_size_in_bytes():
     """Get the dask configured chunk size in bytes."""
+    import dask.utils
+
     return dask.utils.parse_bytes(dask.config.get("array.chunk-size", "128MiB"))
 
 
@@ -750,6 +755,8 @@ def normalize_low_res_chunks(
         A tuple where each element is the chunk size for that axis/dimension.
 
     """
+    import dask.array
+
     if any(len(input_shape) != len(param) for param in (low_res_multipliers, chunks, previous_chunks)):
         raise ValueError("Input shape, low res multipliers, chunks, and previous chunks must all be the same size")
     high_res_shape = tuple(dim_size * lr_mult for dim_size, lr_mult in zip(input_shape, low_res_multipliers))
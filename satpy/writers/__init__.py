@@ -18,27 +18,48 @@
 For now, this includes enhancement configuration utilities.
 """
 
+import json
 import logging
 import os
+import threading
+import uuid
 import warnings
-from typing import Optional
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
-import dask.array as da
 import numpy as np
-import xarray as xr
 import yaml
-from trollimage.xrimage import XRImage
 from trollsift import parser
 from yaml import UnsafeLoader
 
+import satpy
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._config_cache import CompiledConfigCache, _get_file_stamps
 from satpy.aux_download import DataDownloadMixin
+from satpy.instrumentation import record_stage
 from satpy.plugin_base import Plugin
-from satpy.resample import get_area_def
 from satpy.utils import get_legacy_chunk_size, recursive_dict_update
 
+if TYPE_CHECKING:
+    from trollimage.xrimage import XRImage
+
 LOG = logging.getLogger(__name__)
-CHUNK_SIZE = get_legacy_chunk_size()
+
+ENHANCEMENT_CONFIG_CACHE = CompiledConfigCache("enhancements")
+# parsed enhancement configuration sections shared by all Enhancer instances
+_ENHANCEMENT_SECTIONS: dict = {}
+_ENHANCEMENT_SECTIONS_LOCK = threading.Lock()
+
+
+def __getattr__(name):
+    # dask, xarray and trollimage are only imported when needed (PEP 562)
+    if name == "XRImage":
+        from trollimage.xrimage import XRImage
+        return XRImage
+    if name == "CHUNK_SIZE":
+        return get_legacy_chunk_size()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def read_writer_config(config_files, loader=UnsafeLoader):
@@ -197,6 +218,18 @@ def add_overlay(orig_img, area, coast_dir, color=None, width=None, resolution=No
     | 'c' | Crude resolution        | 25  km  |
     +-----+-------------------------+---------+
 
+    If ``overlays`` has a ``cache`` entry, the overlays are rendered only once
+    to a transparent layer for a given area, image size and ``overlays``
+    dictionary and kept in memory for the next images. The layer is then
+    alpha blended onto the image chunk by chunk in the dask graph. If the
+    ``cache`` dictionary has a ``file`` item, the layer is also cached on disk
+    by pycoast (see :meth:`pycoast.cw_base.ContourWriterBase.add_overlay_from_dict`),
+    so other processes can reuse it. Like for pycoast's cache, font objects
+    are not considered when looking for the layer in the cache. The
+    ``max_layers`` item of the ``cache`` dictionary sets how many layers are
+    kept in memory (default 4). Every layer takes 4 bytes per pixel of the
+    image, about 470 MB for a full resolution full disk image.
+
     ``grid`` is a dictionary with key values as documented in detail in pycoast
 
     eg. overlay={'grid': {'major_lonlat': (10, 10),
@@ -220,6 +253,7 @@ def add_overlay(orig_img, area, coast_dir, color=None, width=None, resolution=No
 
     from pycoast import ContourWriterAGG
     if isinstance(area, str):
+        from satpy.resample import get_area_def
         area = get_area_def(area)
     LOG.info("Add coastlines and political borders to image.")
 
@@ -242,6 +276,9 @@ def add_overlay(orig_img, area, coast_dir, color=None, width=None, resolution=No
     if overlays is None:
         overlays = _create_overlays_dict(color, width, grid, level_coast, level_borders)
 
+    if "cache" in overlays:
+        return _blend_cached_overlay(orig_img, area, coast_dir, overlays, fill_value)
+
     cw_ = ContourWriterAGG(coast_dir)
     new_image = orig_img.apply_pil(_burn_overlay, res_mode,
                                    None, {"fill_value": fill_value},
@@ -249,6 +286,95 @@ def add_overlay(orig_img, area, coast_dir, color=None, width=None, resolution=No
     return new_image
 
 
+# rendered overlay layers, most recently used last
+_OVERLAY_CACHE: OrderedDict = OrderedDict()
+_DEFAULT_OVERLAY_CACHE_SIZE = 4
+_OVERLAY_CACHE_LOCK = threading.Lock()
+
+
+def _blend_cached_overlay(orig_img, area, coast_dir, overlays, fill_value):
+    """Alpha blend the cached overlay layer onto the image."""
+    import dask.array as da
+    import xarray as xr
+    from dask.base import tokenize
+    from trollimage.xrimage import XRImage
+
+    pil_ready_arr, mode = orig_img.pil_array(fill_value=fill_value)
+    pil_ready_arr = pil_ready_arr.rechunk({2: -1})
+    height, width = pil_ready_arr.shape[:2]
+    max_layers = overlays["cache"].get("max_layers", _DEFAULT_OVERLAY_CACHE_SIZE)
+    overlays = _get_pycoast_overlays(overlays)
+    cache_key = (hash(area), coast_dir, _overlays_cache_key(overlays), width, height)
+    layer = _get_overlay_layer(cache_key, area, coast_dir, overlays, max_layers)
+    layer = da.from_array(layer, chunks=pil_ready_arr.chunks[:2] + (4,),
+                          name="overlay-" + tokenize(cache_key))
+    new_img_data = da.map_blocks(_alpha_blend, pil_ready_arr, layer, orig_img.data.dtype,
+                                 dtype=orig_img.data.dtype,
+                                 chunks=pil_ready_arr.chunks[:2] + (len(mode),))
+    new_data = xr.DataArray(
+        new_img_data,
+        dims=["y", "x", "bands"],
+        coords={"y": orig_img.data.coords["y"], "x": orig_img.data.coords["x"], "bands": list(mode)},
+        attrs=orig_img.data.attrs,
+    )
+    return XRImage(new_data)
+
+
+def _get_pycoast_overlays(overlays):
+    """Get the overlays without the cache options pycoast doesn't know about."""
+    cache = {key: val for key, val in overlays["cache"].items() if key != "max_layers"}
+    return dict(overlays, cache=cache)
+
+
+def _overlays_cache_key(overlays):
+    # font objects can't be compared and are replaced by their type name
+    return json.dumps(overlays, sort_keys=True, default=lambda obj: type(obj).__name__)
+
+
+def _get_overlay_layer(cache_key, area, coast_dir, overlays, max_layers):
+    """Get the RGBA overlay layer from the cache or render it with pycoast."""
+    regenerate = overlays["cache"].get("regenerate", False)
+    with _OVERLAY_CACHE_LOCK:
+        if not regenerate and cache_key in _OVERLAY_CACHE:
+            _OVERLAY_CACHE.move_to_end(cache_key)
+            return _OVERLAY_CACHE[cache_key]
+
+    layer = _render_overlay_layer(area, coast_dir, overlays)
+    with _OVERLAY_CACHE_LOCK:
+        _OVERLAY_CACHE[cache_key] = layer
+        while len(_OVERLAY_CACHE) > max_layers:
+            _OVERLAY_CACHE.popitem(last=False)
+    return layer
+
+
+def _render_overlay_layer(area, coast_dir, overlays):
+    """Render the overlays to a transparent RGBA array."""
+    from pycoast import ContourWriterAGG
+
+    if "file" not in overlays["cache"]:
+        # only cached in memory, pycoast would need a file
+        overlays = {key: val for key, val in overlays.items() if key != "cache"}
+    LOG.debug("Rendering overlay layer for area %s", getattr(area, "area_id", area))
+    foreground = ContourWriterAGG(coast_dir).add_overlay_from_dict(overlays, area)
+    try:
+        layer = np.array(foreground.convert("RGBA"))
+    finally:
+        foreground.close()
+    layer.setflags(write=False)
+    return layer
+
+
+def _alpha_blend(img_block, layer_block, dtype):
+    """Blend a straight alpha RGBA layer over a block of a RGB(A) uint8 image."""
+    scale = dtype.type(255.0)
+    alpha = layer_block[..., 3:] / scale
+    new_block = img_block / scale
+    new_block[..., :3] = layer_block[..., :3] / scale * alpha + new_block[..., :3] * (1 - alpha)
+    if new_block.shape[-1] == 4:
+        new_block[..., 3:] = alpha + new_block[..., 3:] * (1 - alpha)
+    return new_block
+
+
 def _create_overlays_dict(color, width, grid, level_coast, level_borders):
     """Fill in the overlays dict."""
     overlays = dict()
@@ -275,6 +401,21 @@ def _create_overlays_dict(color, width, grid, level_coast, level_borders):
     return overlays
 
 
+def _pil_image_to_xrimage(img, orig):
+    import dask.array as da
+    import xarray as xr
+    from trollimage.xrimage import XRImage
+
+    arr = da.from_array(np.array(img) / 255.0, chunks=get_legacy_chunk_size())
+
+    new_data = xr.DataArray(arr, dims=["y", "x", "bands"],
+                            coords={"y": orig.data.coords["y"],
+                                    "x": orig.data.coords["x"],
+                                    "bands": list(img.mode)},
+                            attrs=orig.data.attrs)
+    return XRImage(new_data)
+
+
 def add_text(orig, dc, img, text):
     """Add text to an image using the pydecorate package.
 
@@ -286,14 +427,7 @@ def add_text(orig, dc, img, text):
 
     dc.add_text(**text)
 
-    arr = da.from_array(np.array(img) / 255.0, chunks=CHUNK_SIZE)
-
-    new_data = xr.DataArray(arr, dims=["y", "x", "bands"],
-                            coords={"y": orig.data.coords["y"],
-                                    "x": orig.data.coords["x"],
-                                    "bands": list(img.mode)},
-                            attrs=orig.data.attrs)
-    return XRImage(new_data)
+    return _pil_image_to_xrimage(img, orig)
 
 
 def add_logo(orig, dc, img, logo):
@@ -307,14 +441,7 @@ def add_logo(orig, dc, img, logo):
 
     dc.add_logo(**logo)
 
-    arr = da.from_array(np.array(img) / 255.0, chunks=CHUNK_SIZE)
-
-    new_data = xr.DataArray(arr, dims=["y", "x", "bands"],
-                            coords={"y": orig.data.coords["y"],
-                                    "x": orig.data.coords["x"],
-                                    "bands": list(img.mode)},
-                            attrs=orig.data.attrs)
-    return XRImage(new_data)
+    return _pil_image_to_xrimage(img, orig)
 
 
 def add_scale(orig, dc, img, scale):
@@ -328,14 +455,7 @@ def add_scale(orig, dc, img, scale):
 
     dc.add_scale(**scale)
 
-    arr = da.from_array(np.array(img) / 255.0, chunks=CHUNK_SIZE)
-
-    new_data = xr.DataArray(arr, dims=["y", "x", "bands"],
-                            coords={"y": orig.data.coords["y"],
-                                    "x": orig.data.coords["x"],
-                                    "bands": list(img.mode)},
-                            attrs=orig.data.attrs)
-    return XRImage(new_data)
+    return _pil_image_to_xrimage(img, orig)
 
 
 def add_decorate(orig, fill_value=None, **decorate):
@@ -475,6 +595,8 @@ def to_image(dataset):
         Instance of :class:`~trollimage.xrimage.XRImage`.
 
     """
+    from trollimage.xrimage import XRImage
+
     dataset = dataset.squeeze()
     if dataset.ndim < 2:
         raise ValueError("Need at least a 2D array to make an image.")
@@ -487,6 +609,7 @@ def split_results(results):
     Get sources, targets and delayed objects to separate lists from a list of
     results collected from (multiple) writer(s).
     """
+    import dask.array as da
     from dask.delayed import Delayed
 
     def flatten(results):
@@ -577,21 +700,35 @@ def group_results_by_output_file(sources, targets):
 def compute_writer_results(results):
     """Compute all the given dask graphs `results` so that the files are saved.
 
+    If the ``writers.io_concurrency`` option of the Satpy configuration is
+    set, the sources and targets are grouped by output file and up to that
+    many files are written at the same time. Each file is closed as soon as
+    all its chunks are stored. Otherwise the writes to all targets are
+    serialized and the targets are closed once everything is computed.
+
     Args:
         results (iterable): Iterable of dask graphs resulting from calls to
                             `scn.save_datasets(..., compute=False)`
     """
     if not results:
         return
+    import dask.array as da
 
     sources, targets, delayeds = split_results(results)
 
-    # one or more writers have targets that we need to close in the future
-    if targets:
+    io_concurrency = satpy.config.get("writers.io_concurrency", None)
+    if targets and io_concurrency:
+        delayeds.extend(_store_by_output_file(sources, targets, int(io_concurrency)))
+        # the targets are closed in the graph when their file is complete
+        targets = []
+    elif targets:
+        # one or more writers have targets that we need to close in the future
         delayeds.append(da.store(sources, targets, compute=False))
 
     if delayeds:
-        da.compute(delayeds)
+        with record_stage("writer", "compute") as stage:
+            stage.set_output(delayeds)
+            da.compute(delayeds)
 
     if targets:
         for target in targets:
@@ -886,7 +1023,7 @@ class ImageWriter(Writer):
 
     def save_image(
             self,
-            img: XRImage,
+            img: "XRImage",
             filename: Optional[str] = None,
             compute: bool = True,
             **kwargs
@@ -994,6 +1131,7 @@ class DecisionTree(object):
         self._match_keys = match_keys
         self._multival_keys = multival_keys or []
         self._tree = {}
+        self._match_cache = {}
         if not isinstance(decision_dicts, (list, tuple)):
             decision_dicts = [decision_dicts]
         self.add_config_to_tree(*decision_dicts)
@@ -1017,6 +1155,8 @@ class DecisionTree(object):
         See :meth:`DecisionTree.find_match` for more information.
 
         """
+        # new sections can change the result of any previous query
+        self._match_cache = {}
         for _section_name, sect_attrs in conf.items():
             # Set a path in the tree for each section in the config files
             curr_level = self._tree
@@ -1086,13 +1226,34 @@ class DecisionTree(object):
                 query_dict)
         return match
 
+    def _get_match_cache_key(self, query_dict):
+        """Get a hashable key of the values of ``query_dict`` used for matching, None if not possible."""
+        key = []
+        for match_key in self._match_keys:
+            query_val = query_dict.get(match_key, self.any_key)
+            if isinstance(query_val, set):
+                # sets are matched as sorted multiple values
+                query_val = (set, frozenset(query_val))
+            key.append(query_val)
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def find_match(self, **query_dict):
         """Find a match.
 
         Recursively search through the tree structure for a path that matches
-        the provided match parameters.
+        the provided match parameters. Matches are remembered for the values
+        of the match keys in the query until the tree is modified.
 
         """
+        cache_key = self._get_match_cache_key(query_dict)
+        match = self._match_cache.get(cache_key) if cache_key is not None else None
+        if match is not None:
+            return match
         try:
             match = self._find_match(self._tree, self._match_keys, query_dict)
         except (KeyError, IndexError, ValueError, TypeError):
@@ -1104,6 +1265,8 @@ class DecisionTree(object):
             # only possible if no default section was provided
             raise KeyError("No decision section found for %s" %
                            (query_dict.get("uid", None),))
+        if cache_key is not None:
+            self._match_cache[cache_key] = match
         return match
 
 
@@ -1130,18 +1293,12 @@ class EnhancementDecisionTree(DecisionTree):
         conf = {}
         for config_file in decision_dict:
             if os.path.isfile(config_file):
-                with open(config_file) as fd:
-                    enhancement_config = yaml.load(fd, Loader=UnsafeLoader)
-                    if enhancement_config is None:
-                        # empty file
-                        continue
-                    enhancement_section = enhancement_config.get(
-                        self.prefix, {})
-                    if not enhancement_section:
-                        LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
-                        continue
-                    LOG.debug(f"Adding enhancement configuration from file: {config_file}")
-                    conf = recursive_dict_update(conf, enhancement_section)
+                enhancement_section = _load_enhancement_section(config_file, self.prefix)
+                if not enhancement_section:
+                    LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
+                    continue
+                LOG.debug(f"Adding enhancement configuration from file: {config_file}")
+                conf = recursive_dict_update(conf, enhancement_section)
             elif isinstance(config_file, dict):
                 conf = recursive_dict_update(conf, config_file)
             else:
@@ -1164,6 +1321,38 @@ class EnhancementDecisionTree(DecisionTree):
                            (query_dict.get("uid", None),))
 
 
+def _load_enhancement_section(config_file, section):
+    """Get a section of an enhancement configuration file.
+
+    The parsed sections are shared by all the enhancement trees of the
+    process and only parsed again if the file is modified. They are also
+    stored in the persistent index of compiled configurations if the
+    ``cache_configs`` Satpy configuration option is set.
+
+    The returned dictionary must not be modified.
+    """
+    key = (os.path.abspath(config_file), section)
+    stamps = _get_file_stamps(key[:1])
+    with _ENHANCEMENT_SECTIONS_LOCK:
+        cached = _ENHANCEMENT_SECTIONS.get(key)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+    enhancement_section = ENHANCEMENT_CONFIG_CACHE.get(
+        key[:1], "UnsafeLoader:" + section, lambda: _read_enhancement_section(config_file, section))
+    with _ENHANCEMENT_SECTIONS_LOCK:
+        _ENHANCEMENT_SECTIONS[key] = (stamps, enhancement_section)
+    return enhancement_section
+
+
+def _read_enhancement_section(config_file, section):
+    with open(config_file) as fd:
+        enhancement_config = yaml.load(fd, Loader=UnsafeLoader)
+    if enhancement_config is None:
+        # empty file
+        return {}
+    return enhancement_config.get(section, {})
+
+
 class Enhancer(object):
     """Helper class to get enhancement information for images."""
 
@@ -1192,6 +1381,7 @@ class Enhancer(object):
             self.enhancement_tree = EnhancementDecisionTree(*self.enhancement_config_file)
 
         self.sensor_enhancement_configs = []
+        self._added_sensors = set()
 
     def get_sensor_enhancement_config(self, sensor):
         """Get the sensor-specific config."""
@@ -1210,6 +1400,12 @@ class Enhancer(object):
 
     def add_sensor_enhancements(self, sensor):
         """Add sensor-specific enhancements."""
+        # skip searching the configuration files again for the same sensors
+        sensor_key = (frozenset([sensor] if isinstance(sensor, str) else sensor),
+                      tuple(satpy.config.get("config_path")))
+        if sensor_key in self._added_sensors:
+            return
+        self._added_sensors.add(sensor_key)
         # XXX: Should we just load all enhancements from the base directory?
         new_configs = []
         for config_file in self.get_sensor_enhancement_config(sensor):
@@ -1227,8 +1423,109 @@ class Enhancer(object):
         backup_id = f"<name={info.get('name')}, calibration={info.get('calibration')}>"
         data_id = info.get("_satpy_id", backup_id)
         LOG.debug(f"Data for {data_id} will be enhanced with options:\n\t{enh_kwargs['operations']}")
-        for operation in enh_kwargs["operations"]:
-            fun = operation["method"]
-            args = operation.get("args", [])
-            kwargs = operation.get("kwargs", {})
-            fun(img, *args, **kwargs)
+        from satpy.enhancements._fused import apply_enhancement_operations
+        apply_enhancement_operations(img, enh_kwargs["operations"])
+
+
+def _store_by_output_file(sources, targets, io_concurrency):
+    """Get one delayed object per output file storing its sources and closing its targets."""
+    import dask
+    import dask.array as da
+
+    io_slots = _IOSlots(io_concurrency)
+    stores = []
+    for file_sources, file_targets in _group_by_target_file(sources, targets):
+        lock = _FileWriteLock(io_slots)
+        stored = da.store(file_sources, file_targets, lock=lock, compute=False)
+        stores.append(dask.delayed(_close_targets, pure=False)(stored, file_targets, lock))
+    return stores
+
+
+def _group_by_target_file(sources, targets):
+    """Group sources and targets by the file the targets write to.
+
+    Targets from trollimage share the ``rfile`` of their file, other targets
+    are considered to be files of their own.
+    """
+    groups = {}
+    for src, targ in zip(sources, targets):
+        rfile = getattr(targ, "rfile", None)
+        key = id(targ) if rfile is None else id(rfile)
+        file_sources, file_targets = groups.setdefault(key, ([], []))
+        file_sources.append(src)
+        file_targets.append(targ)
+    return list(groups.values())
+
+
+def _close_targets(stored, targets, lock):
+    """Close the targets of one file once all its chunks are stored."""
+    with lock:
+        for target in targets:
+            if hasattr(target, "close"):
+                target.close()
+    return stored
+
+
+class _IOSlots:
+    """Semaphore limiting the number of files written at the same time.
+
+    Like :class:`dask.utils.SerializableLock`, copies of this object
+    unpickled in the same process share the same semaphore.
+    """
+
+    _semaphores: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, size, token=None):
+        self.size = size
+        self.token = token or str(uuid.uuid4())
+        with self._registry_lock:
+            semaphore = self._semaphores.get(self.token)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(size)
+                self._semaphores[self.token] = semaphore
+        self.semaphore = semaphore
+
+    def __getstate__(self):
+        return self.size, self.token
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+class _FileWriteLock:
+    """Lock serializing the writes to one file and taking one of the shared I/O slots.
+
+    The lock of the file is always acquired first, so a thread holding an I/O
+    slot never waits for another lock.
+    """
+
+    def __init__(self, io_slots, file_lock=None):
+        from dask.utils import SerializableLock
+
+        self.io_slots = io_slots
+        self.file_lock = file_lock or SerializableLock()
+
+    def acquire(self, *args, **kwargs):
+        if not self.file_lock.acquire(*args, **kwargs):
+            return False
+        if not self.io_slots.semaphore.acquire(*args, **kwargs):
+            self.file_lock.release()
+            return False
+        return True
+
+    def release(self):
+        self.io_slots.semaphore.release()
+        self.file_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+    def __getstate__(self):
+        return self.io_slots, self.file_lock
+
+    def __setstate__(self, state):
+        self.__init__(*state)
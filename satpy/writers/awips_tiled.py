@@ -219,8 +219,11 @@ import logging
 import os
 import string
 import sys
+import threading
 import warnings
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import dask
 import dask.array as da
@@ -681,6 +684,42 @@ def _add_valid_ranges(data_arrs):
         yield data_arr
 
 
+_VALUE_HASHED_TYPES = (str, bytes, int, float, complex, np.generic, dt.date, dt.time, dt.timedelta, np.dtype)
+
+
+def _hashable_metadata(value):
+    """Convert metadata to a hashable value usable in a cache key.
+
+    Simple immutable values are compared by value. Other objects, like
+    arrays or area definitions, are identified by their ``id``, which is only
+    valid as long as the object is alive.
+
+    """
+    if isinstance(value, dict):
+        return ("dict",) + tuple((key, _hashable_metadata(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_hashable_metadata(val) for val in value)
+    if value is None or isinstance(value, _VALUE_HASHED_TYPES):
+        return value
+    return ("id", id(value))
+
+
+def _compute_valid_ranges(data_arrs):
+    """Compute the lazy valid ranges added by :func:`_add_valid_ranges` all at once.
+
+    Otherwise they would be computed again, from all the data, for every
+    batch of tiles.
+
+    """
+    lazy_arrs = [data_arr for data_arr in data_arrs
+                 if any(isinstance(val, da.Array) for val in data_arr.attrs.get("valid_range") or ())]
+    valid_ranges = dask.compute(*(data_arr.attrs["valid_range"] for data_arr in lazy_arrs))
+    for data_arr, valid_range in zip(lazy_arrs, valid_ranges):
+        # the attributes were copied by _add_valid_ranges
+        data_arr.attrs["valid_range"] = tuple(valid_range)
+    return data_arrs
+
+
 class AWIPSTiledVariableDecisionTree(DecisionTree):
     """Load AWIPS-specific metadata from YAML configuration."""
 
@@ -726,6 +765,8 @@ class NetCDFTemplate:
         self._filename_format_str = template_dict.get("filename")
         self._str_formatter = StringFormatter()
         self._template_dict = template_dict
+        # rendered attributes and encodings that don't change between tiles
+        self._render_cache = {}
 
     def get_filename(self, base_dir="", **kwargs):
         """Generate output NetCDF file from metadata."""
@@ -808,6 +849,22 @@ class NetCDFTemplate:
             LOG.debug("no routine matching %s", meth_name)
         return value
 
+    def _cached(self, kind, metadata, render_func, *key_items):
+        """Get the result of ``render_func()`` cached for the same ``kind`` and ``metadata``.
+
+        Tiles of the same data share all their metadata, only the data
+        differs. The metadata is kept in the cache so that the objects
+        identified by their ``id`` in the key stay alive.
+
+        """
+        key = (kind, _hashable_metadata(metadata)) + key_items
+        try:
+            return self._render_cache[key][1]
+        except KeyError:
+            result = render_func()
+            self._render_cache[key] = (metadata, result)
+            return result
+
     def _render_attrs(self, attr_configs, input_metadata, prefix="_"):
         attrs = {}
         for attr_name, attr_config_dict in attr_configs.items():
@@ -821,8 +878,9 @@ class NetCDFTemplate:
 
     def _render_global_attributes(self, input_metadata):
         attr_configs = self.global_attributes
-        return self._render_attrs(attr_configs, input_metadata,
-                                  prefix="_global_")
+        attrs = self._cached("global", input_metadata,
+                             lambda: self._render_attrs(attr_configs, input_metadata, prefix="_global_"))
+        return attrs.copy()
 
     def _render_variable_attributes(self, var_config, input_metadata):
         attr_configs = var_config["attributes"]
@@ -844,17 +902,23 @@ class NetCDFTemplate:
             new_encoding["_Unsigned"] = "true"
         return new_encoding
 
-    def _render_variable(self, data_arr):
+    def _render_variable_metadata(self, data_arr):
         var_config = self._var_tree.find_match(**data_arr.attrs)
         new_var_name = var_config.get("var_name", data_arr.attrs["name"])
+        var_encoding = self._render_variable_encoding(var_config, data_arr)
+        var_attrs = self._render_variable_attributes(var_config, data_arr.attrs)
+        return new_var_name, var_encoding, var_attrs
+
+    def _render_variable(self, data_arr):
+        new_var_name, var_encoding, var_attrs = self._cached(
+            "variable", data_arr.attrs, lambda: self._render_variable_metadata(data_arr),
+            data_arr.dtype, _hashable_metadata(data_arr.encoding))
         new_data_arr = data_arr.copy()
         # remove coords which may cause issues later on
         new_data_arr = new_data_arr.reset_coords(drop=True)
 
-        var_encoding = self._render_variable_encoding(var_config, data_arr)
-        new_data_arr.encoding = var_encoding
-        var_attrs = self._render_variable_attributes(var_config, data_arr.attrs)
-        new_data_arr.attrs = var_attrs
+        new_data_arr.encoding = var_encoding.copy()
+        new_data_arr.attrs = var_attrs.copy()
         return new_var_name, new_data_arr
 
     def _get_matchable_coordinate_metadata(self, coord_name, coord_attrs):
@@ -864,16 +928,22 @@ class NetCDFTemplate:
         match_kwargs.update(coord_attrs)
         return match_kwargs
 
+    def _render_coordinate_metadata(self, coord_name, coord_arr):
+        match_kwargs = self._get_matchable_coordinate_metadata(coord_name, coord_arr.attrs)
+        coord_config = self._coord_tree.find_match(**match_kwargs)
+        coord_attrs = self._render_coordinate_attributes(coord_config, coord_arr.attrs)
+        coord_encoding = self._render_variable_encoding(coord_config, coord_arr)
+        return coord_attrs, coord_encoding
+
     def _render_coordinates(self, ds):
         new_coords = {}
         for coord_name, coord_arr in ds.coords.items():
-            match_kwargs = self._get_matchable_coordinate_metadata(coord_name, coord_arr.attrs)
-            coord_config = self._coord_tree.find_match(**match_kwargs)
-            coord_attrs = self._render_coordinate_attributes(coord_config, coord_arr.attrs)
-            coord_encoding = self._render_variable_encoding(coord_config, coord_arr)
+            coord_attrs, coord_encoding = self._cached(
+                "coordinate", coord_arr.attrs, lambda: self._render_coordinate_metadata(coord_name, coord_arr),
+                coord_name, coord_arr.dtype, _hashable_metadata(coord_arr.encoding))
             new_coords[coord_name] = ds.coords[coord_name].copy()
-            new_coords[coord_name].attrs = coord_attrs
-            new_coords[coord_name].encoding = coord_encoding
+            new_coords[coord_name].attrs = coord_attrs.copy()
+            new_coords[coord_name].encoding = coord_encoding.copy()
         return new_coords
 
     def render(self, dataset_or_data_arrays, shared_attrs=None):
@@ -1045,9 +1115,10 @@ class AWIPSNetCDFTemplate(NetCDFTemplate):
 
     def apply_area_def(self, new_ds, area_def):
         """Apply information we can gather from the AreaDefinition."""
-        gmap_name, gmap_attrs, gmap_encoding = self._get_projection_attrs(area_def)
-        gmap_data_arr = xr.DataArray(0, attrs=gmap_attrs)
-        gmap_data_arr.encoding = gmap_encoding
+        gmap_name, gmap_attrs, gmap_encoding = self._cached(
+            "projection", area_def, lambda: self._get_projection_attrs(area_def))
+        gmap_data_arr = xr.DataArray(0, attrs=gmap_attrs.copy())
+        gmap_data_arr.encoding = gmap_encoding.copy()
         new_ds[gmap_name] = gmap_data_arr
         self._set_xy_coords_attrs(new_ds, area_def.crs)
         for data_arr in new_ds.data_vars.values():
@@ -1135,6 +1206,10 @@ class AWIPSNetCDFTemplate(NetCDFTemplate):
         return new_ds
 
 
+# number of elements checked at once for valid data in a tile
+_EMPTY_CHECK_BLOCK_SIZE = 2 ** 20
+
+
 def _notnull(data_arr, check_categories=True):
     is_int = np.issubdtype(data_arr.dtype, np.integer)
     fill_value = data_arr.encoding.get("_FillValue", data_arr.attrs.get("_FillValue"))
@@ -1147,10 +1222,36 @@ def _notnull(data_arr, check_categories=True):
 
 
 def _any_notnull(data_arr, check_categories):
-    not_null = _notnull(data_arr, check_categories)
-    if not_null is False:
+    """Check if any value is valid, one block of rows at a time.
+
+    Checking blocks avoids creating a mask of the size of the whole tile and
+    stops at the first block with valid data. Dask arrays are reduced chunk
+    by chunk.
+
+    """
+    is_int = np.issubdtype(data_arr.dtype, np.integer)
+    fill_value = data_arr.encoding.get("_FillValue", data_arr.attrs.get("_FillValue"))
+    if is_int and fill_value is not None and not check_categories:
+        # some DQF datasets are always valid
         return False
-    return not_null.any()
+    data = data_arr.data
+    if isinstance(data, da.Array):
+        return bool(dask.compute(_block_any_notnull(data, is_int, fill_value))[0])
+    if data.ndim == 0:
+        return bool(_block_any_notnull(data, is_int, fill_value))
+    rows_per_block = max(1, _EMPTY_CHECK_BLOCK_SIZE // max(1, data[0].size))
+    for start_row in range(0, data.shape[0], rows_per_block):
+        if _block_any_notnull(data[start_row:start_row + rows_per_block], is_int, fill_value):
+            return True
+    return False
+
+
+def _block_any_notnull(data, is_int, fill_value):
+    if is_int and fill_value is not None:
+        return (data != fill_value).any()
+    if np.issubdtype(data.dtype, np.inexact):
+        return (~np.isnan(data)).any()
+    return data.size > 0
 
 
 def _is_empty_tile(dataset_to_save, check_categories):
@@ -1248,6 +1349,21 @@ def to_nonempty_netcdf(dataset_to_save: xr.Dataset,
 
 delayed_to_notempty_netcdf = dask.delayed(to_nonempty_netcdf, pure=True)
 
+# the NetCDF library can't write several files at the same time
+_TILE_WRITE_LOCK = threading.Lock()
+
+
+def _write_tile(dataset_to_save, output_filename, mode):
+    with _TILE_WRITE_LOCK:
+        dataset_to_save.to_netcdf(output_filename, mode)
+    return output_filename
+
+
+def _batched(iterable, batch_size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
 
 def tile_filler(data_arr_data, tile_shape, tile_slices, fill_value):
     """Create an empty tile array and fill the proper locations with data."""
@@ -1439,9 +1555,11 @@ class AWIPSTiledWriter(Writer):
     def _iter_area_tile_info_and_datasets(self, area_datasets, template,
                                           lettered_grid, sector_id,
                                           num_subtiles, tile_size, tile_count,
-                                          use_sector_reference):
+                                          use_sector_reference, compute_valid_ranges=False):
         for area_def, data_arrays in area_datasets.values():
             data_arrays = list(_add_valid_ranges(data_arrays))
+            if compute_valid_ranges:
+                data_arrays = _compute_valid_ranges(data_arrays)
             tile_gen = self._get_tile_generator(
                 area_def, lettered_grid, sector_id, num_subtiles, tile_size,
                 tile_count, use_sector_reference=use_sector_reference)
@@ -1514,7 +1632,7 @@ class AWIPSTiledWriter(Writer):
                       use_end_time=False, use_sector_reference=False,
                       template="polar", check_categories=True,
                       extra_global_attrs=None, environment_prefix="DR",
-                      compute=True, **kwargs):
+                      compute=True, tile_batch_size=None, write_in_background=False, **kwargs):
         """Write a series of DataArray objects to multiple NetCDF4 Tile files.
 
         Args:
@@ -1589,6 +1707,27 @@ class AWIPSTiledWriter(Writer):
                 template generated values with the same global attribute name.
             compute (bool): Compute and write the output immediately using
                 dask. Default to ``False``.
+            tile_batch_size (int): Number of tiles to compute together when
+                ``compute`` is True. By default all tiles are computed at
+                once before any file is written, which needs enough memory to
+                hold all of them. With a batch size, the tiles are computed
+                one batch at a time and the files of a batch are written
+                while the next batch is computed, so at most two batches are
+                held in memory. The valid range of the data needed to scale
+                the tiles consistently is then computed once beforehand.
+            write_in_background (bool): Write the files of a batch in a
+                background thread while the next batch is computed, when
+                ``tile_batch_size`` is specified. The NetCDF library is not
+                thread-safe so only one file is written at a time, this only
+                overlaps the computation with the writing. By default
+                (``False``), the files of a batch are written before the
+                next batch is computed, which is safer if the input data is
+                read lazily from HDF5 or NetCDF files.
+
+        Returns:
+            If ``compute`` is False, the delayed objects writing the files.
+            Otherwise the computed results or, when ``tile_batch_size`` is
+            specified, the list of the written filenames.
 
         """
         if not isinstance(template, dict):
@@ -1598,9 +1737,10 @@ class AWIPSTiledWriter(Writer):
         datasets_to_save = []
         output_filenames = []
         creation_time = dt.datetime.now(dt.timezone.utc)
+        batched = compute and tile_batch_size is not None
         area_tile_data_gen = self._iter_area_tile_info_and_datasets(
             area_data_arrs, template, lettered_grid, sector_id, num_subtiles,
-            tile_size, tile_count, use_sector_reference)
+            tile_size, tile_count, use_sector_reference, compute_valid_ranges=batched)
         for area_def, tile_info, data_arrs in area_tile_data_gen:
             # TODO: Create Dataset object of all of the sliced-DataArrays (optional)
             ds_info = self._get_tile_data_info(data_arrs,
@@ -1611,7 +1751,6 @@ class AWIPSTiledWriter(Writer):
                                                 environment_prefix=environment_prefix,
                                                 **ds_info)
             self.check_tile_exists(output_filename)
-            # TODO: Provide attribute caching for things that likely won't change (functools lrucache)
             new_ds = template.render(data_arrs, area_def,
                                      tile_info, sector_id,
                                      creation_time=creation_time,
@@ -1631,6 +1770,8 @@ class AWIPSTiledWriter(Writer):
         delayed_gen = self._save_nonempty_mfdatasets(datasets_to_save, output_filenames,
                                                      check_categories=check_categories,
                                                      update_existing=True)
+        if batched:
+            return self._compute_and_write_batches(delayed_gen, tile_batch_size, write_in_background)
         delayeds = self._delay_netcdf_creation(delayed_gen)
 
         if not compute:
@@ -1656,6 +1797,30 @@ class AWIPSTiledWriter(Writer):
                 delayeds.append(delayed_result)
         return delayeds
 
+    @staticmethod
+    def _compute_and_write_batches(delayed_gen, batch_size, write_in_background=False):
+        """Compute the tiles in batches and write them, optionally while the next batch is computed."""
+        if not write_in_background:
+            written = []
+            for batch in _batched(delayed_gen, batch_size):
+                results = dask.compute(batch)[0]
+                written.extend(_write_tile(*result) for result in results if result[0] is not None)
+            return written
+
+        written = []
+        # files are written one at a time anyway, see _TILE_WRITE_LOCK
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = []
+            for batch in _batched(delayed_gen, batch_size):
+                results = dask.compute(batch)[0]
+                # don't hold more than two batches in memory
+                written.extend(future.result() for future in pending)
+                pending = [executor.submit(_write_tile, *result) for result in results
+                           if result[0] is not None]
+                del results
+            written.extend(future.result() for future in pending)
+        return written
+
     @staticmethod
     def _get_delayed_iter(use_distributed=False):
         if use_distributed:
@@ -19,8 +19,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
+import warnings
 from typing import Any, Optional, Union
 
+import dask.array as da
 import numpy as np
 
 # make sure we have rasterio even though we don't use it until trollimage
@@ -62,6 +66,19 @@ class GeoTIFFWriter(ImageWriter):
 
         >>> scn.save_datasets(writer='geotiff', tiled=False)
 
+    Cloud Optimized GeoTIFFs are created with ``driver="COG"``:
+
+        >>> scn.save_datasets(writer='geotiff', driver='COG')
+
+    In this mode the writer computes the full resolution image and its
+    overviews from the dask array in a single pass, writing whole blocks to a
+    temporary uncompressed file next to the output file. The final file is
+    then copied from it in the COG layout, compressing the blocks with
+    ``num_threads`` threads (all CPUs by default). Options only handled by
+    GDAL's own COG driver (``tiling_scheme``, ``target_srs``, etc.) or
+    overview resamplings other than ``nearest`` and ``average`` make the
+    writer fall back to that driver.
+
     For performance tips on creating geotiffs quickly and making them smaller
     see the :ref:`faq`.
 
@@ -231,7 +248,10 @@ class GeoTIFFWriter(ImageWriter):
             driver (Optional[str]): Name of GDAL driver to use to save the
                 geotiff. If not specified or None (default) the "GTiff" driver
                 is used. Another common option is "COG" for Cloud Optimized
-                GeoTIFF. See GDAL documentation for more information.
+                GeoTIFF, see the class documentation for how these files are
+                created. If ``overviews`` is not specified with "COG", the
+                overviews are added until the smallest one fits in a single
+                block. See GDAL documentation for more information.
             tiled (bool): For performance this defaults to ``True``.
                 Pass ``False`` to created striped TIFF files.
             include_scale_offset (deprecated, bool): Deprecated.
@@ -248,12 +268,7 @@ class GeoTIFFWriter(ImageWriter):
             # fall back to fill_value from configuration file
             fill_value = self.info.get("fill_value")
 
-        dtype = dtype if dtype is not None else self.dtype
-        if dtype is None and self.enhancer is not False:
-            dtype = np.uint8
-        elif dtype is None:
-            dtype = img.data.dtype.type
-
+        dtype = self._get_dtype(img, dtype)
         if "alpha" in kwargs:
             raise ValueError(
                 "Keyword 'alpha' is automatically set based on 'fill_value' "
@@ -275,6 +290,15 @@ class GeoTIFFWriter(ImageWriter):
             tags = {}
         tags.update(self.tags)
 
+        if driver == "COG" and _can_write_cog_in_one_pass(filename, gdal_options, overviews_resampling):
+            return _save_cog(img, filename, gdal_options, compute=compute,
+                             overviews=overviews, overviews_resampling=overviews_resampling,
+                             fill_value=fill_value, dtype=dtype,
+                             keep_palette=keep_palette, cmap=cmap,
+                             tags=tags, include_scale_offset_tags=include_scale_offset,
+                             scale_offset_tags=scale_offset_tags,
+                             colormap_tag=colormap_tag)
+
         return img.save(filename, fformat="tif", driver=driver,
                         fill_value=fill_value,
                         dtype=dtype, compute=compute,
@@ -288,6 +312,14 @@ class GeoTIFFWriter(ImageWriter):
                         tiled=tiled,
                         **gdal_options)
 
+    def _get_dtype(self, img, dtype):
+        dtype = dtype if dtype is not None else self.dtype
+        if dtype is None and self.enhancer is not False:
+            dtype = np.uint8
+        elif dtype is None:
+            dtype = img.data.dtype.type
+        return dtype
+
     def _get_gdal_options(self, kwargs):
         # Update global GDAL options with these specific ones
         gdal_options = self.gdal_options.copy()
@@ -295,3 +327,186 @@ class GeoTIFFWriter(ImageWriter):
             if k in self.GDAL_OPTIONS:
                 gdal_options[k] = kwargs[k]
         return gdal_options
+
+
+# options of GDAL's COG driver without equivalent when copying with the GTiff driver
+_COG_DRIVER_ONLY_OPTIONS = ("resampling", "overview_resampling", "warp_resampling",
+                            "overview_compress", "overview_quality", "overview_predictor",
+                            "tiling_scheme", "zoom_level_strategy", "target_srs", "res",
+                            "extent", "aligned_levels", "add_alpha")
+_COG_DEFAULT_BLOCKSIZE = 512
+
+
+def _can_write_cog_in_one_pass(filename, gdal_options, overviews_resampling):
+    """Check if a COG can be written without GDAL's COG driver."""
+    filename = str(filename)
+    if filename.startswith("/vsi") or "://" in filename:
+        # the temporary file needs a local directory
+        return False
+    if overviews_resampling not in (None, "nearest", "average"):
+        return False
+    return not any(option in gdal_options for option in _COG_DRIVER_ONLY_OPTIONS)
+
+
+def _get_cog_copy_options(gdal_options):
+    """Convert the COG driver options to options of the GTiff driver copying the file."""
+    options = gdal_options.copy()
+    blocksize = options.pop("blocksize", None) or _COG_DEFAULT_BLOCKSIZE
+    options.setdefault("blockxsize", blocksize)
+    options.setdefault("blockysize", blocksize)
+    # same default compression as GDAL's COG driver
+    options.setdefault("compress", "LZW")
+    if "level" in options:
+        level_option = "zstd_level" if options["compress"].upper() == "ZSTD" else "zlevel"
+        options.setdefault(level_option, options.pop("level"))
+    if "quality" in options:
+        options.setdefault("jpeg_quality", options.pop("quality"))
+    options.setdefault("num_threads", "ALL_CPUS")
+    options["tiled"] = True
+    return options
+
+
+def _save_cog(img, filename, gdal_options, compute=True, overviews=None,
+              overviews_resampling=None, **save_kwargs):
+    """Save a Cloud Optimized GeoTIFF computing its overviews along with the full resolution data.
+
+    The full resolution data is written to a temporary uncompressed tiled
+    file with chunks aligned to the blocks of the file, and the overviews are
+    computed from the same dask array into memory. When the file is closed
+    the overviews are written and the file is copied to ``filename`` in the
+    COG layout, compressing all blocks in parallel.
+
+    """
+    copy_options = _get_cog_copy_options(gdal_options)
+    block_shape = (copy_options["blockysize"], copy_options["blockxsize"])
+    tmp_fd, tmp_filename = tempfile.mkstemp(suffix=".tif", dir=os.path.dirname(os.path.abspath(filename)))
+    os.close(tmp_fd)
+    sources, targets = img.save(tmp_filename, fformat="tif", driver="GTiff", compute=False,
+                                tiled=True, blockxsize=block_shape[1], blockysize=block_shape[0],
+                                compress="NONE", bigtiff="IF_SAFER", **save_kwargs)
+    data = _align_chunks_to_blocks(sources[0], block_shape)
+    rio_dataset = targets[0]
+    factors = _get_cog_overview_factors(overviews, data.shape[1:], block_shape)
+    if factors:
+        # reserve the overviews in the file, they are filled when closing it
+        rio_dataset.rfile.build_overviews(factors)
+    nodata = rio_dataset.rfile.kwargs.get("nodata")
+    overview_arrs = [_compute_overview(data, factor, overviews_resampling, nodata) for factor in factors]
+    overview_buffers = [np.empty(arr.shape, dtype=arr.dtype) for arr in overview_arrs]
+
+    cog_target = _COGTarget(rio_dataset, tmp_filename, filename, overview_buffers, copy_options)
+    sources = [data] + overview_arrs + sources[1:]
+    targets = [cog_target] + overview_buffers + targets[1:]
+    if not compute:
+        return sources, targets
+    try:
+        da.store(sources, targets)
+    except Exception:
+        # don't leave a partially written COG at the final filename
+        cog_target.abort()
+        raise
+    for target in targets:
+        if hasattr(target, "close"):
+            target.close()
+    return filename
+
+
+def _align_chunks_to_blocks(data, block_shape):
+    """Rechunk the data so that every write to the file covers whole blocks."""
+    chunks = {0: data.chunks[0]}
+    for axis, block_size in zip((1, 2), block_shape):
+        chunk_size = data.chunks[axis][0]
+        chunks[axis] = max(block_size, round(chunk_size / block_size) * block_size)
+    return data.rechunk(chunks)
+
+
+def _get_cog_overview_factors(overviews, shape, block_shape):
+    """Get the overview factors, by default as GDAL's COG driver does."""
+    if overviews:
+        return list(overviews)
+    factors = []
+    factor = 1
+    while any(-(-size // factor) > block_size for size, block_size in zip(shape, block_shape)):
+        factor *= 2
+        factors.append(factor)
+    return factors
+
+
+def _compute_overview(data, factor, resampling, nodata):
+    if resampling == "average":
+        return _average_overview(data, factor, nodata)
+    return _nearest_overview(data, factor)
+
+
+def _nearest_overview(data, factor):
+    """Take the pixel at the center of every ``factor`` by ``factor`` box."""
+    y_idx, x_idx = (np.minimum(np.arange(-(-size // factor)) * factor + factor // 2, size - 1)
+                    for size in data.shape[1:])
+    return data[:, y_idx][:, :, x_idx]
+
+
+def _average_overview(data, factor, nodata):
+    """Average every ``factor`` by ``factor`` box, ignoring the nodata values."""
+    dtype = data.dtype
+    data = data.astype(np.float64)
+    if nodata is not None and not np.isnan(nodata):
+        data = da.where(data == nodata, np.nan, data)
+    pad_width = [(0, 0)] + [(0, -size % factor) for size in data.shape[1:]]
+    data = da.pad(data, pad_width, mode="constant", constant_values=np.nan)
+    data = data.rechunk({axis: -(-data.chunks[axis][0] // factor) * factor for axis in (1, 2)})
+    res = da.coarsen(_nanmean, data, {1: factor, 2: factor})
+    res = da.where(da.isnan(res), 0 if nodata is None else nodata, res)
+    if np.issubdtype(dtype, np.integer):
+        res = da.round(res)
+    return res.astype(dtype)
+
+
+def _nanmean(arr, axis=None):
+    with warnings.catch_warnings():
+        # boxes without any valid pixel
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(arr, axis=axis)
+
+
+class _COGTarget:
+    """Target of the full resolution data creating the COG file when closed."""
+
+    def __init__(self, rio_dataset, tmp_filename, filename, overview_buffers, copy_options):
+        self.rio_dataset = rio_dataset
+        self.tmp_filename = tmp_filename
+        self.filename = filename
+        self.overview_buffers = overview_buffers
+        self.copy_options = copy_options
+
+    def __setitem__(self, key, item):
+        """Write a chunk of the full resolution data to the temporary file."""
+        self.rio_dataset[key] = item
+
+    def close(self):
+        """Write the overviews and copy the temporary file to the final file in the COG layout."""
+        if self.tmp_filename is None:
+            return
+        from rasterio.shutil import copy as rio_copy
+        try:
+            self.rio_dataset.close()
+            for level, buffer in enumerate(self.overview_buffers):
+                with rasterio.open(self.tmp_filename, "r+", overview_level=level) as overview:
+                    overview.write(buffer)
+            rio_copy(self.tmp_filename, self.filename, driver="GTiff", copy_src_overviews=True,
+                     **self.copy_options)
+        finally:
+            self._remove_tmp_file()
+
+    def abort(self):
+        """Close and remove the temporary file without creating the COG file."""
+        if self.tmp_filename is None:
+            return
+        try:
+            self.rio_dataset.close()
+        finally:
+            self._remove_tmp_file()
+
+    def _remove_tmp_file(self):
+        os.remove(self.tmp_filename)
+        self.tmp_filename = None
+        self.overview_buffers = []
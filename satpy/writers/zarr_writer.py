@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Writer for CF encoded Zarr stores.
+
+The ``zarr`` writer saves the datasets of a Scene with the same CF encoding as
+the :mod:`cf writer <satpy.writers.cf_writer>`, but to a `Zarr`_ store
+instead of a netCDF file. Every dask chunk is written to its own Zarr chunk,
+so the chunks are computed and written in parallel without any lock. This
+makes the format well suited to store intermediate Scenes (calibrated or
+resampled data) to be used again by other processing chains:
+
+    >>> scn.save_datasets(writer='zarr', filename='seviri_resampled.zarr')
+
+The store can be read again with the ``satpy_cf_zarr`` reader, restoring the
+dataset names, areas and attributes without loading any data:
+
+    >>> scn = Scene(reader='satpy_cf_zarr', filenames=['seviri_resampled.zarr'])
+
+The keyword arguments of the :meth:`cf writer <satpy.writers.cf_writer.CFWriter.save_datasets>`
+controlling the CF encoding (``groups``, ``header_attrs``, ``flatten_attrs``,
+``exclude_attrs``, ``include_lonlats``, ...) are also accepted by this writer.
+The Zarr chunks are the dask chunks of the datasets, the data is rechunked
+first to regular chunks if needed. Other chunk sizes or compressors can be
+given with the ``encoding`` keyword argument as described in the
+`xarray encoding documentation`_ for Zarr.
+
+With zarr 3, xarray 2025.01.2 or later is needed. Older versions of xarray
+can't write variables without dask chunks with zarr 3, like the scalar grid
+mapping variables of the CF encoding.
+
+.. _Zarr: https://zarr.dev/
+.. _xarray encoding documentation:
+    https://docs.xarray.dev/en/stable/user-guide/io.html#zarr-encoding-specification
+
+"""
+import copy
+import logging
+
+from packaging.version import Version
+
+from satpy.writers import Writer
+
+logger = logging.getLogger(__name__)
+
+# encoding keys of the netCDF backends without meaning for zarr
+_NETCDF_ENCODING_KEYS = ("zlib", "complevel", "compression", "shuffle", "fletcher32", "contiguous",
+                         "szip_coding", "szip_pixels_per_block", "blosc_shuffle", "quantize_mode",
+                         "significant_digits", "least_significant_digit")
+
+
+class ZarrWriter(Writer):
+    """Writer producing CF encoded Zarr stores."""
+
+    def save_dataset(self, dataset, filename=None, fill_value=None, **kwargs):
+        """Save the *dataset* to a given *filename*."""
+        return self.save_datasets([dataset], filename, **kwargs)
+
+    def save_datasets(self, datasets, filename=None, groups=None, header_attrs=None, epoch=None,  # noqa: D417
+                      flatten_attrs=False, exclude_attrs=None, include_lonlats=True, pretty=False,
+                      include_orig_name=True, numeric_name_prefix="CHANNEL_", compute=True, **to_zarr_kwargs):
+        """Save the given datasets in one Zarr store.
+
+        Note that all datasets (if grouping: in one group) must have the same projection coordinates.
+
+        Args:
+            datasets (list): List of xr.DataArray to be saved.
+            filename (str): Output store.
+            groups (dict): Group datasets according to the given assignment:
+                `{'group_name': ['dataset1', 'dataset2', ...]}`.
+                The group name `None` corresponds to the root of the store, i.e., no group will be created.
+            header_attrs: Global attributes to be included.
+            epoch (str, optional): Reference time for encoding of time coordinates.
+                If None, the default reference time is defined using `from satpy.cf.coords import EPOCH`.
+            flatten_attrs (bool, optional): If True, flatten dict-type attributes.
+            exclude_attrs (list, optional): List of dataset attributes to be excluded.
+            include_lonlats (bool, optional): Always include latitude and longitude coordinates,
+                even for datasets with area definition.
+            pretty (bool, optional): Don't modify coordinate names, if possible.
+                Makes the store prettier, but possibly less consistent.
+            include_orig_name (bool, optional): Include the original dataset name as a variable
+                attribute in the store.
+            numeric_name_prefix (str, optional): Prefix to add to each variable with a name starting with a digit.
+                Use '' or None to leave this out.
+            compute (bool): Compute and write the data now (default). If ``False``, the metadata is
+                written and the returned delayed objects write the data when computed.
+            to_zarr_kwargs: Other keyword arguments passed to :meth:`xarray.Dataset.to_zarr`.
+
+        Returns:
+            List of the results of :meth:`xarray.Dataset.to_zarr`, one per group. These are
+            delayed objects if ``compute`` is ``False``.
+
+        """
+        from satpy.cf.datasets import collect_cf_datasets
+
+        check_zarr_versions()
+        logger.info("Saving datasets to Zarr/CF.")
+        filename = filename or self.get_filename(**datasets[0].attrs)
+        grouped_datasets, header_attrs = collect_cf_datasets(list_dataarrays=datasets,
+                                                             header_attrs=header_attrs,
+                                                             exclude_attrs=exclude_attrs,
+                                                             flatten_attrs=flatten_attrs,
+                                                             pretty=pretty,
+                                                             include_lonlats=include_lonlats,
+                                                             epoch=epoch,
+                                                             include_orig_name=include_orig_name,
+                                                             numeric_name_prefix=numeric_name_prefix,
+                                                             groups=groups,
+                                                             )
+        to_zarr_kwargs = _sanitize_writer_kwargs(to_zarr_kwargs)
+
+        mode = "w"
+        if groups is not None:
+            _initialize_root_zarr(filename, header_attrs, to_zarr_kwargs)
+            mode = "a"
+        written = []
+        for group_name, ds in grouped_datasets.items():
+            ds, encoding, other_to_zarr_kwargs = _prepare_zarr_dataset(ds, to_zarr_kwargs, numeric_name_prefix)
+            res = ds.to_zarr(filename, group=group_name, mode=mode, encoding=encoding,
+                             compute=compute, **other_to_zarr_kwargs)
+            written.append(res)
+        return written
+
+
+def check_zarr_versions():
+    """Check that the installed xarray can write CF encoded datasets with the installed zarr.
+
+    Raises:
+        ImportError: If zarr 3 is installed with an older xarray than
+            2025.01.2, which can't write variables without dask chunks like
+            the scalar grid mappings of the areas.
+
+    """
+    import xarray as xr
+    import zarr
+
+    if Version(zarr.__version__) >= Version("3") and Version(xr.__version__) < Version("2025.1.2"):
+        raise ImportError(f"Writing CF encoded zarr stores with zarr {zarr.__version__} needs xarray 2025.01.2 "
+                          f"or later, found xarray {xr.__version__}. Update xarray or install zarr<3.")
+
+
+def _sanitize_writer_kwargs(writer_kwargs):
+    """Remove satpy-specific kwargs."""
+    writer_kwargs = copy.deepcopy(writer_kwargs)
+    satpy_kwargs = ["overlay", "decorate", "config_files", "engine"]
+    for kwarg in satpy_kwargs:
+        writer_kwargs.pop(kwarg, None)
+    return writer_kwargs
+
+
+def _initialize_root_zarr(filename, header_attrs, to_zarr_kwargs):
+    """Initialize an empty root group with the global attributes."""
+    import xarray as xr
+
+    root = xr.Dataset({}, attrs=header_attrs)
+    init_kwargs = to_zarr_kwargs.copy()
+    init_kwargs.pop("encoding", None)
+    root.to_zarr(filename, mode="w", **init_kwargs)
+
+
+def _prepare_zarr_dataset(ds, to_zarr_kwargs, numeric_name_prefix):
+    """Get the dataset with regular chunks and its zarr encoding."""
+    from satpy.cf.encoding import update_encoding
+
+    encoding, other_to_zarr_kwargs = update_encoding(ds, to_engine_kwargs=to_zarr_kwargs,
+                                                     numeric_name_prefix=numeric_name_prefix)
+    for var_name, var_encoding in encoding.items():
+        if "chunksizes" in var_encoding:
+            var_encoding.setdefault("chunks", tuple(int(size) for size in var_encoding.pop("chunksizes")))
+        for key in _NETCDF_ENCODING_KEYS:
+            var_encoding.pop(key, None)
+        if var_encoding.get("chunks") and ds[var_name].chunks:
+            # every dask chunk must be written to a single zarr chunk
+            ds[var_name] = ds[var_name].chunk(dict(zip(ds[var_name].dims, var_encoding["chunks"])))
+    return ds, encoding, other_to_zarr_kwargs